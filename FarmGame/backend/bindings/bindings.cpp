@@ -318,11 +318,9 @@ PYBIND11_MODULE(farm_backend, m) {
         .def(py::init<const std::string&, const std::string&>())
         .def("add_animal", [](Farm& f, py::object animal) {
             // Перетворення Python об'єкта на C++ unique_ptr
-            if (py::isinstance<Cow>(animal)) {
-                auto& cow = animal.cast<Cow&>();
-                return f.addAnimal(cow.clone());
+            if (py::isinstance<Animal>(animal)) {
+                return f.addAnimal(animal.cast<Animal&>().clone());
             }
-            // Додати інші типи за потреби
             return false;
         })
         .def("remove_animal", &Farm::removeAnimal)
@@ -365,6 +363,21 @@ PYBIND11_MODULE(farm_backend, m) {
         .def("get_reputation", &Farm::getReputation)
         .def("update", &Farm::update)
         .def("save_to_file", &Farm::saveToFile)
+        .def_static("load_from_file", &Farm::loadFromFile)
+        .def("serialize", [](const Farm& f) {
+            // Серіалізація великої ферми не тримає GIL
+            std::string data;
+            {
+                py::gil_scoped_release release;
+                data = f.serialize();
+            }
+            return py::bytes(data);
+        })
+        .def_static("deserialize", [](const py::bytes& data) {
+            std::string raw = data;
+            py::gil_scoped_release release;
+            return Farm::deserialize(raw);
+        })
         .def("set_event_callback", &Farm::setEventCallback);
     
     // ==================== AnimalFactory ====================
@@ -17,6 +17,9 @@
 
 namespace FarmGame {
 
+class BinaryWriter;
+class BinaryReader;
+
 /**
  * @enum AnimalState
  * @brief Стан тварини
@@ -165,6 +168,20 @@ public:
      */
     virtual void pet();
     
+    // ==================== Серіалізація ====================
+    
+    /**
+     * @brief Записати стан тварини (тип пише власник - Farm)
+     * @param out Бінарний запис
+     */
+    virtual void writeBinary(BinaryWriter& out) const;
+    
+    /**
+     * @brief Відновити стан, записаний writeBinary
+     * @param in Бінарне читання
+     */
+    virtual void readBinary(BinaryReader& in);
+    
     // ==================== Звичайні методи (Інкапсуляція) ====================
     
     // Геттери
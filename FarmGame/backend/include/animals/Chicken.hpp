@@ -57,6 +57,10 @@ public:
     void update(double deltaTime) override;
     bool feed(double feedQuality, double amount) override;
     
+    // Серіалізація (базовий стан + стан породи)
+    void writeBinary(BinaryWriter& out) const override;
+    void readBinary(BinaryReader& in) override;
+    
 protected:
     void onFed(double quality, double amount) override;
     double calculateProductionBonus() const override;
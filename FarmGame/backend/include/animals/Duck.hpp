@@ -49,6 +49,10 @@ public:
     
     void update(double deltaTime) override;
     
+    // Серіалізація (базовий стан + стан породи)
+    void writeBinary(BinaryWriter& out) const override;
+    void readBinary(BinaryReader& in) override;
+    
 private:
     DuckBreed breed_;
     double featherQuality_;
@@ -56,6 +56,10 @@ public:
     void update(double deltaTime) override;
     bool feed(double feedQuality, double amount) override;
     
+    // Серіалізація (базовий стан + стан породи)
+    void writeBinary(BinaryWriter& out) const override;
+    void readBinary(BinaryReader& in) override;
+    
 private:
     HorseBreed breed_;
     double speed_;
@@ -51,6 +51,10 @@ public:
     
     void update(double deltaTime) override;
     
+    // Серіалізація (базовий стан + стан породи)
+    void writeBinary(BinaryWriter& out) const override;
+    void readBinary(BinaryReader& in) override;
+    
 private:
     RabbitBreed breed_;
     double furQuality_;
@@ -0,0 +1,137 @@
+/**
+ * @file BinaryIO.hpp
+ * @brief Запис і читання компактного бінарного формату збереження
+ *
+ * Числа пишуться у little-endian фіксованої ширини, рядки - довжиною (u32)
+ * і байтами UTF-8. Читач кидає std::runtime_error на обірваних даних.
+ */
+
+#ifndef BINARY_IO_HPP
+#define BINARY_IO_HPP
+
+#include <cstdint>
+#include <cstring>
+#include <stdexcept>
+#include <string>
+#include <type_traits>
+#include <utility>
+
+namespace FarmGame {
+
+/**
+ * @class BinaryWriter
+ * @brief Накопичує бінарні дані у рядку
+ */
+class BinaryWriter {
+public:
+    void writeU8(std::uint8_t value) { writeRaw(value); }
+    void writeU16(std::uint16_t value) { writeRaw(value); }
+    void writeU32(std::uint32_t value) { writeRaw(value); }
+    void writeI32(std::int32_t value) { writeRaw(value); }
+    void writeI64(std::int64_t value) { writeRaw(value); }
+    void writeDouble(double value) { writeRaw(value); }
+    void writeBool(bool value) { writeU8(value ? 1 : 0); }
+    
+    void writeString(const std::string& value) {
+        writeU32(static_cast<std::uint32_t>(value.size()));
+        data_.append(value);
+    }
+    
+    /**
+     * @brief Записати значення enum class як u8
+     */
+    template <typename Enum>
+    void writeEnum(Enum value) {
+        writeU8(static_cast<std::uint8_t>(value));
+    }
+    
+    void writeBytes(const char* bytes, std::size_t size) { data_.append(bytes, size); }
+    
+    void reserve(std::size_t size) { data_.reserve(size); }
+    const std::string& str() const { return data_; }
+    std::string release() { return std::move(data_); }
+    
+private:
+    std::string data_;
+    
+    template <typename T>
+    void writeRaw(T value) {
+        static_assert(std::is_trivially_copyable<T>::value, "Лише прості типи");
+        char bytes[sizeof(T)];
+        std::memcpy(bytes, &value, sizeof(T));
+#if defined(__BYTE_ORDER__) && __BYTE_ORDER__ == __ORDER_BIG_ENDIAN__
+        for (std::size_t i = 0; i < sizeof(T) / 2; ++i) {
+            std::swap(bytes[i], bytes[sizeof(T) - 1 - i]);
+        }
+#endif
+        data_.append(bytes, sizeof(T));
+    }
+};
+
+/**
+ * @class BinaryReader
+ * @brief Послідовне читання даних, записаних BinaryWriter
+ */
+class BinaryReader {
+public:
+    BinaryReader(const char* data, std::size_t size) : data_(data), size_(size), offset_(0) {}
+    explicit BinaryReader(const std::string& data) : BinaryReader(data.data(), data.size()) {}
+    
+    std::uint8_t readU8() { return readRaw<std::uint8_t>(); }
+    std::uint16_t readU16() { return readRaw<std::uint16_t>(); }
+    std::uint32_t readU32() { return readRaw<std::uint32_t>(); }
+    std::int32_t readI32() { return readRaw<std::int32_t>(); }
+    std::int64_t readI64() { return readRaw<std::int64_t>(); }
+    double readDouble() { return readRaw<double>(); }
+    bool readBool() { return readU8() != 0; }
+    
+    std::string readString() {
+        std::uint32_t length = readU32();
+        require(length);
+        std::string value(data_ + offset_, length);
+        offset_ += length;
+        return value;
+    }
+    
+    template <typename Enum>
+    Enum readEnum() {
+        return static_cast<Enum>(readU8());
+    }
+    
+    void readBytes(char* bytes, std::size_t size) {
+        require(size);
+        std::memcpy(bytes, data_ + offset_, size);
+        offset_ += size;
+    }
+    
+    std::size_t remaining() const { return size_ - offset_; }
+    
+private:
+    const char* data_;
+    std::size_t size_;
+    std::size_t offset_;
+    
+    void require(std::size_t size) const {
+        if (size > size_ - offset_) {
+            throw std::runtime_error("Обірвані дані збереження");
+        }
+    }
+    
+    template <typename T>
+    T readRaw() {
+        char bytes[sizeof(T)];
+        readBytes(bytes, sizeof(T));
+#if defined(__BYTE_ORDER__) && __BYTE_ORDER__ == __ORDER_BIG_ENDIAN__
+        for (std::size_t i = 0; i < sizeof(T) / 2; ++i) {
+            std::swap(bytes[i], bytes[sizeof(T) - 1 - i]);
+        }
+#endif
+        T value;
+        std::memcpy(&value, bytes, sizeof(T));
+        return value;
+    }
+};
+
+} // namespace FarmGame
+
+#endif // BINARY_IO_HPP
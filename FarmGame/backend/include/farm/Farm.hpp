@@ -281,7 +281,20 @@ public:
     
     // ==================== Серіалізація ====================
     
+    /**
+     * @brief Зберегти всю ферму в компактному бінарному форматі
+     * 
+     * Заголовок (magic + версія), стан ферми, фермер, будівлі, сховища
+     * і тварини разом зі станом породи
+     * @return Байти збереження
+     */
     std::string serialize() const;
+    
+    /**
+     * @brief Відновити ферму з даних serialize()
+     * @param data Байти збереження
+     * @return Ферма або nullptr, якщо дані пошкоджені чи новішої версії
+     */
     static std::unique_ptr<Farm> deserialize(const std::string& data);
     bool saveToFile(const std::string& filename) const;
     static std::unique_ptr<Farm> loadFromFile(const std::string& filename);
@@ -16,6 +16,9 @@
 
 namespace FarmGame {
 
+class BinaryWriter;
+class BinaryReader;
+
 /**
  * @enum FarmerSkill
  * @brief Навички фермера
@@ -189,6 +192,10 @@ public:
     std::string serialize() const;
     static std::unique_ptr<Farmer> deserialize(const std::string& data);
     
+    // Бінарна серіалізація (у складі Farm::serialize)
+    void writeBinary(BinaryWriter& out) const;
+    void readBinary(BinaryReader& in);
+    
 private:
     std::string name_;
     double money_;
@@ -12,6 +12,9 @@
 
 namespace FarmGame {
 
+class BinaryWriter;
+class BinaryReader;
+
 /**
  * @enum FeedType
  * @brief Типи кормів
@@ -79,6 +82,10 @@ public:
     // Фабричний метод
     static std::unique_ptr<Feed> create(FeedType type, double amount);
     
+    // Серіалізація (тип пише сховище)
+    void writeBinary(BinaryWriter& out) const;
+    void readBinary(BinaryReader& in);
+    
 protected:
     FeedType type_;
     double amount_;
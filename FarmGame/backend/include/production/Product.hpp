@@ -9,10 +9,14 @@
 #include <string>
 #include <memory>
 #include <ctime>
+#include <map>
 #include <vector>
 
 namespace FarmGame {
 
+class BinaryWriter;
+class BinaryReader;
+
 /**
  * @enum ProductType
  * @brief Типи продукції
@@ -129,6 +133,10 @@ public:
     bool canCombineWith(const Product& other) const;
     void combineWith(Product& other);
     
+    // Серіалізація (тип пише сховище)
+    void writeBinary(BinaryWriter& out) const;
+    void readBinary(BinaryReader& in);
+    
 protected:
     ProductType type_;
     double amount_;
@@ -15,6 +15,9 @@
 
 namespace FarmGame {
 
+class BinaryWriter;
+class BinaryReader;
+
 /**
  * @enum StorageType
  * @brief Типи сховищ
@@ -66,6 +69,10 @@ public:
     virtual void ageContents();      // Старіння вмісту на 1 день
     virtual void removeExpired();     // Видалити прострочене
     
+    // Серіалізація (тип сховища задає власник - Farm)
+    virtual void writeBinary(BinaryWriter& out) const;
+    virtual void readBinary(BinaryReader& in);
+    
     // Сеттери
     void setCapacity(double capacity) { capacity_ = capacity; }
     
@@ -98,6 +105,8 @@ public:
     // Перевизначення
     void ageContents() override;
     void removeExpired() override;
+    void writeBinary(BinaryWriter& out) const override;
+    void readBinary(BinaryReader& in) override;
     
     // Отримати всі корми
     std::map<FeedType, std::shared_ptr<Feed>>& getAllFeeds() { return feeds_; }
@@ -134,6 +143,8 @@ public:
     // Перевизначення
     void ageContents() override;
     void removeExpired() override;
+    void writeBinary(BinaryWriter& out) const override;
+    void readBinary(BinaryReader& in) override;
     
     // Отримати всі продукти
     std::vector<std::shared_ptr<Product>>& getAllProducts() { return products_; }
@@ -158,6 +169,8 @@ public:
     int getPreservationBonus() const { return preservationBonus_; }
     
     void ageContents() override;
+    void writeBinary(BinaryWriter& out) const override;
+    void readBinary(BinaryReader& in) override;
     
 private:
     double temperature_;
@@ -4,6 +4,7 @@
  */
 
 #include "animals/Animal.hpp"
+#include "farm/BinaryIO.hpp"
 #include <sstream>
 #include <algorithm>
 
@@ -212,4 +213,43 @@ void Animal::updateState() {
     }
 }
 
+// ==================== Серіалізація ====================
+
+void Animal::writeBinary(BinaryWriter& out) const {
+    out.writeI32(id_);
+    out.writeString(name_);
+    out.writeI32(age_);
+    out.writeDouble(health_);
+    out.writeDouble(hunger_);
+    out.writeDouble(happiness_);
+    out.writeEnum(state_);
+    out.writeBool(isAlive_);
+    out.writeI32(productionCooldown_);
+    out.writeI32(stats_.totalFed);
+    out.writeI32(stats_.totalProduced);
+    out.writeI32(stats_.daysOnFarm);
+    out.writeDouble(stats_.totalEarnings);
+    out.writeI64(static_cast<std::int64_t>(birthTime_));
+}
+
+void Animal::readBinary(BinaryReader& in) {
+    id_ = in.readI32();
+    name_ = in.readString();
+    age_ = in.readI32();
+    health_ = in.readDouble();
+    hunger_ = in.readDouble();
+    happiness_ = in.readDouble();
+    state_ = in.readEnum<AnimalState>();
+    isAlive_ = in.readBool();
+    productionCooldown_ = in.readI32();
+    stats_.totalFed = in.readI32();
+    stats_.totalProduced = in.readI32();
+    stats_.daysOnFarm = in.readI32();
+    stats_.totalEarnings = in.readDouble();
+    birthTime_ = static_cast<std::time_t>(in.readI64());
+    
+    // Нові тварини не повинні отримати id завантажених
+    nextId_ = std::max(nextId_, id_ + 1);
+}
+
 } // namespace FarmGame
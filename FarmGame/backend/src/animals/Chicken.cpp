@@ -4,6 +4,7 @@
  */
 
 #include "animals/Chicken.hpp"
+#include "farm/BinaryIO.hpp"
 #include <algorithm>
 #include <random>
 
@@ -189,4 +190,26 @@ void Chicken::collectChicks() {
     chicks_ = 0;  // Курчат забрано
 }
 
+void Chicken::writeBinary(BinaryWriter& out) const {
+    Animal::writeBinary(out);
+    out.writeEnum(breed_);
+    out.writeDouble(eggQuality_);
+    out.writeI32(eggsPerDay_);
+    out.writeBool(isBroody_);
+    out.writeI32(incubationDays_);
+    out.writeI32(chicks_);
+    out.writeI32(eggsCollected_);
+}
+
+void Chicken::readBinary(BinaryReader& in) {
+    Animal::readBinary(in);
+    breed_ = in.readEnum<ChickenBreed>();
+    eggQuality_ = in.readDouble();
+    eggsPerDay_ = in.readI32();
+    isBroody_ = in.readBool();
+    incubationDays_ = in.readI32();
+    chicks_ = in.readI32();
+    eggsCollected_ = in.readI32();
+}
+
 } // namespace FarmGame
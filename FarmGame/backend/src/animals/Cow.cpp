@@ -4,6 +4,7 @@
  */
 
 #include "animals/Cow.hpp"
+#include "farm/BinaryIO.hpp"
 #include <algorithm>
 #include <random>
 
@@ -196,4 +197,24 @@ bool Cow::canBreed() const {
            hunger_ > 50.0;
 }
 
+void Cow::writeBinary(BinaryWriter& out) const {
+    Animal::writeBinary(out);
+    out.writeEnum(breed_);
+    out.writeDouble(milkQuality_);
+    out.writeDouble(milkProduction_);
+    out.writeBool(isPregnant_);
+    out.writeI32(pregnancyDays_);
+    out.writeI32(lactationPeriod_);
+}
+
+void Cow::readBinary(BinaryReader& in) {
+    Animal::readBinary(in);
+    breed_ = in.readEnum<CowBreed>();
+    milkQuality_ = in.readDouble();
+    milkProduction_ = in.readDouble();
+    isPregnant_ = in.readBool();
+    pregnancyDays_ = in.readI32();
+    lactationPeriod_ = in.readI32();
+}
+
 } // namespace FarmGame
@@ -0,0 +1,148 @@
+/**
+ * @file Duck.cpp
+ * @brief Реалізація класу Duck
+ */
+
+#include "animals/Duck.hpp"
+#include "farm/BinaryIO.hpp"
+#include <algorithm>
+
+namespace FarmGame {
+
+Duck::Duck(const std::string& name, int age, DuckBreed breed)
+    : Animal(name, age)
+    , breed_(breed)
+    , featherQuality_(60.0)
+    , featherAmount_(0.0)
+    , hasSwimmedToday_(false)
+    , eggsLaid_(0)
+{
+    initializeBreedStats();
+}
+
+void Duck::initializeBreedStats() {
+    switch (breed_) {
+        case DuckBreed::PEKIN:
+            featherQuality_ = 70.0;
+            break;
+        case DuckBreed::KHAKI_CAMPBELL:
+            featherQuality_ = 55.0;  // Яєчна порода
+            break;
+        case DuckBreed::RUNNER:
+            featherQuality_ = 50.0;
+            break;
+        case DuckBreed::MUSCOVY:
+            featherQuality_ = 65.0;
+            break;
+        case DuckBreed::ROUEN:
+            featherQuality_ = 80.0;  // Декоративне пір'я
+            break;
+    }
+}
+
+std::string Duck::getBreedName() const {
+    switch (breed_) {
+        case DuckBreed::PEKIN: return "Пекінська";
+        case DuckBreed::KHAKI_CAMPBELL: return "Хакі-Кемпбел";
+        case DuckBreed::RUNNER: return "Бігунок";
+        case DuckBreed::MUSCOVY: return "Мускусна";
+        case DuckBreed::ROUEN: return "Руанська";
+        default: return "Невідома";
+    }
+}
+
+double Duck::produce() {
+    if (!canProduce()) return 0.0;
+
+    // Яєчні породи несуться частіше
+    double eggs = (breed_ == DuckBreed::KHAKI_CAMPBELL ? 1.5 : 1.0) * calculateProductionBonus();
+
+    // Після плавання качки несуться краще
+    if (hasSwimmedToday_) {
+        eggs *= 1.1;
+    }
+
+    productionCooldown_ = 24;
+    eggsLaid_++;
+    stats_.totalProduced++;
+    stats_.totalEarnings += eggs * getProductPrice();
+
+    return eggs;
+}
+
+double Duck::getProductPrice() const {
+    return 8.0;  // Ціна за качине яйце
+}
+
+double Duck::getBasePrice() const {
+    switch (breed_) {
+        case DuckBreed::PEKIN: return 250.0;
+        case DuckBreed::KHAKI_CAMPBELL: return 300.0;
+        case DuckBreed::RUNNER: return 220.0;
+        case DuckBreed::MUSCOVY: return 280.0;
+        case DuckBreed::ROUEN: return 350.0;
+    }
+    return 250.0;
+}
+
+std::unique_ptr<Animal> Duck::clone() const {
+    auto duck = std::make_unique<Duck>(name_, age_, breed_);
+    duck->health_ = health_;
+    duck->hunger_ = hunger_;
+    duck->happiness_ = happiness_;
+    duck->featherQuality_ = featherQuality_;
+    duck->featherAmount_ = featherAmount_;
+    return duck;
+}
+
+double Duck::collectFeathers() {
+    if (featherAmount_ < 1.0) return 0.0;
+
+    double feathers = featherAmount_ * (featherQuality_ / 100.0);
+    featherAmount_ = 0.0;
+    happiness_ = std::max(0.0, happiness_ - 5.0);
+    return feathers;
+}
+
+void Duck::swim() {
+    if (!isAlive_ || hasSwimmedToday_) return;
+
+    // Вода покращує здоров'я і настрій
+    hasSwimmedToday_ = true;
+    health_ = std::min(100.0, health_ + 3.0);
+    happiness_ = std::min(100.0, happiness_ + 8.0);
+}
+
+void Duck::update(double deltaTime) {
+    Animal::update(deltaTime);
+
+    if (!isAlive_) return;
+
+    // Пір'я поступово відростає
+    featherAmount_ = std::min(10.0, featherAmount_ + 0.02 * deltaTime);
+
+    // Без води качки сумують
+    if (!hasSwimmedToday_) {
+        happiness_ = std::max(0.0, happiness_ - 0.02 * deltaTime);
+    }
+}
+
+void Duck::writeBinary(BinaryWriter& out) const {
+    Animal::writeBinary(out);
+    out.writeEnum(breed_);
+    out.writeDouble(featherQuality_);
+    out.writeDouble(featherAmount_);
+    out.writeBool(hasSwimmedToday_);
+    out.writeI32(eggsLaid_);
+}
+
+void Duck::readBinary(BinaryReader& in) {
+    Animal::readBinary(in);
+    breed_ = in.readEnum<DuckBreed>();
+    featherQuality_ = in.readDouble();
+    featherAmount_ = in.readDouble();
+    hasSwimmedToday_ = in.readBool();
+    eggsLaid_ = in.readI32();
+}
+
+} // namespace FarmGame
@@ -0,0 +1,153 @@
+/**
+ * @file Goat.cpp
+ * @brief Реалізація класу Goat
+ */
+
+#include "animals/Goat.hpp"
+#include "farm/BinaryIO.hpp"
+#include <algorithm>
+
+namespace FarmGame {
+
+Goat::Goat(const std::string& name, int age, GoatBreed breed)
+    : Animal(name, age)
+    , breed_(breed)
+    , milkProduction_(3.0)
+    , mohairLength_(0.0)
+    , cheeseSkill_(10.0)
+{
+    initializeBreedStats();
+}
+
+void Goat::initializeBreedStats() {
+    switch (breed_) {
+        case GoatBreed::ALPINE:
+            milkProduction_ = 4.0;   // Багато молока
+            break;
+        case GoatBreed::NUBIAN:
+            milkProduction_ = 3.0;   // Менше, але жирніше
+            cheeseSkill_ = 20.0;
+            break;
+        case GoatBreed::SAANEN:
+            milkProduction_ = 4.5;   // Найпродуктивніша
+            break;
+        case GoatBreed::BOER:
+            milkProduction_ = 1.5;   // М'ясна порода
+            break;
+        case GoatBreed::ANGORA:
+            milkProduction_ = 1.0;   // Цінується за мохер
+            break;
+    }
+}
+
+std::string Goat::getBreedName() const {
+    switch (breed_) {
+        case GoatBreed::ALPINE: return "Альпійська";
+        case GoatBreed::NUBIAN: return "Нубійська";
+        case GoatBreed::SAANEN: return "Зааненська";
+        case GoatBreed::BOER: return "Бурська";
+        case GoatBreed::ANGORA: return "Ангорська";
+        default: return "Невідома";
+    }
+}
+
+double Goat::produce() {
+    if (!canProduce()) return 0.0;
+
+    // Ангорські кози дають мохер, решта - молоко
+    if (isAngoraType()) {
+        return collectMohair();
+    }
+
+    double milk = milkProduction_ * calculateProductionBonus();
+    productionCooldown_ = 12;  // Доїння двічі на день
+    stats_.totalProduced++;
+    stats_.totalEarnings += milk * getProductPrice();
+
+    return milk;
+}
+
+std::string Goat::getProductName() const {
+    return isAngoraType() ? "Мохер" : "Козяче молоко";
+}
+
+double Goat::getProductPrice() const {
+    if (isAngoraType()) {
+        return 120.0;  // Ціна за кг мохеру
+    }
+    // Жирне молоко нубійських кіз дорожче
+    return breed_ == GoatBreed::NUBIAN ? 40.0 : 30.0;
+}
+
+double Goat::getBasePrice() const {
+    switch (breed_) {
+        case GoatBreed::ALPINE: return 2500.0;
+        case GoatBreed::NUBIAN: return 2800.0;
+        case GoatBreed::SAANEN: return 3000.0;
+        case GoatBreed::BOER: return 2600.0;
+        case GoatBreed::ANGORA: return 3500.0;
+    }
+    return 2500.0;
+}
+
+std::unique_ptr<Animal> Goat::clone() const {
+    auto goat = std::make_unique<Goat>(name_, age_, breed_);
+    goat->health_ = health_;
+    goat->hunger_ = hunger_;
+    goat->happiness_ = happiness_;
+    goat->milkProduction_ = milkProduction_;
+    goat->mohairLength_ = mohairLength_;
+    goat->cheeseSkill_ = cheeseSkill_;
+    return goat;
+}
+
+double Goat::makeCheese(double milkAmount) {
+    if (milkAmount <= 0.0) return 0.0;
+
+    // З ~10 л молока виходить 1 кг сиру, навичка покращує вихід
+    double cheese = milkAmount * 0.1 * (1.0 + cheeseSkill_ / 100.0);
+    cheeseSkill_ = std::min(100.0, cheeseSkill_ + 0.5);
+    return cheese;
+}
+
+double Goat::collectMohair() {
+    if (!isAngoraType() || mohairLength_ < 5.0) return 0.0;
+
+    double mohair = mohairLength_ * 0.3 * calculateProductionBonus();
+    mohairLength_ = 0.0;
+    productionCooldown_ = 24 * 30;  // Мохер має відрости
+    stats_.totalProduced++;
+    stats_.totalEarnings += mohair * getProductPrice();
+
+    return mohair;
+}
+
+void Goat::update(double deltaTime) {
+    Animal::update(deltaTime);
+
+    if (!isAlive_) return;
+
+    // Ріст мохеру в ангорських кіз
+    if (isAngoraType()) {
+        double growthFactor = (health_ / 100.0) * (hunger_ / 100.0);
+        mohairLength_ = std::min(15.0, mohairLength_ + 0.06 * growthFactor * deltaTime);
+    }
+}
+
+void Goat::writeBinary(BinaryWriter& out) const {
+    Animal::writeBinary(out);
+    out.writeEnum(breed_);
+    out.writeDouble(milkProduction_);
+    out.writeDouble(mohairLength_);
+    out.writeDouble(cheeseSkill_);
+}
+
+void Goat::readBinary(BinaryReader& in) {
+    Animal::readBinary(in);
+    breed_ = in.readEnum<GoatBreed>();
+    milkProduction_ = in.readDouble();
+    mohairLength_ = in.readDouble();
+    cheeseSkill_ = in.readDouble();
+}
+
+} // namespace FarmGame
@@ -0,0 +1,221 @@
+/**
+ * @file Horse.cpp
+ * @brief Реалізація класу Horse
+ */
+
+#include "animals/Horse.hpp"
+#include "farm/BinaryIO.hpp"
+#include <algorithm>
+#include <random>
+
+namespace FarmGame {
+
+Horse::Horse(const std::string& name, int age, HorseBreed breed)
+    : Animal(name, age)
+    , breed_(breed)
+    , speed_(50.0)
+    , stamina_(100.0)
+    , strength_(50.0)
+    , trainingLevel_(0.0)
+    , fatigue_(0.0)
+    , racesWon_(0)
+    , totalRaces_(0)
+{
+    initializeBreedStats();
+}
+
+void Horse::initializeBreedStats() {
+    switch (breed_) {
+        case HorseBreed::ARABIAN:
+            speed_ = 80.0;      // Швидка
+            strength_ = 45.0;
+            break;
+        case HorseBreed::THOROUGHBRED:
+            speed_ = 90.0;      // Створена для перегонів
+            strength_ = 50.0;
+            break;
+        case HorseBreed::QUARTER:
+            speed_ = 65.0;
+            strength_ = 65.0;   // Робоча
+            break;
+        case HorseBreed::CLYDESDALE:
+            speed_ = 40.0;
+            strength_ = 95.0;   // Важковоз
+            break;
+        case HorseBreed::APPALOOSA:
+            speed_ = 60.0;
+            strength_ = 60.0;
+            break;
+    }
+}
+
+std::string Horse::getBreedName() const {
+    switch (breed_) {
+        case HorseBreed::ARABIAN: return "Арабська";
+        case HorseBreed::THOROUGHBRED: return "Чистокровна";
+        case HorseBreed::QUARTER: return "Квотерхорс";
+        case HorseBreed::CLYDESDALE: return "Клайдсдейл";
+        case HorseBreed::APPALOOSA: return "Аппалуза";
+        default: return "Невідома";
+    }
+}
+
+double Horse::produce() {
+    if (!canProduce()) return 0.0;
+
+    // Продукція коня - години роботи на полі
+    return work(4.0);
+}
+
+double Horse::getProductPrice() const {
+    // Ціна години роботи залежить від сили
+    return 50.0 + strength_;
+}
+
+double Horse::getBasePrice() const {
+    double basePrice = 25000.0;
+
+    switch (breed_) {
+        case HorseBreed::ARABIAN:
+            basePrice = 40000.0;
+            break;
+        case HorseBreed::THOROUGHBRED:
+            basePrice = 50000.0;
+            break;
+        case HorseBreed::QUARTER:
+            basePrice = 25000.0;
+            break;
+        case HorseBreed::CLYDESDALE:
+            basePrice = 35000.0;
+            break;
+        case HorseBreed::APPALOOSA:
+            basePrice = 30000.0;
+            break;
+    }
+
+    // Натренований кінь коштує дорожче
+    basePrice *= 1.0 + trainingLevel_ / 200.0;
+
+    return basePrice;
+}
+
+std::unique_ptr<Animal> Horse::clone() const {
+    auto horse = std::make_unique<Horse>(name_, age_, breed_);
+    horse->health_ = health_;
+    horse->hunger_ = hunger_;
+    horse->happiness_ = happiness_;
+    horse->speed_ = speed_;
+    horse->stamina_ = stamina_;
+    horse->strength_ = strength_;
+    horse->trainingLevel_ = trainingLevel_;
+    return horse;
+}
+
+void Horse::train() {
+    if (!isAlive_ || stamina_ < 20.0) return;
+
+    trainingLevel_ = std::min(100.0, trainingLevel_ + 2.0);
+    speed_ = std::min(100.0, speed_ + 0.3);
+    stamina_ -= 20.0;
+    fatigue_ = std::min(100.0, fatigue_ + 15.0);
+}
+
+void Horse::race() {
+    if (!isAlive_ || stamina_ < 50.0) return;
+
+    // Шанс перемоги залежить від швидкості, тренування і втоми
+    double winChance = (speed_ * 0.6 + trainingLevel_ * 0.4 - fatigue_ * 0.3) / 100.0;
+
+    std::random_device rd;
+    std::mt19937 gen(rd());
+    std::uniform_real_distribution<> dis(0.0, 1.0);
+
+    totalRaces_++;
+    if (dis(gen) < winChance) {
+        racesWon_++;
+        happiness_ = std::min(100.0, happiness_ + 10.0);
+    }
+
+    stamina_ -= 50.0;
+    fatigue_ = std::min(100.0, fatigue_ + 30.0);
+}
+
+double Horse::work(double hours) {
+    if (!isAlive_ || hours <= 0.0) return 0.0;
+
+    // Втомлений кінь працює менше
+    double workHours = std::min(hours, stamina_ / 10.0);
+    if (workHours <= 0.0) return 0.0;
+
+    stamina_ -= workHours * 10.0;
+    fatigue_ = std::min(100.0, fatigue_ + workHours * 5.0);
+    productionCooldown_ = 24;
+
+    double result = workHours * calculateProductionBonus();
+    stats_.totalProduced++;
+    stats_.totalEarnings += result * getProductPrice();
+
+    return result;
+}
+
+void Horse::ride() {
+    if (!isAlive_ || stamina_ < 10.0) return;
+
+    // Коні люблять прогулянки
+    stamina_ -= 10.0;
+    happiness_ = std::min(100.0, happiness_ + 5.0);
+}
+
+void Horse::rest() {
+    fatigue_ = std::max(0.0, fatigue_ - 30.0);
+    recoverStamina(30.0);
+}
+
+void Horse::update(double deltaTime) {
+    Animal::update(deltaTime);
+
+    if (!isAlive_) return;
+
+    // Витривалість поступово відновлюється
+    recoverStamina(2.0 * deltaTime);
+    fatigue_ = std::max(0.0, fatigue_ - 0.5 * deltaTime);
+}
+
+bool Horse::feed(double feedQuality, double amount) {
+    if (!Animal::feed(feedQuality, amount)) return false;
+
+    // Якісний корм відновлює сили
+    recoverStamina(10.0 * feedQuality);
+
+    return true;
+}
+
+void Horse::recoverStamina(double amount) {
+    stamina_ = std::min(100.0, stamina_ + amount);
+}
+
+void Horse::writeBinary(BinaryWriter& out) const {
+    Animal::writeBinary(out);
+    out.writeEnum(breed_);
+    out.writeDouble(speed_);
+    out.writeDouble(stamina_);
+    out.writeDouble(strength_);
+    out.writeDouble(trainingLevel_);
+    out.writeDouble(fatigue_);
+    out.writeI32(racesWon_);
+    out.writeI32(totalRaces_);
+}
+
+void Horse::readBinary(BinaryReader& in) {
+    Animal::readBinary(in);
+    breed_ = in.readEnum<HorseBreed>();
+    speed_ = in.readDouble();
+    stamina_ = in.readDouble();
+    strength_ = in.readDouble();
+    trainingLevel_ = in.readDouble();
+    fatigue_ = in.readDouble();
+    racesWon_ = in.readI32();
+    totalRaces_ = in.readI32();
+}
+
+} // namespace FarmGame
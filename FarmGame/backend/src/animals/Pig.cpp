@@ -4,6 +4,7 @@
  */
 
 #include "animals/Pig.hpp"
+#include "farm/BinaryIO.hpp"
 #include <algorithm>
 #include <random>
 
@@ -231,4 +232,22 @@ void Pig::gainWeight(double amount) {
     weight_ = std::min(maxWeight, weight_ + amount);
 }
 
+void Pig::writeBinary(BinaryWriter& out) const {
+    Animal::writeBinary(out);
+    out.writeEnum(breed_);
+    out.writeDouble(weight_);
+    out.writeDouble(meatQuality_);
+    out.writeDouble(truffleSkill_);
+    out.writeI32(trufflesFound_);
+}
+
+void Pig::readBinary(BinaryReader& in) {
+    Animal::readBinary(in);
+    breed_ = in.readEnum<PigBreed>();
+    weight_ = in.readDouble();
+    meatQuality_ = in.readDouble();
+    truffleSkill_ = in.readDouble();
+    trufflesFound_ = in.readI32();
+}
+
 } // namespace FarmGame
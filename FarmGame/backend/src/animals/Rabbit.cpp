@@ -0,0 +1,169 @@
+/**
+ * @file Rabbit.cpp
+ * @brief Реалізація класу Rabbit
+ */
+
+#include "animals/Rabbit.hpp"
+#include "farm/BinaryIO.hpp"
+#include <algorithm>
+#include <random>
+
+namespace FarmGame {
+
+Rabbit::Rabbit(const std::string& name, int age, RabbitBreed breed)
+    : Animal(name, age)
+    , breed_(breed)
+    , furQuality_(60.0)
+    , woolAmount_(0.0)
+    , offspring_(0)
+    , isPregnant_(false)
+    , pregnancyDays_(0)
+{
+    initializeBreedStats();
+}
+
+void Rabbit::initializeBreedStats() {
+    switch (breed_) {
+        case RabbitBreed::NEW_ZEALAND:
+            furQuality_ = 60.0;   // М'ясна порода
+            break;
+        case RabbitBreed::CALIFORNIAN:
+            furQuality_ = 65.0;
+            break;
+        case RabbitBreed::ANGORA:
+            furQuality_ = 70.0;   // Цінується за вовну
+            break;
+        case RabbitBreed::FLEMISH:
+            furQuality_ = 55.0;   // Великий, але хутро гірше
+            break;
+        case RabbitBreed::REX:
+            furQuality_ = 95.0;   // Найкраще хутро
+            break;
+    }
+}
+
+std::string Rabbit::getBreedName() const {
+    switch (breed_) {
+        case RabbitBreed::NEW_ZEALAND: return "Новозеландський";
+        case RabbitBreed::CALIFORNIAN: return "Каліфорнійський";
+        case RabbitBreed::ANGORA: return "Ангорський";
+        case RabbitBreed::FLEMISH: return "Фландр";
+        case RabbitBreed::REX: return "Рекс";
+        default: return "Невідома";
+    }
+}
+
+double Rabbit::produce() {
+    if (!canProduce()) return 0.0;
+
+    // Ангорські кролики дають вовну, решта - хутро
+    return isAngoraType() ? collectWool() : collectFur();
+}
+
+std::string Rabbit::getProductName() const {
+    return isAngoraType() ? "Ангорська вовна" : "Хутро";
+}
+
+double Rabbit::getProductPrice() const {
+    if (isAngoraType()) {
+        return 150.0;  // Ціна за кг ангорської вовни
+    }
+    return 20.0 + furQuality_ * 0.5;
+}
+
+double Rabbit::getBasePrice() const {
+    switch (breed_) {
+        case RabbitBreed::NEW_ZEALAND: return 400.0;
+        case RabbitBreed::CALIFORNIAN: return 450.0;
+        case RabbitBreed::ANGORA: return 700.0;
+        case RabbitBreed::FLEMISH: return 550.0;
+        case RabbitBreed::REX: return 650.0;
+    }
+    return 400.0;
+}
+
+std::unique_ptr<Animal> Rabbit::clone() const {
+    auto rabbit = std::make_unique<Rabbit>(name_, age_, breed_);
+    rabbit->health_ = health_;
+    rabbit->hunger_ = hunger_;
+    rabbit->happiness_ = happiness_;
+    rabbit->furQuality_ = furQuality_;
+    rabbit->woolAmount_ = woolAmount_;
+    return rabbit;
+}
+
+void Rabbit::breed() {
+    if (!isPregnant_ && age_ >= 120 && health_ > 60.0) {
+        isPregnant_ = true;
+        pregnancyDays_ = 0;
+    }
+}
+
+double Rabbit::collectFur() {
+    double fur = 0.2 * (furQuality_ / 100.0) * calculateProductionBonus();
+    productionCooldown_ = 24 * 7;
+    stats_.totalProduced++;
+    stats_.totalEarnings += fur * getProductPrice();
+    return fur;
+}
+
+double Rabbit::collectWool() {
+    if (!isAngoraType() || woolAmount_ < 0.1) return 0.0;
+
+    double wool = woolAmount_ * calculateProductionBonus();
+    woolAmount_ = 0.0;
+    productionCooldown_ = 24 * 14;  // Вовна має відрости
+    stats_.totalProduced++;
+    stats_.totalEarnings += wool * getProductPrice();
+    return wool;
+}
+
+void Rabbit::update(double deltaTime) {
+    Animal::update(deltaTime);
+
+    if (!isAlive_) return;
+
+    // Ріст вовни в ангорських кроликів
+    if (isAngoraType()) {
+        double growthFactor = (health_ / 100.0) * (hunger_ / 100.0);
+        woolAmount_ = std::min(1.0, woolAmount_ + 0.002 * growthFactor * deltaTime);
+    }
+
+    // Оновити вагітність
+    if (isPregnant_) {
+        pregnancyDays_++;
+
+        // Вагітність кролиці ~31 день
+        if (pregnancyDays_ >= 31) {
+            std::random_device rd;
+            std::mt19937 gen(rd());
+            std::uniform_int_distribution<> dis(4, 10);
+
+            offspring_ += dis(gen);
+            isPregnant_ = false;
+            pregnancyDays_ = 0;
+        }
+    }
+}
+
+void Rabbit::writeBinary(BinaryWriter& out) const {
+    Animal::writeBinary(out);
+    out.writeEnum(breed_);
+    out.writeDouble(furQuality_);
+    out.writeDouble(woolAmount_);
+    out.writeI32(offspring_);
+    out.writeBool(isPregnant_);
+    out.writeI32(pregnancyDays_);
+}
+
+void Rabbit::readBinary(BinaryReader& in) {
+    Animal::readBinary(in);
+    breed_ = in.readEnum<RabbitBreed>();
+    furQuality_ = in.readDouble();
+    woolAmount_ = in.readDouble();
+    offspring_ = in.readI32();
+    isPregnant_ = in.readBool();
+    pregnancyDays_ = in.readI32();
+}
+
+} // namespace FarmGame
@@ -4,6 +4,7 @@
  */
 
 #include "animals/Sheep.hpp"
+#include "farm/BinaryIO.hpp"
 #include <algorithm>
 #include <random>
 
@@ -223,4 +224,26 @@ void Sheep::growWool(double deltaTime) {
     woolLength_ = std::min(maxLength, woolLength_);
 }
 
+void Sheep::writeBinary(BinaryWriter& out) const {
+    Animal::writeBinary(out);
+    out.writeEnum(breed_);
+    out.writeDouble(woolQuality_);
+    out.writeDouble(woolLength_);
+    out.writeDouble(woolGrowthRate_);
+    out.writeI32(lambs_);
+    out.writeBool(isPregnant_);
+    out.writeI32(pregnancyDays_);
+}
+
+void Sheep::readBinary(BinaryReader& in) {
+    Animal::readBinary(in);
+    breed_ = in.readEnum<SheepBreed>();
+    woolQuality_ = in.readDouble();
+    woolLength_ = in.readDouble();
+    woolGrowthRate_ = in.readDouble();
+    lambs_ = in.readI32();
+    isPregnant_ = in.readBool();
+    pregnancyDays_ = in.readI32();
+}
+
 } // namespace FarmGame
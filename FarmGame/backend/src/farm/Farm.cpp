@@ -4,7 +4,9 @@
  */
 
 #include "farm/Farm.hpp"
+#include "farm/BinaryIO.hpp"
 #include <algorithm>
+#include <cstring>
 #include <sstream>
 #include <fstream>
 #include <random>
@@ -628,16 +630,27 @@ void Farm::triggerEvent(const std::string& eventMessage) {
 
 // ==================== Серіалізація ====================
 
+namespace {
+
+// Заголовок бінарного збереження ферми
+const char FARM_SAVE_MAGIC[4] = {'F', 'R', 'M', 'B'};
+const std::uint16_t FARM_SAVE_VERSION = 1;
+
+// Орієнтовний розмір запису тварини (для резервування буфера)
+const std::size_t ANIMAL_RECORD_SIZE = 128;
+
+} // namespace
+
 bool Farm::saveToFile(const std::string& filename) const {
-    std::ofstream file(filename);
+    std::ofstream file(filename, std::ios::binary);
     if (!file.is_open()) return false;
     
     file << serialize();
-    return true;
+    return file.good();
 }
 
 std::unique_ptr<Farm> Farm::loadFromFile(const std::string& filename) {
-    std::ifstream file(filename);
+    std::ifstream file(filename, std::ios::binary);
     if (!file.is_open()) return nullptr;
     
     std::stringstream buffer;
@@ -647,19 +660,104 @@ std::unique_ptr<Farm> Farm::loadFromFile(const std::string& filename) {
 }
 
 std::string Farm::serialize() const {
-    std::ostringstream oss;
-    oss << "FARM|" << name_ << "|" << currentDay_ << "|" 
-        << static_cast<int>(currentSeason_) << "|"
-        << reputation_ << "|";
-    oss << farmer_->serialize() << "|";
-    oss << "ANIMALS:" << animals_.size();
-    // TODO: Повна серіалізація тварин
-    return oss.str();
+    BinaryWriter out;
+    out.reserve(1024 + animals_.size() * ANIMAL_RECORD_SIZE);
+    out.writeBytes(FARM_SAVE_MAGIC, sizeof(FARM_SAVE_MAGIC));
+    out.writeU16(FARM_SAVE_VERSION);
+    
+    // Час, погода та економіка
+    out.writeString(name_);
+    out.writeI32(currentDay_);
+    out.writeI32(currentHour_);
+    out.writeEnum(currentSeason_);
+    out.writeEnum(currentWeather_);
+    out.writeI32(daysInSeason_);
+    out.writeDouble(dailyIncome_);
+    out.writeDouble(dailyExpenses_);
+    out.writeI32(reputation_);
+    
+    farmer_->writeBinary(out);
+    
+    // Будівлі
+    out.writeU32(static_cast<std::uint32_t>(buildings_.size()));
+    for (const auto& building : buildings_) {
+        out.writeString(building.name);
+        out.writeString(building.type);
+        out.writeI32(building.level);
+        out.writeI32(building.capacity);
+        out.writeDouble(building.maintenanceCost);
+        out.writeBool(building.isUpgradable);
+    }
+    
+    // Сховища
+    feedStorage_->writeBinary(out);
+    productStorage_->writeBinary(out);
+    refrigerator_->writeBinary(out);
+    
+    // Тварини: тип, далі стан, який пише сам клас тварини
+    out.writeU32(static_cast<std::uint32_t>(animals_.size()));
+    for (const auto& animal : animals_) {
+        out.writeEnum(animal->getType());
+        animal->writeBinary(out);
+    }
+    
+    return out.release();
 }
 
 std::unique_ptr<Farm> Farm::deserialize(const std::string& data) {
-    // TODO: Повна десеріалізація
-    return std::make_unique<Farm>("Farm", "Farmer");
+    try {
+        BinaryReader in(data);
+        
+        char magic[sizeof(FARM_SAVE_MAGIC)];
+        in.readBytes(magic, sizeof(magic));
+        if (std::memcmp(magic, FARM_SAVE_MAGIC, sizeof(magic)) != 0) return nullptr;
+        if (in.readU16() > FARM_SAVE_VERSION) return nullptr;
+        
+        auto farm = std::make_unique<Farm>(in.readString(), "");
+        farm->currentDay_ = in.readI32();
+        farm->currentHour_ = in.readI32();
+        farm->currentSeason_ = in.readEnum<Season>();
+        farm->currentWeather_ = in.readEnum<Weather>();
+        farm->daysInSeason_ = in.readI32();
+        farm->dailyIncome_ = in.readDouble();
+        farm->dailyExpenses_ = in.readDouble();
+        farm->reputation_ = in.readI32();
+        
+        farm->farmer_->readBinary(in);
+        
+        // Збережені будівлі замінюють початкові
+        farm->buildings_.clear();
+        std::uint32_t buildingCount = in.readU32();
+        for (std::uint32_t i = 0; i < buildingCount; ++i) {
+            Building building;
+            building.name = in.readString();
+            building.type = in.readString();
+            building.level = in.readI32();
+            building.capacity = in.readI32();
+            building.maintenanceCost = in.readDouble();
+            building.isUpgradable = in.readBool();
+            farm->buildings_.push_back(building);
+        }
+        
+        farm->feedStorage_->readBinary(in);
+        farm->productStorage_->readBinary(in);
+        farm->refrigerator_->readBinary(in);
+        
+        // Тварини додаються напряму: місткість перевірялась під час гри
+        std::uint32_t animalCount = in.readU32();
+        farm->animals_.reserve(std::min<std::size_t>(animalCount, in.remaining() / ANIMAL_RECORD_SIZE + 1));
+        for (std::uint32_t i = 0; i < animalCount; ++i) {
+            auto animal = AnimalFactory::createAnimal(in.readEnum<AnimalType>(), "");
+            if (!animal) return nullptr;
+            animal->readBinary(in);
+            farm->animals_.push_back(std::move(animal));
+        }
+        
+        return farm;
+    } catch (const std::runtime_error&) {
+        // Обірвані дані
+        return nullptr;
+    }
 }
 
 // ==================== Фабрика тварин ====================
@@ -4,6 +4,7 @@
  */
 
 #include "farm/Farmer.hpp"
+#include "farm/BinaryIO.hpp"
 #include <algorithm>
 #include <sstream>
 #include <cmath>
@@ -351,4 +352,52 @@ std::unique_ptr<Farmer> Farmer::deserialize(const std::string& data) {
     return farmer;
 }
 
+void Farmer::writeBinary(BinaryWriter& out) const {
+    out.writeString(name_);
+    out.writeDouble(money_);
+    out.writeDouble(energy_);
+    out.writeDouble(maxEnergy_);
+    out.writeI32(level_);
+    out.writeDouble(experience_);
+    
+    out.writeU32(static_cast<std::uint32_t>(skills_.size()));
+    for (const auto& pair : skills_) {
+        out.writeEnum(pair.first);
+        out.writeDouble(pair.second);
+    }
+    
+    out.writeI32(stats_.animalsFed);
+    out.writeI32(stats_.productionsCollected);
+    out.writeI32(stats_.animalsBought);
+    out.writeI32(stats_.animalsSold);
+    out.writeDouble(stats_.totalEarnings);
+    out.writeDouble(stats_.totalSpending);
+    out.writeI32(stats_.daysPlayed);
+    out.writeI32(stats_.achievementsUnlocked);
+}
+
+void Farmer::readBinary(BinaryReader& in) {
+    name_ = in.readString();
+    money_ = in.readDouble();
+    energy_ = in.readDouble();
+    maxEnergy_ = in.readDouble();
+    level_ = in.readI32();
+    experience_ = in.readDouble();
+    
+    std::uint32_t skillCount = in.readU32();
+    for (std::uint32_t i = 0; i < skillCount; ++i) {
+        FarmerSkill skill = in.readEnum<FarmerSkill>();
+        skills_[skill] = in.readDouble();
+    }
+    
+    stats_.animalsFed = in.readI32();
+    stats_.productionsCollected = in.readI32();
+    stats_.animalsBought = in.readI32();
+    stats_.animalsSold = in.readI32();
+    stats_.totalEarnings = in.readDouble();
+    stats_.totalSpending = in.readDouble();
+    stats_.daysPlayed = in.readI32();
+    stats_.achievementsUnlocked = in.readI32();
+}
+
 } // namespace FarmGame
@@ -4,6 +4,7 @@
  */
 
 #include "production/Feed.hpp"
+#include "farm/BinaryIO.hpp"
 #include <algorithm>
 
 namespace FarmGame {
@@ -149,6 +150,18 @@ std::unique_ptr<Feed> Feed::create(FeedType type, double amount) {
     return std::make_unique<Feed>(type, amount);
 }
 
+void Feed::writeBinary(BinaryWriter& out) const {
+    out.writeDouble(amount_);
+    out.writeDouble(quality_);
+    out.writeI32(daysRemaining_);
+}
+
+void Feed::readBinary(BinaryReader& in) {
+    amount_ = in.readDouble();
+    quality_ = in.readDouble();
+    daysRemaining_ = in.readI32();
+}
+
 // ==================== OrganicFeed ====================
 
 OrganicFeed::OrganicFeed(FeedType type, double amount)
@@ -4,7 +4,9 @@
  */
 
 #include "production/Product.hpp"
+#include "farm/BinaryIO.hpp"
 #include <algorithm>
+#include <map>
 
 namespace FarmGame {
 
@@ -253,6 +255,23 @@ void Product::combineWith(Product& other) {
     }
 }
 
+void Product::writeBinary(BinaryWriter& out) const {
+    out.writeDouble(amount_);
+    out.writeEnum(quality_);
+    out.writeI32(daysRemaining_);
+    out.writeI32(productId_);
+    out.writeI64(static_cast<std::int64_t>(producedTime_));
+}
+
+void Product::readBinary(BinaryReader& in) {
+    amount_ = in.readDouble();
+    quality_ = in.readEnum<ProductQuality>();
+    daysRemaining_ = in.readI32();
+    productId_ = in.readI32();
+    producedTime_ = static_cast<std::time_t>(in.readI64());
+    nextProductId_ = std::max(nextProductId_, productId_ + 1);
+}
+
 // ==================== DairyProduct ====================
 
 DairyProduct::DairyProduct(ProductType type, double amount, ProductQuality quality,
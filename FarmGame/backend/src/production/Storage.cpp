@@ -4,6 +4,7 @@
  */
 
 #include "production/Storage.hpp"
+#include "farm/BinaryIO.hpp"
 #include <algorithm>
 
 namespace FarmGame {
@@ -57,6 +58,18 @@ void Storage::removeExpired() {
     // Базова реалізація - нічого
 }
 
+void Storage::writeBinary(BinaryWriter& out) const {
+    out.writeDouble(capacity_);
+    out.writeI32(level_);
+    out.writeDouble(upgradeMultiplier_);
+}
+
+void Storage::readBinary(BinaryReader& in) {
+    capacity_ = in.readDouble();
+    level_ = in.readI32();
+    upgradeMultiplier_ = in.readDouble();
+}
+
 // ==================== FeedStorage ====================
 
 FeedStorage::FeedStorage(double capacity)
@@ -167,6 +180,28 @@ void FeedStorage::removeExpired() {
     updateUsedSpace();
 }
 
+void FeedStorage::writeBinary(BinaryWriter& out) const {
+    Storage::writeBinary(out);
+    out.writeU32(static_cast<std::uint32_t>(feeds_.size()));
+    for (const auto& pair : feeds_) {
+        out.writeEnum(pair.first);
+        pair.second->writeBinary(out);
+    }
+}
+
+void FeedStorage::readBinary(BinaryReader& in) {
+    Storage::readBinary(in);
+    feeds_.clear();
+    std::uint32_t count = in.readU32();
+    for (std::uint32_t i = 0; i < count; ++i) {
+        FeedType type = in.readEnum<FeedType>();
+        auto feed = std::make_shared<Feed>(type);
+        feed->readBinary(in);
+        feeds_[type] = feed;
+    }
+    updateUsedSpace();
+}
+
 void FeedStorage::updateUsedSpace() {
     usedSpace_ = 0.0;
     for (const auto& pair : feeds_) {
@@ -312,6 +347,27 @@ void ProductStorage::removeExpired() {
     updateUsedSpace();
 }
 
+void ProductStorage::writeBinary(BinaryWriter& out) const {
+    Storage::writeBinary(out);
+    out.writeU32(static_cast<std::uint32_t>(products_.size()));
+    for (const auto& product : products_) {
+        out.writeEnum(product->getType());
+        product->writeBinary(out);
+    }
+}
+
+void ProductStorage::readBinary(BinaryReader& in) {
+    Storage::readBinary(in);
+    products_.clear();
+    std::uint32_t count = in.readU32();
+    for (std::uint32_t i = 0; i < count; ++i) {
+        auto product = std::make_shared<Product>(in.readEnum<ProductType>(), 0.0);
+        product->readBinary(in);
+        products_.push_back(product);
+    }
+    updateUsedSpace();
+}
+
 void ProductStorage::updateUsedSpace() {
     usedSpace_ = 0.0;
     for (const auto& product : products_) {
@@ -343,7 +399,7 @@ void Refrigerator::setTemperature(double temp) {
 
 void Refrigerator::ageContents() {
     // Холодильник сповільнює псування
-    for (auto& product : products_) {
+    for (auto& product : getAllProducts()) {
         // Псується повільніше
         if (product->getDaysRemaining() > preservationBonus_) {
             // Не старіємо сьогодні
@@ -353,4 +409,16 @@ void Refrigerator::ageContents() {
     }
 }
 
+void Refrigerator::writeBinary(BinaryWriter& out) const {
+    ProductStorage::writeBinary(out);
+    out.writeDouble(temperature_);
+    out.writeI32(preservationBonus_);
+}
+
+void Refrigerator::readBinary(BinaryReader& in) {
+    ProductStorage::readBinary(in);
+    temperature_ = in.readDouble();
+    preservationBonus_ = in.readI32();
+}
+
 } // namespace FarmGame
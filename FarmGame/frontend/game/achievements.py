@@ -0,0 +1,131 @@
+"""
+Подієва система досягнень
+Кожне досягнення підписане на конкретні події зміни стану
+(купівля тварини, зміна грошей, новий день, ...). Умова перевіряється
+лише тоді, коли відбувається подія, а розблоковані досягнення
+відписуються і більше не коштують нічого.
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .constants import ACHIEVEMENTS, ANIMAL_TYPES
+
+
+# Події стану гри
+EVENT_ANIMAL_BOUGHT = "animal_bought"
+EVENT_ANIMAL_REMOVED = "animal_removed"
+EVENT_MONEY_CHANGED = "money_changed"
+EVENT_DAY_ADVANCED = "day_advanced"
+EVENT_PRODUCT_SOLD = "product_sold"
+EVENT_HAPPINESS_RAISED = "happiness_raised"
+
+# Поріг щастя для досягнення "Щасливі тварини"
+HAPPY_THRESHOLD = 80
+
+
+def _all_animals_happy(game_state) -> bool:
+    """Всі живі тварини мають щастя > 80 (all() зупиняється на першій нещасній)"""
+    if game_state.aggregates.living_count == 0:
+        return False
+    if game_state.herd is not None:
+        return game_state.herd.all_living_above("happiness", HAPPY_THRESHOLD)
+    return all(a.happiness > HAPPY_THRESHOLD for a in game_state.animals if a.is_alive)
+
+
+# Правила: id досягнення -> (події, на які воно підписане, умова)
+# Умова None означає, що досягнення дає сама подія (за станом його не перевірити)
+ACHIEVEMENT_RULES: Dict[str, Tuple[Tuple[str, ...], Optional[Callable]]] = {
+    "first_animal": (
+        (EVENT_ANIMAL_BOUGHT,),
+        lambda gs: len(gs.animals) >= 1
+    ),
+    "ten_animals": (
+        (EVENT_ANIMAL_BOUGHT,),
+        lambda gs: len(gs.animals) >= 10
+    ),
+    "fifty_animals": (
+        (EVENT_ANIMAL_BOUGHT,),
+        lambda gs: len(gs.animals) >= 50
+    ),
+    "first_sale": (
+        (EVENT_PRODUCT_SOLD,),
+        None
+    ),
+    "rich_farmer": (
+        (EVENT_MONEY_CHANGED,),
+        lambda gs: gs.farmer.money >= 100000
+    ),
+    "year_passed": (
+        (EVENT_DAY_ADVANCED,),
+        lambda gs: gs.farmer.days_played >= 365
+    ),
+    "all_animals": (
+        (EVENT_ANIMAL_BOUGHT,),
+        lambda gs: gs.aggregates.living_types >= len(ANIMAL_TYPES)
+    ),
+    "happy_animals": (
+        (EVENT_HAPPINESS_RAISED, EVENT_ANIMAL_REMOVED),
+        _all_animals_happy
+    ),
+}
+
+
+class AchievementEngine:
+    """
+    Диспетчер досягнень
+    Тримає підписки лише для ще не розблокованих досягнень
+    """
+
+    def __init__(self, game_state):
+        self.game_state = game_state
+        self._subscriptions: Dict[str, List[str]] = {}
+        self.reset()
+
+    def reset(self):
+        """Перебудувати підписки за поточним станом досягнень"""
+        self._subscriptions = {}
+        for achievement_id, (events, _) in ACHIEVEMENT_RULES.items():
+            if self.game_state.achievements.get(achievement_id):
+                continue
+            for event in events:
+                self._subscriptions.setdefault(event, []).append(achievement_id)
+
+    def emit(self, event: str):
+        """Повідомити про подію стану"""
+        subscribers = self._subscriptions.get(event)
+        if not subscribers:
+            return
+
+        for achievement_id in list(subscribers):
+            _, condition = ACHIEVEMENT_RULES[achievement_id]
+            if condition is None or condition(self.game_state):
+                self._unsubscribe(achievement_id)
+                self.game_state._unlock_achievement(achievement_id)
+
+    def check_all(self):
+        """
+        Відновити прапорці досягнень, умови яких уже виконані
+        (після завантаження і відкату). Нагорода не виплачується:
+        цих грошей немає в журналі дій, і відтворена сесія розійшлася б
+        зі збереженою
+        """
+        for achievement_id, (_, condition) in ACHIEVEMENT_RULES.items():
+            if achievement_id not in ACHIEVEMENTS or condition is None:
+                continue
+            if not self.game_state.achievements.get(achievement_id) and condition(self.game_state):
+                self._unsubscribe(achievement_id)
+                self.game_state.achievements[achievement_id] = True
+
+    def is_subscribed(self, event: str) -> bool:
+        """Чи є підписники на подію (щоб не рахувати зайвого)"""
+        return bool(self._subscriptions.get(event))
+
+    def _unsubscribe(self, achievement_id: str):
+        """Прибрати досягнення з усіх підписок"""
+        events, _ = ACHIEVEMENT_RULES[achievement_id]
+        for event in events:
+            subscribers = self._subscriptions.get(event)
+            if subscribers and achievement_id in subscribers:
+                subscribers.remove(achievement_id)
+                if not subscribers:
+                    del self._subscriptions[event]
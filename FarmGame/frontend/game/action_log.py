@@ -0,0 +1,100 @@
+"""
+Журнал дій гравця для відтворення сесії
+Кожен запис - компактний список [ігрова година, дія, аргументи...].
+Разом із зерном генератора GameState цього достатньо, щоб без
+графічного інтерфейсу повторити сесію до біта (наприклад, як навантаження
+для бенчмарків).
+"""
+
+from typing import Any, Dict, List, Optional
+
+
+# Коротка назва дії -> публічний метод GameState
+ACTIONS = {
+    "buy": "buy_animal",
+    "sell": "sell_animal",
+    "feed": "feed_animal",
+    "feed_many": "feed_animals",
+    "collect": "collect_product",
+    "collect_many": "collect_products",
+    "pet": "pet_animal",
+    "heal": "heal_animal",
+    "heal_many": "heal_animals",
+    "buy_feed": "buy_feed",
+    "sell_product": "sell_product",
+    "upgrade": "upgrade_building",
+    # Масове просування часу теж записується: воно витрачає випадкові
+    # числа інакше, ніж погодинне
+    "advance": "advance_hours",
+}
+
+
+class ActionLog:
+    """
+    Журнал дій, що лише доповнюється
+    """
+
+    def __init__(self, seed: Optional[int] = None, farm_name: str = "",
+                 farmer_name: str = ""):
+        self.seed = seed
+        self.farm_name = farm_name
+        self.farmer_name = farmer_name
+        self.entries: List[List[Any]] = []
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def record(self, hour: int, action: str, *args):
+        """Додати запис"""
+        self.entries.append([hour, action, *args])
+
+    @property
+    def replayable(self) -> bool:
+        """Чи можна відтворити сесію (для старих збережень зерна немає)"""
+        return self.seed is not None
+
+    def to_dict(self) -> dict:
+        return {
+            "seed": self.seed,
+            "farm_name": self.farm_name,
+            "farmer_name": self.farmer_name,
+            # Копія списку: збереження серіалізується у фоновому потоці
+            "entries": list(self.entries),
+        }
+
+    @staticmethod
+    def from_dict(data: Optional[Dict[str, Any]]) -> 'ActionLog':
+        if not data:
+            return ActionLog()
+        log = ActionLog(data.get("seed"), data.get("farm_name", ""), data.get("farmer_name", ""))
+        log.entries = [list(entry) for entry in data.get("entries", [])]
+        return log
+
+
+def replay(game_state, log: ActionLog, until_hour: Optional[int] = None):
+    """
+    Відтворити сесію з журналу на game_state
+    Починає нову гру з тим самим зерном, між діями просуває час
+    погодинно, як інтерактивна гра. until_hour - ігрова година,
+    до якої догнати час після останньої дії
+    """
+    if not log.replayable:
+        raise ValueError("Журнал не містить зерна - сесію неможливо відтворити")
+
+    game_state.new_game(log.farm_name, log.farmer_name, seed=log.seed)
+
+    for hour, action, *args in log.entries:
+        _advance_to(game_state, hour)
+        method = ACTIONS.get(action)
+        if method is None:
+            raise ValueError(f"Невідома дія у журналі: {action}")
+        getattr(game_state, method)(*args)
+
+    if until_hour is not None:
+        _advance_to(game_state, until_hour)
+
+
+def _advance_to(game_state, hour: int):
+    """Погодинно просунути час до вказаної ігрової години"""
+    for _ in range(hour - game_state.get_game_hour()):
+        game_state._advance_hour()
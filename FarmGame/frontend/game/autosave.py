@@ -0,0 +1,89 @@
+"""
+Автозбереження за ігровим часом
+Кожні AUTOSAVE_INTERVAL_DAYS ігрових днів GameState просить зберегти гру;
+збереження запускається вже після оновлення всієї години (poll).
+Збереження пропускається, якщо нічого не змінилось, пишеться у фоновому
+потоці (GameState.save_game_async) і не запускається, поки попереднє
+ще не завершилось або з нього минуло замало реального часу - тоді воно
+відкладається і повторюється з update.
+"""
+
+import time
+from concurrent.futures import Future
+from typing import Optional
+
+from .constants import AUTOSAVE_INTERVAL_DAYS, AUTOSAVE_MIN_SECONDS
+
+
+class AutosaveScheduler:
+    """
+    Планувальник автозбережень для GameState
+    """
+
+    def __init__(self, game_state, interval_days: int = AUTOSAVE_INTERVAL_DAYS,
+                 min_seconds: float = AUTOSAVE_MIN_SECONDS):
+        self.game_state = game_state
+        self.interval_days = interval_days
+        self.min_seconds = min_seconds
+
+        self._days_since_save = 0
+        self._requested = False
+        self._future: Optional[Future] = None
+        self._last_started = float("-inf")
+
+        # Статистика
+        self.saves_started = 0
+        self.saves_skipped = 0
+
+    def reset(self):
+        """Скинути лічильник днів (нова гра або завантаження)"""
+        self._days_since_save = 0
+        self._requested = False
+
+    def on_day_advanced(self):
+        """
+        Викликається з GameState._advance_day
+        Лише запит: посеред години стан оновлений не повністю, тому
+        збереження запускає poll після години або пакета advance_hours
+        """
+        self._days_since_save += 1
+        if self._days_since_save >= self.interval_days:
+            self._days_since_save = 0
+            self._requested = True
+
+    def poll(self):
+        """
+        Запустити відкладене автозбереження, якщо вже можна
+        Дешево викликати щокадру
+        """
+        future = self._future
+        if future is not None:
+            if not future.done():
+                # Повільний диск: нове збереження почекає
+                return
+            self._future = None
+            error = future.exception()
+            if error is not None:
+                self.game_state.add_notification("Помилка", f"Автозбереження не вдалося: {error}")
+
+        if not self._requested:
+            return
+
+        game_state = self.game_state
+        if not game_state.auto_save:
+            self._requested = False
+            return
+
+        if not game_state.has_unsaved_changes():
+            self._requested = False
+            self.saves_skipped += 1
+            return
+
+        now = time.monotonic()
+        if now - self._last_started < self.min_seconds:
+            return
+
+        self._requested = False
+        self._last_started = now
+        self.saves_started += 1
+        self._future = game_state.save_game_async()
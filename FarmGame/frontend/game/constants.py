@@ -12,6 +12,13 @@ SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 FPS = 60
 
+# Максимум ігрових годин, які наздоганяються за один кадр
+MAX_CATCHUP_HOURS = 48
+
+# Розмір кільцевих буферів історії подій і сповіщень
+MAX_EVENTS = 100
+MAX_NOTIFICATIONS = 20
+
 # Кольори
 COLORS = {
     "background": (135, 206, 235),      # Небесно-блакитний
@@ -176,6 +183,36 @@ WEATHER_TYPES = {
     "foggy": {"name": "Туман", "emoji": "🌫️"}
 }
 
+# Вплив погоди на ймовірність захворювання (за годину)
+WEATHER_SICKNESS = {
+    "sunny": 0.0,
+    "cloudy": 0.005,
+    "rainy": 0.015,
+    "stormy": 0.025,
+    "snowy": 0.02,
+    "foggy": 0.01
+}
+
+# Вплив сезону на ймовірність захворювання (за годину)
+SEASON_SICKNESS = {
+    "spring": 0.005,
+    "summer": 0.0,
+    "autumn": 0.01,
+    "winter": 0.015
+}
+
+# Будівля, в якій живе тварина кожного типу
+ANIMAL_BUILDINGS = {
+    "cow": "barn",
+    "pig": "barn",
+    "sheep": "barn",
+    "goat": "barn",
+    "chicken": "coop",
+    "duck": "coop",
+    "rabbit": "coop",
+    "horse": "stable"
+}
+
 # Будівлі
 BUILDING_TYPES = {
     "barn": {
@@ -270,6 +307,13 @@ FONT_SIZES = {
     "huge": 72
 }
 
+# Перемальовувати лише змінені області екрана (pygame.display.update(rects))
+# замість повного кадру; екрани без get_dirty_rects малюються повністю
+DIRTY_RECT_RENDERING = False
+
+# Скільки відрендерених текстових поверхонь тримати в кеші (ui/components/text_cache.py)
+TEXT_CACHE_SIZE = 512
+
 # Анімації
 ANIMATION_SPEED = 0.1
 FADE_SPEED = 5
@@ -286,10 +330,32 @@ SOUNDS = {
 
 # Збереження
 SAVE_FILE = "savegame.json"
+# Дописувати зміни в журнал замість повного перезапису збереження
+JOURNALED_SAVES = True
+# Формат повного знімку: "json" або компактний "binary" (для великих ферм)
+SAVE_FORMAT = "json"
+# База SQLite для збережень зі слотами (опціонально, див. GameState.use_sqlite_store)
+SAVE_DB_FILE = "savegame.db"
+DEFAULT_SAVE_SLOT = "default"
+
+# Автозбереження: раз на скільки ігрових днів і не частіше ніж раз на скільки секунд
+AUTO_SAVE = True
+AUTOSAVE_INTERVAL_DAYS = 1
+AUTOSAVE_MIN_SECONDS = 30.0
+
+# Скільки останніх ігрових днів можна відкотити (знімки в пам'яті)
+SNAPSHOT_DAYS = 7
+
+# Прогрес за час відсутності: при завантаженні ферма наздоганяє реальний час,
+# що минув від збереження (1 секунда = 1 ігрова година), але не більше ліміту
+OFFLINE_PROGRESS = False
+OFFLINE_MAX_HOURS = 72
+# Варіанти ліміту в налаштуваннях (0 - вимкнено)
+OFFLINE_HOURS_OPTIONS = (0, 24, 72, 168)
 
 # Шрифти з підтримкою кирилиці та емодзі
 # На Windows найкраще використовувати Segoe UI для обох
-UNIVERSAL_FONTS = [
+UNIVERSAL_FONTS = (
     "Segoe UI",            # Windows - підтримує і кирилицю і багато емодзі
     "Arial Unicode MS",    # Універсальний 
     "DejaVu Sans",         # Linux
@@ -297,41 +363,85 @@ UNIVERSAL_FONTS = [
     "Tahoma",              # Windows fallback
     "Ubuntu",              # Linux
     "Verdana",             # Має підтримку кирилиці
-]
+)
+
+# Спеціальні емодзі-шрифти (за пріоритетом)
+EMOJI_FONTS = (
+    "Segoe UI Emoji",      # Windows - кольорові емодзі
+    "Segoe UI Symbol",     # Windows - символи
+    "Apple Color Emoji",   # macOS
+    "Noto Color Emoji",    # Linux
+    "Segoe UI",            # Fallback
+)
+
+# Позначка ще не визначеного сімейства (None - теж результат: системний шрифт)
+_UNRESOLVED = object()
+
+
+class FontRegistry:
+    """
+    Спільний на весь процес кеш шрифтів
+    Доступне сімейство шрифтів визначається один раз, а об'єкти Font
+    запам'ятовуються за (розмір, жирність, сімейство) - методи draw
+    можуть викликати get_font щокадру без створення нових шрифтів
+    """
+
+    def __init__(self):
+        self._fonts = {}
+        # Визначені сімейства: кортеж кандидатів -> назва (None - системний)
+        self._families = {}
+        self.hits = 0
+        self.misses = 0
+
+    def resolve_family(self, candidates):
+        """
+        Перше встановлене сімейство зі списку (визначається один раз)
+        Кортеж кандидатів сам є ключем кешу - повторний виклик нічого не створює
+        """
+        if not isinstance(candidates, tuple):
+            candidates = tuple(candidates)
+        family = self._families.get(candidates, _UNRESOLVED)
+        if family is _UNRESOLVED:
+            import pygame
+            family = None
+            for font_name in candidates:
+                try:
+                    if pygame.font.match_font(font_name):
+                        family = font_name
+                        break
+                except Exception:
+                    continue
+            self._families[candidates] = family
+        return family
+
+    def get(self, size, bold=False, family=None):
+        """Шрифт заданого розміру з кешу (створюється при першому запиті)"""
+        key = (size, bold, family)
+        font = self._fonts.get(key)
+        if font is not None:
+            self.hits += 1
+            return font
+
+        import pygame
+        self.misses += 1
+        font = pygame.font.SysFont(family, size, bold=bold)
+        self._fonts[key] = font
+        return font
+
+    def clear(self):
+        """Скинути кеш (наприклад, після pygame.font.quit)"""
+        self._fonts = {}
+        self._families = {}
+
+
+FONTS = FontRegistry()
+
 
 def get_font(size, bold=False):
     """Отримати шрифт з підтримкою кирилиці"""
-    import pygame
-    for font_name in UNIVERSAL_FONTS:
-        try:
-            font = pygame.font.SysFont(font_name, size, bold=bold)
-            if font:
-                return font
-        except:
-            continue
-    # Fallback на системний шрифт
-    return pygame.font.SysFont(None, size, bold=bold)
+    return FONTS.get(size, bold, FONTS.resolve_family(UNIVERSAL_FONTS))
+
 
 def get_emoji_font(size):
     """Отримати шрифт з підтримкою емодзі"""
-    import pygame
-    # Спочатку пробуємо спеціальні емодзі-шрифти
-    emoji_fonts = [
-        "Segoe UI Emoji",      # Windows - кольорові емодзі
-        "Segoe UI Symbol",     # Windows - символи
-        "Apple Color Emoji",   # macOS
-        "Noto Color Emoji",    # Linux
-    ]
-    for font_name in emoji_fonts:
-        try:
-            font = pygame.font.SysFont(font_name, size)
-            if font:
-                return font
-        except:
-            continue
-    # Fallback на Segoe UI
-    try:
-        return pygame.font.SysFont("Segoe UI", size)
-    except:
-        pass
-    return pygame.font.SysFont(None, size)
+    return FONTS.get(size, False, FONTS.resolve_family(EMOJI_FONTS))
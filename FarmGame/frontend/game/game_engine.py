@@ -46,6 +46,11 @@ class GameEngine:
         self.running = True
         self.paused = False
         
+        # Режим брудних прямокутників: перший кадр (і після зміни екрана,
+        # паузи чи відновлення вікна) малюється повністю
+        self.dirty_rendering = DIRTY_RECT_RENDERING
+        self._full_redraw = True
+        
         # Шрифт для паузи
         self.pause_font = get_font(72, bold=True)
         self.pause_hint_font = get_font(24)
@@ -85,10 +90,17 @@ class GameEngine:
         if screen_name in self.screens:
             self.current_screen_name = screen_name
             self.current_screen = self.screens[screen_name]
+            self._full_redraw = True
+            
+            # Екран може оновити дані, що змінились, поки його не було видно
+            on_enter = getattr(self.current_screen, "on_enter", None)
+            if on_enter:
+                on_enter()
     
     def toggle_pause(self):
         """Перемкнути паузу"""
         self.paused = not self.paused
+        self._full_redraw = True
     
     def run(self):
         """Головний ігровий цикл"""
@@ -114,11 +126,18 @@ class GameEngine:
                 self.running = False
                 return
             
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self._full_redraw = True
+            
             if self.current_screen:
                 self.current_screen.handle_event(event)
     
     def _render(self):
         """Рендеринг гри"""
+        if self.dirty_rendering:
+            self._render_dirty()
+            return
+        
         self.screen.fill(COLORS["background"])
         
         if self.current_screen:
@@ -129,6 +148,36 @@ class GameEngine:
         
         pygame.display.flip()
     
+    def _render_dirty(self):
+        """
+        Рендеринг лише змінених областей
+        Екран повідомляє брудні прямокутники (get_dirty_rects), вони
+        перемальовуються з відсіканням і показуються display.update(rects).
+        Якщо нічого не змінилось - кадр не малюється взагалі
+        """
+        get_dirty_rects = getattr(self.current_screen, "get_dirty_rects", None)
+        rects = get_dirty_rects() if get_dirty_rects else None
+        
+        if rects is None or self._full_redraw or (rects and self.paused):
+            self._full_redraw = False
+            self.screen.fill(COLORS["background"])
+            if self.current_screen:
+                self.current_screen.draw(self.screen)
+            if self.paused:
+                self._render_pause_overlay()
+            pygame.display.flip()
+            return
+        
+        if not rects:
+            return
+        
+        # Один прохід малювання, обмежений об'єднанням змінених областей
+        self.screen.set_clip(rects[0].unionall(rects[1:]))
+        self.screen.fill(COLORS["background"])
+        self.current_screen.draw(self.screen)
+        self.screen.set_clip(None)
+        pygame.display.update(rects)
+    
     def _render_pause_overlay(self):
         """Рендеринг оверлею паузи"""
         overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
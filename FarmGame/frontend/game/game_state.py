@@ -4,13 +4,58 @@
 """
 
 import json
+import math
 import os
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, field, asdict
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Any, Set, Tuple
+from dataclasses import dataclass, field, fields, asdict
 from datetime import datetime
 import random
 
 from .constants import *
+from .action_log import ActionLog
+from .autosave import AutosaveScheduler
+from .snapshots import SnapshotRing
+from .save_journal import SaveJournal, META_SUFFIX, HOURLY_ANIMAL_FIELDS, DAILY_ANIMAL_FIELDS
+from .save_format import FORMAT_JSON, read_save_file, write_save_file
+from .achievements import (
+    AchievementEngine, HAPPY_THRESHOLD,
+    EVENT_ANIMAL_BOUGHT, EVENT_ANIMAL_REMOVED, EVENT_MONEY_CHANGED,
+    EVENT_DAY_ADVANCED, EVENT_PRODUCT_SOLD, EVENT_HAPPINESS_RAISED
+)
+
+
+# Рівень будівлі, з якого захист від хвороб більше не зростає (80%)
+MAX_PROTECTION_LEVEL = 8
+
+
+def _sickness_chance(weather: str, season: str, building_level: int) -> float:
+    """Ймовірність захворіти за годину за погоди, сезону та рівня будівлі"""
+    sickness_chance = WEATHER_SICKNESS.get(weather, 0.0) + SEASON_SICKNESS.get(season, 0.0)
+    
+    # Кожен рівень будівлі дає 10% захисту (максимум 80%)
+    protection = min(0.8, building_level * 0.10)
+    return sickness_chance * (1.0 - protection)
+
+
+# Попередньо обчислена таблиця ймовірностей: (погода, сезон, рівень будівлі) -> ймовірність
+SICKNESS_CHANCE_TABLE = {
+    (weather, season, level): _sickness_chance(weather, season, level)
+    for weather in WEATHER_TYPES
+    for season in SEASONS
+    for level in range(MAX_PROTECTION_LEVEL + 1)
+}
+
+
+def _next_event_gap(rng: random.Random, log_q: Optional[float]) -> int:
+    """
+    Кількість кроків до наступної події з імовірністю p на крок
+    (геометричний розподіл, log_q = log(1 - p); None означає p = 1)
+    """
+    if log_q is None:
+        return 1
+    return int(math.log(1.0 - rng.random()) / log_q) + 1
 
 
 @dataclass
@@ -33,13 +78,18 @@ class AnimalData:
     days_on_farm: int = 0
     
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Без asdict: поля прості, а глибоке копіювання повільне на великих стадах
+        return {name: getattr(self, name) for name in ANIMAL_FIELDS}
     
     @staticmethod
     def from_dict(data: dict) -> 'AnimalData':
         return AnimalData(**data)
 
 
+# Імена полів AnimalData у порядку оголошення
+ANIMAL_FIELDS = tuple(f.name for f in fields(AnimalData))
+
+
 @dataclass
 class ProductData:
     """Дані про продукт"""
@@ -111,6 +161,112 @@ class FarmerData:
         return asdict(self)
 
 
+class FarmAggregates:
+    """
+    Кеш агрегатів ферми
+    Оновлюється інкрементально при купівлі, продажу та смерті тварин,
+    русі кормів і покращенні будівель, тож HUD не сканує колекції
+    """
+    
+    ANIMAL_BUILDINGS = ("barn", "coop", "stable")
+    
+    def __init__(self):
+        # Тварини
+        self.living_by_type: Dict[str, int] = {k: 0 for k in ANIMAL_TYPES}
+        self.living_count: int = 0
+        self.living_types: int = 0
+        
+        # Будівлі
+        self.capacity_by_building: Dict[str, int] = {}
+        self.animal_capacity: int = 0
+        self.building_value: float = 0.0
+        
+        # Корми
+        self.feed_total: float = 0.0
+        self.feed_value: float = 0.0
+        
+        # Вартість тварин залежить від здоров'я, яке змінюється щогодини,
+        # тому перераховується ліниво - не частіше разу на ігрову годину
+        self.animal_value: float = 0.0
+        self.animal_value_dirty: bool = True
+    
+    def rebuild(self, animals: List['AnimalData'], feeds: Dict[str, 'FeedData'],
+                buildings: List['BuildingData']):
+        """Повний перерахунок (нова гра, завантаження)"""
+        self.living_by_type = {k: 0 for k in ANIMAL_TYPES}
+        self.living_count = 0
+        self.living_types = 0
+        if hasattr(animals, "count_living_by_type"):
+            # Сховище стада рахує масивами, не створюючи подань тварин
+            for animal_type, count in animals.count_living_by_type().items():
+                self.living_by_type[animal_type] = count
+                self.living_count += count
+                self.living_types += 1 if count else 0
+        else:
+            for animal in animals:
+                if animal.is_alive:
+                    self.animal_added(animal)
+        self.animal_value_dirty = True
+        
+        self.feed_total = 0.0
+        self.feed_value = 0.0
+        for feed in feeds.values():
+            self.feed_changed(feed.feed_type, feed.amount)
+        
+        self.set_buildings(buildings)
+    
+    def animal_added(self, animal: 'AnimalData'):
+        """Жива тварина з'явилась на фермі"""
+        count = self.living_by_type.get(animal.animal_type, 0)
+        if count == 0:
+            self.living_types += 1
+        self.living_by_type[animal.animal_type] = count + 1
+        self.living_count += 1
+        if not self.animal_value_dirty:
+            self.animal_value += self._animal_worth(animal)
+    
+    def animal_removed(self, animal: 'AnimalData'):
+        """Жива тварина зникла з ферми (продаж або смерть)"""
+        count = self.living_by_type.get(animal.animal_type, 0) - 1
+        self.living_by_type[animal.animal_type] = count
+        if count == 0:
+            self.living_types -= 1
+        self.living_count -= 1
+        if not self.animal_value_dirty:
+            self.animal_value -= self._animal_worth(animal)
+    
+    def feed_changed(self, feed_type: str, delta: float):
+        """Зміна кількості корму"""
+        self.feed_total += delta
+        self.feed_value += FEED_TYPES[feed_type]["price"] * delta
+    
+    def set_buildings(self, buildings: List['BuildingData']):
+        """Перерахунок частин, що залежать від будівель (їх лише кілька)"""
+        self.capacity_by_building = {}
+        self.building_value = 0.0
+        for building in buildings:
+            self.capacity_by_building[building.building_type] = (
+                self.capacity_by_building.get(building.building_type, 0) + building.capacity
+            )
+            building_info = BUILDING_TYPES.get(building.building_type, {})
+            self.building_value += building_info.get("base_cost", 5000) * building.level
+        self.animal_capacity = sum(self.capacity_by_building.get(b, 0) for b in self.ANIMAL_BUILDINGS)
+    
+    def get_animal_value(self, animals: List['AnimalData']) -> float:
+        """Вартість живих тварин (перераховується, якщо здоров'я змінилось)"""
+        if self.animal_value_dirty:
+            if hasattr(animals, "living_value"):
+                self.animal_value = animals.living_value()
+            else:
+                self.animal_value = sum(self._animal_worth(a) for a in animals if a.is_alive)
+            self.animal_value_dirty = False
+        return self.animal_value
+    
+    @staticmethod
+    def _animal_worth(animal: 'AnimalData') -> float:
+        return ANIMAL_TYPES[animal.animal_type]["price"] * (animal.health / 100) * 0.7
+
+
 class GameState:
     """
     Головний клас ігрового стану
@@ -138,10 +294,16 @@ class GameState:
         
         # Колекції
         self.animals: List[AnimalData] = []
+        self._animals_by_id: Dict[int, AnimalData] = {}
         self.products: Dict[str, ProductData] = {}
         self.feeds: Dict[str, FeedData] = {}
         self.buildings: List[BuildingData] = []
         self.achievements: Dict[str, bool] = {k: False for k in ACHIEVEMENTS}
+        self.aggregates: FarmAggregates = FarmAggregates()
+        self.achievement_engine: AchievementEngine = AchievementEngine(self)
+        
+        # Ймовірності захворювання за типом тварини для поточних умов
+        self._sickness_table: Optional[Dict[str, float]] = None
         
         # Час
         self.current_day: int = 1
@@ -155,9 +317,9 @@ class GameState:
         self.daily_expenses: float = 0.0
         self.reputation: int = 0
         
-        # Історія подій
-        self.events: List[str] = []
-        self.notifications: List[Dict[str, Any]] = []
+        # Історія подій (кільцеві буфери: старі записи витісняються за O(1))
+        self.events: Deque[str] = deque(maxlen=MAX_EVENTS)
+        self.notifications: Deque[Dict[str, Any]] = deque(maxlen=MAX_NOTIFICATIONS)
         
         # ID лічильник
         self._next_animal_id: int = 1
@@ -165,19 +327,88 @@ class GameState:
         # Час гри
         self.game_speed: float = 1.0
         self.time_accumulated: float = 0.0
+        self.max_catchup_hours: int = MAX_CATCHUP_HOURS
+        
+        # Власний генератор випадкових чисел (зберігається у збереженні)
+        self.seed: int = 0
+        self.rng: random.Random = random.Random(self.seed)
+        
+        # Журнал дій гравця для відтворення сесії
+        self.action_log: ActionLog = ActionLog()
+        
+        # Збереження: повний знімок або знімок + журнал змін
+        self.save_journal: SaveJournal = SaveJournal(SAVE_FILE)
+        self.journaled_saves: bool = JOURNALED_SAVES
+        self.save_format: str = SAVE_FORMAT
+        
+        # Опціональне сховище SQLite зі слотами (замість файлу)
+        self.save_store = None
+        self.save_slot: str = DEFAULT_SAVE_SLOT
+        
+        # Що змінилось з останнього збереження
+        self._dirty_animal_ids: Set[int] = set()
+        self._removed_animal_ids: Set[int] = set()
+        self._living_animals_dirty: bool = False
+        self._all_animals_dirty: bool = False
+        self._saved_log_length: int = 0
+        self._needs_full_save: bool = True
+        
+        # Фоновий запис збережень (один потік - записи йдуть по черзі)
+        self._save_executor: Optional[ThreadPoolExecutor] = None
+        self._pending_save: Optional[Future] = None
+        # Відомості збереження, що зараз пишеться (для меню, без очікування запису)
+        self._pending_metadata: Optional[Dict[str, Any]] = None
+        
+        # Автозбереження (перемикається в налаштуваннях)
+        self.auto_save: bool = AUTO_SAVE
+        self.autosave: AutosaveScheduler = AutosaveScheduler(self)
+        
+        # Прогрес за час відсутності при завантаженні (перемикається в налаштуваннях)
+        self.offline_progress: bool = OFFLINE_PROGRESS
+        self.offline_max_hours: int = OFFLINE_MAX_HOURS
+        
+        # Денні знімки для відкату
+        self.snapshots: SnapshotRing = SnapshotRing(SNAPSHOT_DAYS)
+        # Скільки годин ще лишилось у поточному advance_hours (для знімків)
+        self.advance_remaining: int = 0
+        
+        # Векторизоване сховище стада (опціонально, потрібен NumPy)
+        self.herd = None
+        self._herd_rng = None
     
-    def new_game(self, farm_name: str, farmer_name: str):
-        """Створення нової гри"""
+    def new_game(self, farm_name: str, farmer_name: str, seed: Optional[int] = None):
+        """
+        Створення нової гри
+        seed - зерно генератора; однакове зерно і однакові дії дають однакову гру
+        """
         # Явно скидаємо всі поля (бо __init__ не спрацює через Singleton)
         self.farm_name = farm_name
         self.farmer = FarmerData(name=farmer_name)
         
+        # Генератор і журнал дій
+        if seed is None:
+            seed = random.getrandbits(64)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.action_log = ActionLog(seed, farm_name, farmer_name)
+        if self.herd is not None:
+            self._seed_herd_rng()
+        
+        # Нова гра не має спільного з попереднім знімком - наступне збереження повне
+        self._needs_full_save = True
+        self.autosave.reset()
+        
         # Колекції - скидаємо повністю
         self.animals = []
+        self._animals_by_id = {}
+        if self.herd is not None:
+            self.herd.clear()
+            self._use_herd_animals()
         self.products = {}
         self.feeds = {}
         self.buildings = []
         self.achievements = {k: False for k in ACHIEVEMENTS}
+        self.achievement_engine.reset()
         
         # Час - скидаємо
         self.current_day = 1
@@ -192,8 +423,8 @@ class GameState:
         self.reputation = 0
         
         # Історія подій - скидаємо
-        self.events = []
-        self.notifications = []
+        self.events.clear()
+        self.notifications.clear()
         
         # ID лічильник - скидаємо
         self._next_animal_id = 1
@@ -217,18 +448,72 @@ class GameState:
             "mixed": FeedData("mixed", 20.0)
         }
         
+        self.aggregates.rebuild(self.animals, self.feeds, self.buildings)
+        self._invalidate_sickness_table()
+        
         # Початкове повідомлення
         self.add_event(f"Ласкаво просимо на ферму '{farm_name}'!")
         self.add_notification("Підказка", "Почніть з купівлі тварин у магазині!")
+        
+        self.snapshots.clear()
+        self.snapshots.capture(self)
     
     def update(self, dt: float):
         """Оновлення ігрового стану"""
+        # Відкладене автозбереження (якщо попереднє вже записане)
+        self.autosave.poll()
+        
         self.time_accumulated += dt * self.game_speed
         
         # Кожну "ігрову хвилину" (1 секунда реального часу = 1 година гри)
-        if self.time_accumulated >= 1.0:
-            self.time_accumulated -= 1.0
+        hours = int(self.time_accumulated)
+        if hours <= 0:
+            return
+        
+        # Наздоганяємо відставання, але не більше ліміту за кадр -
+        # решта залишається в time_accumulated на наступні кадри
+        hours = min(hours, self.max_catchup_hours)
+        self.time_accumulated -= hours
+        
+        if hours == 1:
             self._advance_hour()
+        else:
+            self.advance_hours(hours)
+        
+        # Автозбереження, запитане новим днем, - лише після всієї години/пакета
+        self.autosave.poll()
+    
+    def advance_hours(self, hours: int):
+        """
+        Масове просування часу на кілька годин
+        Години в межах одного дня обробляються одним пакетом
+        (погода, сезон і будівлі в цей час не змінюються)
+        """
+        # Пакетний шлях витрачає випадкові числа інакше, ніж погодинний
+        self._record("advance", hours)
+        while hours > 0:
+            if self.current_hour >= 23:
+                # Перехід через північ - звичайний шлях з _advance_day
+                hours -= 1
+                self.advance_remaining = hours
+                self._advance_hour()
+                self.advance_remaining = 0
+                continue
+            
+            batch = min(hours, 23 - self.current_hour)
+            self.current_hour += batch
+            hours -= batch
+            
+            if self.herd is not None:
+                for _ in range(batch):
+                    self._update_herd()
+            else:
+                self._update_animals_bulk(batch)
+        
+        # Відмітки змін - після оновлення, щоб збереження не пропустило його частину
+        self.aggregates.animal_value_dirty = True
+        self._living_animals_dirty = True
+        self.autosave.poll()
     
     def _advance_hour(self):
         """Просування часу на 1 годину"""
@@ -239,9 +524,19 @@ class GameState:
             self._advance_day()
         
         # Оновлення тварин кожну годину
-        for animal in self.animals:
-            if animal.is_alive:
-                self._update_animal(animal)
+        if self.herd is not None:
+            self._update_herd()
+        else:
+            living = [a for a in self.animals if a.is_alive]
+            sick = self._roll_sickness(living)
+            for i, animal in enumerate(living):
+                self._update_animal(animal, sick.get(i, 0.0))
+        self.aggregates.animal_value_dirty = True
+        self._living_animals_dirty = True
+        
+        # Знімок для відкату - після повного оновлення першої години дня
+        if self.current_hour == 0:
+            self.snapshots.capture(self)
     
     def _advance_day(self):
         """Просування часу на 1 день"""
@@ -258,9 +553,13 @@ class GameState:
         self._update_weather()
         
         # Старіння тварин
-        for animal in self.animals:
-            animal.age += 1
-            animal.days_on_farm += 1
+        if self.herd is not None:
+            self.herd.age_one_day()
+        else:
+            for animal in self.animals:
+                animal.age += 1
+                animal.days_on_farm += 1
+        self._all_animals_dirty = True
         
         # Старіння продуктів
         for product in list(self.products.values()):
@@ -272,21 +571,95 @@ class GameState:
         for feed in list(self.feeds.values()):
             feed.days_remaining -= 1
             if feed.days_remaining <= 0 or feed.amount <= 0:
+                self.aggregates.feed_changed(feed.feed_type, -feed.amount)
                 del self.feeds[feed.feed_type]
         
         # Відновлення енергії
         self.farmer.energy = min(self.farmer.max_energy, self.farmer.energy + 30)
         
-        # Перевірка досягнень
-        self._check_achievements()
+        # Перевірка досягнень (лише підписані на новий день)
+        self.achievement_engine.emit(EVENT_DAY_ADVANCED)
+        
+        # Автозбереження раз на ігровий день (запускається після всієї години)
+        self.autosave.on_day_advanced()
         
         # Подія нового дня
         season_name = SEASONS[self.current_season]["name"]
         weather_emoji = WEATHER_TYPES[self.current_weather]["emoji"]
         self.add_event(f"День {self.current_day}. {season_name}. {weather_emoji}")
     
-    def _update_animal(self, animal: AnimalData):
-        """Оновлення стану тварини"""
+    def _update_animals_bulk(self, hours: int):
+        """Оновлення всіх живих тварин одразу на кілька годин"""
+        table = self._get_sickness_table()
+        for animal in self.animals:
+            if animal.is_alive:
+                self._update_animal_bulk(animal, hours, table[animal.animal_type])
+    
+    def _update_animal_bulk(self, animal: AnimalData, hours: int, sickness_chance: float):
+        """
+        Оновлення тварини на кілька годин у замкненій формі
+        Еквівалентно hours викликам _update_animal за незмінних умов
+        """
+        # Години захворювань: геометричні проміжки замість кидка на кожну годину
+        sick_hours = []
+        total_loss = 0.0
+        if sickness_chance > 0:
+            log_q = math.log1p(-sickness_chance) if sickness_chance < 1 else None
+            t = 0
+            while True:
+                t += _next_event_gap(self.rng, log_q)
+                if t > hours:
+                    break
+                loss = self.rng.uniform(0.5, 2.0)
+                sick_hours.append((t, loss))
+                total_loss += loss
+        
+        hunger = animal.hunger
+        happiness = animal.happiness
+        
+        # Перша година, коли голод/щастя опускаються нижче 20
+        hunger_penalty_start = max(1, math.floor(2 * (hunger - 20)) + 1)
+        happiness_penalty_start = max(1, math.floor(5 * (happiness - 20)) + 1)
+        penalty = (max(0, hours - hunger_penalty_start + 1) * 1.0
+                   + max(0, hours - happiness_penalty_start + 1) * 0.5)
+        
+        final_hunger = hunger - 0.5 * hours
+        final_health = animal.health - penalty - total_loss
+        
+        if final_hunger > 0 and final_health > 0:
+            # Тварина точно переживе пакет - рахуємо одразу
+            animal.hunger = final_hunger
+            animal.happiness = max(0, happiness - 0.2 * hours)
+            animal.health = final_health
+            animal.production_cooldown = max(0, animal.production_cooldown - hours)
+            return
+        
+        # Можлива смерть - покроково, з уже визначеним розкладом хвороб
+        health = animal.health
+        sick_idx = 0
+        for t in range(1, hours + 1):
+            hunger = max(0, hunger - 0.5)
+            happiness = max(0, happiness - 0.2)
+            if hunger < 20:
+                health -= 1
+            if happiness < 20:
+                health -= 0.5
+            if sick_idx < len(sick_hours) and sick_hours[sick_idx][0] == t:
+                health = max(0, health - sick_hours[sick_idx][1])
+                sick_idx += 1
+            if health <= 0 or hunger <= 0:
+                break
+        
+        animal.hunger = hunger
+        animal.happiness = happiness
+        animal.health = health
+        animal.production_cooldown = max(0, animal.production_cooldown - t)
+        
+        if health <= 0 or hunger <= 0:
+            self._on_animal_died(animal)
+    
+    def _update_animal(self, animal: AnimalData, sickness_loss: float = 0.0):
+        """Оновлення стану тварини (sickness_loss - втрата здоров'я від хвороби за цю годину)"""
         # Голод зменшується
         animal.hunger -= 0.5
         animal.hunger = max(0, animal.hunger)
@@ -303,77 +676,89 @@ class GameState:
         if animal.happiness < 20:
             animal.health -= 0.5
         
-        # Логіка хворіння залежно від умов
-        self._apply_health_effects(animal)
+        # Хвороба (кидки для всього стада робить _roll_sickness)
+        if sickness_loss > 0:
+            animal.health = max(0, animal.health - sickness_loss)
         
         # Смерть
         if animal.health <= 0 or animal.hunger <= 0:
-            animal.is_alive = False
-            self.add_event(f"{animal.name} ({ANIMAL_TYPES[animal.animal_type]['name']}) помер(ла)!")
+            self._on_animal_died(animal)
         
         # Зменшення кулдауну виробництва
         if animal.production_cooldown > 0:
             animal.production_cooldown -= 1
     
-    def _apply_health_effects(self, animal: AnimalData):
-        """Застосування впливу погоди та будівель на здоров'я"""
-        # Базова ймовірність захворювання
-        sickness_chance = 0.0
-        
-        # Вплив погоди
-        weather_effects = {
-            "sunny": 0.0,
-            "cloudy": 0.005,
-            "rainy": 0.015,
-            "stormy": 0.025,
-            "snowy": 0.02,
-            "foggy": 0.01
-        }
-        sickness_chance += weather_effects.get(self.current_weather, 0.0)
-        
-        # Вплив сезону
-        season_effects = {
-            "spring": 0.005,
-            "summer": 0.0,
-            "autumn": 0.01,
-            "winter": 0.015
-        }
-        sickness_chance += season_effects.get(self.current_season, 0.0)
-        
-        # Захист від будівель - кращі будівлі знижують ймовірність хворіння
-        building_protection = self._get_building_protection(animal.animal_type)
-        sickness_chance *= (1.0 - building_protection)
-        
-        # Випадкове захворювання
-        import random
-        if random.random() < sickness_chance:
-            # Втрата здоров'я від хвороби
-            health_loss = random.uniform(0.5, 2.0)
-            animal.health = max(0, animal.health - health_loss)
-    
-    def _get_building_protection(self, animal_type: str) -> float:
-        """Отримати рівень захисту від будівлі для типу тварини"""
-        # Визначаємо, яка будівля потрібна для цього типу тварини
-        building_map = {
-            "cow": "barn",
-            "pig": "barn",
-            "sheep": "barn",
-            "goat": "barn",
-            "chicken": "coop",
-            "duck": "coop",
-            "rabbit": "coop",
-            "horse": "stable"
-        }
-        
-        building_type = building_map.get(animal_type, "barn")
-        building = next((b for b in self.buildings if b.building_type == building_type), None)
-        
-        if not building:
-            return 0.0  # Немає будівлі - немає захисту
-        
-        # Кожен рівень будівлі дає 10% захисту (максимум 80%)
-        protection = min(0.8, building.level * 0.10)
-        return protection
+    def _update_herd(self):
+        """Оновлення всього стада у векторизованому сховищі"""
+        sickness_by_type = list(self._get_sickness_table().values())
+        died = self.herd.advance_hour(sickness_by_type, self._herd_rng)
+        
+        # Масиви вже позначили всі смерті години - спершу агрегати для всіх,
+        # потім одна подія (досягнення бачать узгоджений стан)
+        for animal in died:
+            self._on_animal_died(animal, already_dead=True, emit=False)
+        if died:
+            self.achievement_engine.emit(EVENT_ANIMAL_REMOVED)
+    
+    def _on_animal_died(self, animal: AnimalData, already_dead: bool = False, emit: bool = True):
+        """Обробка смерті тварини"""
+        if not already_dead:
+            animal.is_alive = False
+        self._dirty_animal_ids.add(animal.id)
+        self.aggregates.animal_removed(animal)
+        self.add_event(f"{animal.name} ({ANIMAL_TYPES[animal.animal_type]['name']}) помер(ла)!")
+        if emit:
+            self.achievement_engine.emit(EVENT_ANIMAL_REMOVED)
+    
+    def _roll_sickness(self, animals: List[AnimalData]) -> Dict[int, float]:
+        """
+        Кидки на захворювання для всього стада одним пакетом
+        Замість random() на кожну тварину - геометричні проміжки між
+        кандидатами з максимальною ймовірністю та проріджування за типом.
+        Повертає {індекс у списку: втрата здоров'я}
+        """
+        table = self._get_sickness_table()
+        p_max = max(table.values(), default=0.0)
+        sick = {}
+        if p_max <= 0 or not animals:
+            return sick
+        
+        log_q = math.log1p(-p_max) if p_max < 1 else None
+        rng = self.rng
+        i = -1
+        while True:
+            i += _next_event_gap(rng, log_q)
+            if i >= len(animals):
+                break
+            chance = table[animals[i].animal_type]
+            if chance >= p_max or rng.random() * p_max < chance:
+                # Втрата здоров'я від хвороби
+                sick[i] = rng.uniform(0.5, 2.0)
+        
+        return sick
+    
+    def _get_sickness_table(self) -> Dict[str, float]:
+        """Ймовірності захворювання за годину для кожного типу тварини"""
+        if self._sickness_table is None:
+            levels: Dict[str, int] = {}
+            for building in self.buildings:
+                levels.setdefault(building.building_type, min(building.level, MAX_PROTECTION_LEVEL))
+            
+            weather, season = self.current_weather, self.current_season
+            table = {}
+            for animal_type in ANIMAL_TYPES:
+                # Немає будівлі - немає захисту (рівень 0)
+                level = levels.get(ANIMAL_BUILDINGS.get(animal_type, "barn"), 0)
+                chance = SICKNESS_CHANCE_TABLE.get((weather, season, level))
+                if chance is None:
+                    chance = _sickness_chance(weather, season, level)
+                table[animal_type] = chance
+            self._sickness_table = table
+        return self._sickness_table
+    
+    def _invalidate_sickness_table(self):
+        """Скинути таблицю хвороб (змінилась погода, сезон або будівлі)"""
+        self._sickness_table = None
     
     def _change_season(self):
         """Зміна пори року"""
@@ -381,6 +766,7 @@ class GameState:
         seasons = ["spring", "summer", "autumn", "winter"]
         current_idx = seasons.index(self.current_season)
         self.current_season = seasons[(current_idx + 1) % 4]
+        self._invalidate_sickness_table()
         
         season_name = SEASONS[self.current_season]["name"]
         season_emoji = SEASONS[self.current_season]["emoji"]
@@ -400,40 +786,8 @@ class GameState:
         weather_types = list(weights.keys())
         probabilities = list(weights.values())
         
-        self.current_weather = random.choices(weather_types, probabilities)[0]
-    
-    def _check_achievements(self):
-        """Перевірка досягнень"""
-        # Перша тварина
-        if len(self.animals) >= 1 and not self.achievements["first_animal"]:
-            self._unlock_achievement("first_animal")
-        
-        # 10 тварин
-        if len(self.animals) >= 10 and not self.achievements["ten_animals"]:
-            self._unlock_achievement("ten_animals")
-        
-        # 50 тварин
-        if len(self.animals) >= 50 and not self.achievements["fifty_animals"]:
-            self._unlock_achievement("fifty_animals")
-        
-        # Багатий фермер
-        if self.farmer.money >= 100000 and not self.achievements["rich_farmer"]:
-            self._unlock_achievement("rich_farmer")
-        
-        # Рік на фермі
-        if self.farmer.days_played >= 365 and not self.achievements["year_passed"]:
-            self._unlock_achievement("year_passed")
-        
-        # Всі типи тварин
-        animal_types_on_farm = set(a.animal_type for a in self.animals if a.is_alive)
-        if len(animal_types_on_farm) >= len(ANIMAL_TYPES) and not self.achievements["all_animals"]:
-            self._unlock_achievement("all_animals")
-        
-        # Щасливі тварини
-        living_animals = [a for a in self.animals if a.is_alive]
-        if living_animals and all(a.happiness > 80 for a in living_animals):
-            if not self.achievements["happy_animals"]:
-                self._unlock_achievement("happy_animals")
+        self.current_weather = self.rng.choices(weather_types, probabilities)[0]
+        self._invalidate_sickness_table()
     
     def _unlock_achievement(self, achievement_id: str):
         """Розблокувати досягнення"""
@@ -445,6 +799,7 @@ class GameState:
                 f"Досягнення: {achievement['name']}",
                 f"{achievement['description']}. Нагорода: {achievement['reward']} грн"
             )
+            self.achievement_engine.emit(EVENT_MONEY_CHANGED)
     
     # ==================== Операції з тваринами ====================
     
@@ -460,11 +815,7 @@ class GameState:
             return None
         
         # Перевірка місткості
-        total_capacity = sum(b.capacity for b in self.buildings 
-                           if b.building_type in ["barn", "coop", "stable"])
-        living_animals = len([a for a in self.animals if a.is_alive])
-        
-        if living_animals >= total_capacity:
+        if self.aggregates.living_count >= self.aggregates.animal_capacity:
             self.add_notification("Помилка", "Недостатньо місця! Покращіть будівлі.")
             return None
         
@@ -479,16 +830,19 @@ class GameState:
             name=name
         )
         self._next_animal_id += 1
-        self.animals.append(animal)
+        animal = self._add_animal(animal)
         
         emoji = ANIMAL_TYPES[animal_type]["emoji"]
         self.add_event(f"{emoji} Куплено {ANIMAL_TYPES[animal_type]['name']}: {name}")
+        self._record("buy", animal_type, name)
+        
+        self.achievement_engine.emit(EVENT_ANIMAL_BOUGHT)
         
         return animal
     
     def sell_animal(self, animal_id: int) -> float:
         """Продати тварину"""
-        animal = next((a for a in self.animals if a.id == animal_id), None)
+        animal = self.get_animal(animal_id)
         if not animal or not animal.is_alive:
             return 0.0
         
@@ -500,19 +854,33 @@ class GameState:
         self.farmer.total_earnings += price
         self.farmer.animals_sold += 1
         
-        self.animals.remove(animal)
+        self._remove_animal(animal)
         
         emoji = ANIMAL_TYPES[animal.animal_type]["emoji"]
         self.add_event(f"{emoji} Продано {animal.name} за {price:.0f} грн")
+        self._record("sell", animal_id)
+        
+        self.achievement_engine.emit(EVENT_MONEY_CHANGED)
+        self.achievement_engine.emit(EVENT_ANIMAL_REMOVED)
         
         return price
     
     def feed_animal(self, animal_id: int, feed_type: str) -> bool:
         """Погодувати тварину"""
-        animal = next((a for a in self.animals if a.id == animal_id), None)
+        animal = self.get_animal(animal_id)
         if not animal or not animal.is_alive:
             return False
         
+        happiness_before = animal.happiness
+        if not self._feed_animal(animal, feed_type):
+            return False
+        
+        self._record("feed", animal_id, feed_type)
+        self._on_happiness_raised(animal, happiness_before)
+        return True
+    
+    def _feed_animal(self, animal: AnimalData, feed_type: str) -> bool:
+        """Погодувати конкретну тварину (без пошуку за id)"""
         if feed_type not in self.feeds or self.feeds[feed_type].amount < 1:
             self.add_notification("Помилка", "Недостатньо корму!")
             return False
@@ -523,37 +891,24 @@ class GameState:
         
         # Годуємо
         self.feeds[feed_type].amount -= 1
+        self.aggregates.feed_changed(feed_type, -1)
         self.farmer.energy -= 5
         
-        # Ефект годування
-        feed_quality = self.feeds[feed_type].quality / 100
-        animal.hunger = min(100, animal.hunger + 30 * feed_quality)
-        animal.happiness = min(100, animal.happiness + 5 * feed_quality)
-        animal.total_fed += 1
-        
+        self._apply_feed(animal, self.feeds[feed_type].quality / 100)
         self.farmer.animals_fed += 1
         
         return True
     
+    def _apply_feed(self, animal: AnimalData, feed_quality: float):
+        """Ефект годування (feed_quality від 0 до 1)"""
+        self._dirty_animal_ids.add(animal.id)
+        animal.hunger = min(100, animal.hunger + 30 * feed_quality)
+        animal.happiness = min(100, animal.happiness + 5 * feed_quality)
+        animal.total_fed += 1
+    
     def feed_all_animals(self) -> int:
         """Погодувати всіх голодних тварин"""
-        fed_count = 0
-        
-        for animal in self.animals:
-            if animal.is_alive and animal.hunger < 70:
-                # Визначаємо улюблений корм
-                preferred = self._get_preferred_feed(animal.animal_type)
-                
-                for feed_type in [preferred, "mixed", "hay", "grain"]:
-                    if feed_type in self.feeds and self.feeds[feed_type].amount >= 1:
-                        if self.feed_animal(animal.id, feed_type):
-                            fed_count += 1
-                            break
-        
-        if fed_count > 0:
-            self.add_event(f"🍽️ Погодовано {fed_count} тварин")
-        
-        return fed_count
+        return self.feed_animals(predicate=lambda a: a.hunger < 70)
     
     def _get_preferred_feed(self, animal_type: str) -> str:
         """Отримати улюблений корм для тварини"""
@@ -571,10 +926,17 @@ class GameState:
     
     def collect_product(self, animal_id: int) -> Optional[ProductData]:
         """Зібрати продукцію від тварини"""
-        animal = next((a for a in self.animals if a.id == animal_id), None)
+        animal = self.get_animal(animal_id)
         if not animal or not animal.is_alive:
             return None
         
+        product = self._collect_product(animal)
+        if product:
+            self._record("collect", animal_id)
+        return product
+    
+    def _collect_product(self, animal: AnimalData) -> Optional[ProductData]:
+        """Зібрати продукцію від конкретної тварини (без пошуку за id)"""
         if animal.production_cooldown > 0:
             return None
         
@@ -587,8 +949,17 @@ class GameState:
         
         # Збираємо продукцію
         self.farmer.energy -= 10
+        product = self._produce(animal)
         
         animal_info = ANIMAL_TYPES[animal.animal_type]
+        emoji = animal_info["product_emoji"]
+        self.add_event(f"{emoji} Зібрано {animal_info['product']} від {animal.name}")
+        
+        return product
+    
+    def _produce(self, animal: AnimalData) -> ProductData:
+        """Отримати продукцію від тварини і покласти на склад (без перевірок)"""
+        self._dirty_animal_ids.add(animal.id)
         product_type = animal.animal_type + "_product"
         
         # Кількість залежить від стану тварини
@@ -620,31 +991,26 @@ class GameState:
         
         self.farmer.products_collected += 1
         
-        emoji = animal_info["product_emoji"]
-        self.add_event(f"{emoji} Зібрано {animal_info['product']} від {animal.name}")
-        
         return product
     
     def collect_all_products(self) -> int:
         """Зібрати всю продукцію"""
-        collected = 0
-        
-        for animal in self.animals:
-            if self.collect_product(animal.id):
-                collected += 1
-        
-        return collected
+        return self.collect_products()
     
     def pet_animal(self, animal_id: int):
         """Погладити тварину"""
-        animal = next((a for a in self.animals if a.id == animal_id), None)
+        animal = self.get_animal(animal_id)
         if animal and animal.is_alive:
+            happiness_before = animal.happiness
+            self._dirty_animal_ids.add(animal.id)
             animal.happiness = min(100, animal.happiness + 10)
             self.farmer.energy -= 2
+            self._record("pet", animal_id)
+            self._on_happiness_raised(animal, happiness_before)
     
     def heal_animal(self, animal_id: int) -> float:
         """Лікувати тварину"""
-        animal = next((a for a in self.animals if a.id == animal_id), None)
+        animal = self.get_animal(animal_id)
         if not animal or not animal.is_alive:
             return 0.0
         
@@ -656,13 +1022,260 @@ class GameState:
         
         self.farmer.money -= cost
         self.farmer.total_spending += cost
+        self.aggregates.animal_value_dirty = True
+        happiness_before = animal.happiness
+        self._dirty_animal_ids.add(animal.id)
         animal.health = 100
         animal.happiness = min(100, animal.happiness + 10)
         
         self.add_event(f"💊 {animal.name} вилікувано! (-{cost:.0f} грн)")
+        self._record("heal", animal_id)
+        self._on_happiness_raised(animal, happiness_before)
         
         return cost
     
+    # ==================== Пакетні операції ====================
+    
+    def _select_animals(self, animal_ids: Optional[Iterable[int]],
+                        predicate: Optional[Callable[[AnimalData], bool]]) -> List[AnimalData]:
+        """Живі тварини з вибірки (None - все стадо), що задовольняють умову"""
+        if animal_ids is None:
+            candidates = self.animals
+        else:
+            candidates = [a for a in map(self.get_animal, animal_ids) if a is not None]
+        
+        if predicate is None:
+            return [a for a in candidates if a.is_alive]
+        return [a for a in candidates if a.is_alive and predicate(a)]
+    
+    def feed_animals(self, animal_ids: Optional[Iterable[int]] = None,
+                     predicate: Optional[Callable[[AnimalData], bool]] = None) -> int:
+        """
+        Погодувати вибрані тварини за один прохід
+        Кожна отримує улюблений корм, якщо він є, інакше mixed/hay/grain.
+        Енергія і корм перевіряються один раз, подія - одна на весь пакет.
+        Повертає кількість погодованих тварин
+        """
+        animals = self._select_animals(animal_ids, predicate)
+        if not animals:
+            return 0
+        
+        # Скільки годувань дозволяє енергія (5 на тварину)
+        energy = self.farmer.energy
+        budget = int(energy // 5) if energy >= 5 else 0
+        
+        # Залишки і якість кормів - локально, без пошуку в словнику на кожну тварину
+        stock = {k: f.amount for k, f in self.feeds.items()}
+        quality = {k: f.quality / 100 for k, f in self.feeds.items()}
+        orders: Dict[str, List[str]] = {}
+        used: Dict[str, int] = {}
+        fed_ids = []
+        out_of_energy = False
+        
+        for animal in animals:
+            if len(fed_ids) >= budget:
+                out_of_energy = True
+                break
+            
+            order = orders.get(animal.animal_type)
+            if order is None:
+                preferred = self._get_preferred_feed(animal.animal_type)
+                order = orders[animal.animal_type] = [preferred, "mixed", "hay", "grain"]
+            
+            for feed_type in order:
+                if stock.get(feed_type, 0) >= 1:
+                    stock[feed_type] -= 1
+                    used[feed_type] = used.get(feed_type, 0) + 1
+                    self._apply_feed(animal, quality[feed_type])
+                    fed_ids.append(animal.id)
+                    break
+        
+        if out_of_energy:
+            self.add_notification("Помилка", "Недостатньо енергії!")
+        
+        if not fed_ids:
+            return 0
+        
+        for feed_type, count in used.items():
+            self.feeds[feed_type].amount -= count
+            self.aggregates.feed_changed(feed_type, -count)
+        self.farmer.energy -= 5 * len(fed_ids)
+        self.farmer.animals_fed += len(fed_ids)
+        
+        self.add_event(f"🍽️ Погодовано {len(fed_ids)} тварин")
+        self._record("feed_many", fed_ids)
+        self.achievement_engine.emit(EVENT_HAPPINESS_RAISED)
+        
+        return len(fed_ids)
+    
+    def collect_products(self, animal_ids: Optional[Iterable[int]] = None,
+                         predicate: Optional[Callable[[AnimalData], bool]] = None) -> int:
+        """
+        Зібрати продукцію від вибраних тварин за один прохід
+        Повертає кількість тварин, від яких зібрано продукцію
+        """
+        animals = self._select_animals(animal_ids, predicate)
+        
+        ready = [a for a in animals
+                 if a.production_cooldown <= 0 and a.hunger >= 30 and a.health >= 20]
+        if not ready:
+            return 0
+        
+        # Кожен збір коштує 10 енергії
+        energy = self.farmer.energy
+        budget = int(energy // 10) if energy >= 10 else 0
+        if budget == 0:
+            self.add_notification("Помилка", "Недостатньо енергії!")
+            return 0
+        
+        ready = ready[:budget]
+        for animal in ready:
+            self._produce(animal)
+        self.farmer.energy -= 10 * len(ready)
+        
+        self.add_event(f"🧺 Зібрано продукцію від {len(ready)} тварин")
+        self._record("collect_many", [a.id for a in ready])
+        
+        return len(ready)
+    
+    def heal_animals(self, animal_ids: Optional[Iterable[int]] = None,
+                     predicate: Optional[Callable[[AnimalData], bool]] = None) -> Tuple[int, float]:
+        """
+        Вилікувати вибраних тварин за один прохід
+        Тварини, на яких не вистачає грошей, пропускаються.
+        Повертає (кількість вилікуваних, загальна вартість)
+        """
+        animals = self._select_animals(animal_ids, predicate)
+        
+        money = self.farmer.money
+        total_cost = 0.0
+        healed_ids = []
+        skipped = 0
+        
+        for animal in animals:
+            cost = (100 - animal.health) * 5
+            if cost <= 0:
+                continue
+            if money - total_cost < cost:
+                skipped += 1
+                continue
+            
+            total_cost += cost
+            self._dirty_animal_ids.add(animal.id)
+            animal.health = 100
+            animal.happiness = min(100, animal.happiness + 10)
+            healed_ids.append(animal.id)
+        
+        if skipped:
+            self.add_notification("Помилка", f"Недостатньо грошей, щоб вилікувати ще {skipped} тварин")
+        
+        if not healed_ids:
+            return 0, 0.0
+        
+        self.farmer.money -= total_cost
+        self.farmer.total_spending += total_cost
+        self.aggregates.animal_value_dirty = True
+        
+        self.add_event(f"💊 Вилікувано {len(healed_ids)} тварин (-{total_cost:.0f} грн)")
+        self._record("heal_many", healed_ids)
+        self.achievement_engine.emit(EVENT_HAPPINESS_RAISED)
+        
+        return len(healed_ids), total_cost
+    
+    def _on_happiness_raised(self, animal: AnimalData, happiness_before: float):
+        """Подія для досягнень, якщо щастя тварини перетнуло поріг"""
+        if happiness_before <= HAPPY_THRESHOLD < animal.happiness:
+            self.achievement_engine.emit(EVENT_HAPPINESS_RAISED)
+    
+    def get_animal(self, animal_id: int) -> Optional[AnimalData]:
+        """
+        Отримати тварину за id (O(1))
+        У сховищі стада індекс заповнюється ліниво - подання створюються
+        лише для тварин, до яких звертались
+        """
+        animal = self._animals_by_id.get(animal_id)
+        if animal is None and self.herd is not None:
+            animal = self.herd.find(animal_id)
+            if animal is not None:
+                self._animals_by_id[animal_id] = animal
+        return animal
+    
+    def _add_animal(self, animal: AnimalData) -> AnimalData:
+        """Додати тварину до колекції (і до сховища стада, якщо воно увімкнене)"""
+        if self.herd is not None:
+            animal = self.herd.add(animal)
+        else:
+            self.animals.append(animal)
+        self._animals_by_id[animal.id] = animal
+        self._dirty_animal_ids.add(animal.id)
+        self._removed_animal_ids.discard(animal.id)
+        if animal.is_alive:
+            self.aggregates.animal_added(animal)
+        return animal
+    
+    def _remove_animal(self, animal: AnimalData):
+        """Видалити тварину з колекції"""
+        if self.herd is None:
+            self.animals.remove(animal)
+        self._animals_by_id.pop(animal.id, None)
+        self._dirty_animal_ids.discard(animal.id)
+        self._removed_animal_ids.add(animal.id)
+        if animal.is_alive:
+            self.aggregates.animal_removed(animal)
+        if self.herd is not None:
+            self.herd.remove(animal)
+    
+    def _set_animals(self, animals: List[AnimalData]):
+        """Замінити всю колекцію тварин і перебудувати індекс за id"""
+        self.animals = animals
+        self._animals_by_id = {a.id: a for a in animals}
+    
+    def _use_herd_animals(self):
+        """Колекція тварин - сховище стада (індекс за id заповнюється ліниво)"""
+        self.animals = self.herd.animals
+        self._animals_by_id = {}
+    
+    # ==================== Сховище стада ====================
+    
+    def enable_herd_store(self, enabled: bool = True, seed: Optional[int] = None) -> bool:
+        """
+        Увімкнути/вимкнути векторизоване сховище стада (NumPy)
+        Повертає False, якщо NumPy недоступний
+        """
+        from . import herd_store
+        
+        if not enabled:
+            if self.herd is not None:
+                self._set_animals([a.to_animal_data() for a in self.animals])
+                self.herd.clear()
+                self.herd = None
+                self._herd_rng = None
+            return True
+        
+        if not herd_store.is_available():
+            return False
+        
+        if self.herd is None:
+            self.herd = herd_store.HerdStore(capacity=max(64, len(self.animals)))
+        self._seed_herd_rng(seed)
+        self._rebuild_herd()
+        return True
+    
+    def _seed_herd_rng(self, seed: Optional[int] = None):
+        """Генератор NumPy для стада, за замовчуванням - із генератора гри"""
+        from . import herd_store
+        
+        if seed is None:
+            seed = self.rng.getrandbits(64)
+        self._herd_rng = herd_store.make_rng(seed)
+    
+    def _rebuild_herd(self):
+        """Перенести поточний список тварин у сховище стада"""
+        animals = [a.to_animal_data() if hasattr(a, "to_animal_data") else a for a in self.animals]
+        self.herd.clear()
+        self.herd.extend(animals)
+        self._use_herd_animals()
+    
     # ==================== Операції з кормами ====================
     
     def buy_feed(self, feed_type: str, amount: float) -> bool:
@@ -672,7 +1285,7 @@ class GameState:
         
         # Перевірка місткості складу
         warehouse_capacity = self._get_warehouse_capacity()
-        current_feed_total = sum(feed.amount for feed in self.feeds.values())
+        current_feed_total = self.aggregates.feed_total
         
         if current_feed_total + amount > warehouse_capacity:
             self.add_notification("Помилка", f"Недостатньо місця на складі! Місткість: {warehouse_capacity} кг")
@@ -691,20 +1304,22 @@ class GameState:
             self.feeds[feed_type].amount += amount
         else:
             self.feeds[feed_type] = FeedData(feed_type, amount)
+        self.aggregates.feed_changed(feed_type, amount)
         
         emoji = FEED_TYPES[feed_type]["emoji"]
         self.add_event(f"{emoji} Куплено {FEED_TYPES[feed_type]['name']}: {amount} кг")
+        self._record("buy_feed", feed_type, amount)
         
         return True
     
     def _get_warehouse_capacity(self) -> float:
         """Отримати загальну місткість складу для кормів"""
-        warehouse = next((b for b in self.buildings if b.building_type == "warehouse"), None)
-        if not warehouse:
+        warehouse_capacity = self.aggregates.capacity_by_building.get("warehouse")
+        if warehouse_capacity is None:
             return 200.0  # Базова місткість без складу
         
         # Базова місткість + бонус за рівень
-        return warehouse.capacity * 2.0  # capacity вже зростає з рівнем
+        return warehouse_capacity * 2.0  # capacity вже зростає з рівнем
     
     # ==================== Операції з продукцією ====================
     
@@ -745,10 +1360,11 @@ class GameState:
         self.daily_income += price
         
         self.add_event(f"💰 Продано продукцію за {price:.0f} грн")
+        self._record("sell_product", product_type, amount)
         
-        # Перевірка досягнення
-        if not self.achievements["first_sale"]:
-            self._unlock_achievement("first_sale")
+        # Перевірка досягнень
+        self.achievement_engine.emit(EVENT_PRODUCT_SOLD)
+        self.achievement_engine.emit(EVENT_MONEY_CHANGED)
         
         return price
     
@@ -783,22 +1399,30 @@ class GameState:
         self.farmer.total_spending += cost
         building.level += 1
         building.capacity = int(building.capacity * 1.5)
+        self.aggregates.set_buildings(self.buildings)
+        self._invalidate_sickness_table()
         
         emoji = building_info.get("emoji", "🏠")
         self.add_event(f"{emoji} {building.name} покращено до рівня {building.level}!")
+        self._record("upgrade", building_type)
         
         return True
     
     # ==================== Утиліти ====================
     
+    def get_game_hour(self) -> int:
+        """Абсолютна ігрова година від початку гри"""
+        return (self.current_day - 1) * 24 + self.current_hour
+    
+    def _record(self, action: str, *args):
+        """Записати дію гравця в журнал"""
+        self.action_log.record(self.get_game_hour(), action, *args)
+    
     def add_event(self, message: str):
         """Додати подію в історію"""
         timestamp = f"[День {self.current_day}, {self.current_hour}:00]"
+        # Буфер обмежений MAX_EVENTS - найстаріша подія витісняється сама
         self.events.append(f"{timestamp} {message}")
-        
-        # Обмежуємо розмір історії
-        if len(self.events) > 100:
-            self.events = self.events[-100:]
     
     def add_notification(self, title: str, message: str):
         """Додати сповіщення"""
@@ -807,66 +1431,77 @@ class GameState:
             "message": message,
             "time": datetime.now().isoformat()
         })
+    
+    def drain_notifications(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Забрати накопичені сповіщення (найстаріші першими)
+        Викликається раз на кадр; limit обмежує кількість за кадр,
+        решта залишається на наступні кадри
+        """
+        notifications = self.notifications
+        if limit is None or limit >= len(notifications):
+            drained = list(notifications)
+            notifications.clear()
+            return drained
+        return [notifications.popleft() for _ in range(limit)]
+    
+    # ==================== Відкат ====================
+    
+    def get_rollback_days(self) -> List[int]:
+        """Дні, на початок яких можна відкотити гру (від найновішого)"""
+        return self.snapshots.days()
+    
+    def rollback(self, days_back: int = 1) -> bool:
+        """
+        Відкотити гру на початок дня days_back днів тому (1 - поточного)
+        Працює з пам'яттю, без диска. Журнал дій обрізається до знімка,
+        тож сесію після відкату так само можна відтворити
+        """
+        snapshot = self.snapshots.get(days_back)
+        if snapshot is None:
+            return False
+        
+        self.wait_for_saves()
+        self._apply_save_data(snapshot.to_save_data(self.action_log.to_dict()))
+        self.snapshots.drop_newer(snapshot)
+        self.time_accumulated = 0.0
         
-        # Обмежуємо кількість
-        if len(self.notifications) > 20:
-            self.notifications = self.notifications[-20:]
+        # Журнал змін не вміє описати відкат - наступне збереження повне
+        self._needs_full_save = True
+        
+        self.add_event(f"⏪ Гру відкочено на початок дня {snapshot.day}")
+        self.add_notification("Відкат", f"Повернулись на початок дня {snapshot.day}")
+        return True
     
     def get_total_capacity(self) -> int:
         """Отримати загальну місткість для тварин"""
-        return sum(b.capacity for b in self.buildings 
-                   if b.building_type in ["barn", "coop", "stable"])
+        return self.aggregates.animal_capacity
     
     def get_living_animals_count(self) -> int:
         """Отримати кількість живих тварин"""
-        return len([a for a in self.animals if a.is_alive])
+        return self.aggregates.living_count
     
     def get_net_worth(self) -> float:
         """Отримати загальну вартість ферми"""
         worth = self.farmer.money
         
         # Вартість тварин
-        for animal in self.animals:
-            if animal.is_alive:
-                worth += ANIMAL_TYPES[animal.animal_type]["price"] * (animal.health / 100) * 0.7
+        worth += self.aggregates.get_animal_value(self.animals)
         
         # Вартість кормів
-        for feed in self.feeds.values():
-            worth += FEED_TYPES[feed.feed_type]["price"] * feed.amount
+        worth += self.aggregates.feed_value
         
         # Вартість будівель
-        for building in self.buildings:
-            building_info = BUILDING_TYPES.get(building.building_type, {})
-            base_cost = building_info.get("base_cost", 5000)
-            worth += base_cost * building.level
+        worth += self.aggregates.building_value
         
         return worth
     
     # ==================== Збереження/Завантаження ====================
     
     def save_game(self) -> bool:
-        """Зберегти гру"""
+        """Зберегти гру і дочекатися завершення запису"""
         try:
-            data = {
-                "farm_name": self.farm_name,
-                "farmer": self.farmer.to_dict(),
-                "animals": [a.to_dict() for a in self.animals],
-                "products": {k: v.to_dict() for k, v in self.products.items()},
-                "feeds": {k: v.to_dict() for k, v in self.feeds.items()},
-                "buildings": [b.to_dict() for b in self.buildings],
-                "achievements": self.achievements,
-                "current_day": self.current_day,
-                "current_hour": self.current_hour,
-                "current_season": self.current_season,
-                "current_weather": self.current_weather,
-                "days_in_season": self.days_in_season,
-                "reputation": self.reputation,
-                "next_animal_id": self._next_animal_id,
-                "saved_at": datetime.now().isoformat()
-            }
-            
-            with open(SAVE_FILE, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            self.save_game_async().result()
             
             self.add_notification("Збережено", "Гру успішно збережено!")
             return True
@@ -874,36 +1509,349 @@ class GameState:
             self.add_notification("Помилка", f"Не вдалося зберегти: {e}")
             return False
     
+    def save_game_async(self) -> Future:
+        """
+        Зберегти гру без блокування кадру
+        Знімок стану береться тут, на головному потоці; серіалізація
+        і запис (тимчасовий файл + перейменування) - у фоновому потоці.
+        У режимі журналу (journaled_saves) і в сховищі SQLite пишуться лише
+        зміни з минулого збереження; повний знімок - вперше і після нової гри.
+        Повертає Future, що завершується після запису на диск
+        """
+        store = self.save_store
+        incremental = not self._needs_full_save and (store is not None or self.journaled_saves)
+        data = self._build_save_delta() if incremental else self._build_save_data()
+        metadata = self._build_save_metadata()
+        self._pending_metadata = metadata
+        self._mark_saved()
+        
+        if self._save_executor is None:
+            self._save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="save")
+        self._pending_save = self._save_executor.submit(
+            self._write_save, data, metadata, incremental, store, self.save_slot
+        )
+        return self._pending_save
+    
+    def _write_save(self, data: Dict[str, Any], metadata: Dict[str, Any],
+                    incremental: bool, store, slot: str):
+        """Робота фонового потоку: записати знімок або лише зміни"""
+        try:
+            if store is not None:
+                # У SQLite відомості про слот - стовпці таблиці farms
+                store.save(slot, data, incremental=incremental)
+                return
+            
+            if incremental:
+                self.save_journal.append(data)
+            else:
+                self.save_journal.write_snapshot(data, self.save_format)
+            write_save_file(SAVE_FILE + META_SUFFIX, metadata, FORMAT_JSON)
+        except Exception:
+            # Зміни вже не відмічені як брудні - наступне збереження буде повним
+            self._needs_full_save = True
+            raise
+    
+    def wait_for_saves(self):
+        """Дочекатися завершення фонових збережень"""
+        pending = self._pending_save
+        if pending is not None:
+            # Помилку вже отримав той, хто чекає на Future
+            pending.exception()
+    
+    def _save_in_progress(self) -> bool:
+        """Чи пишеться зараз збереження у фоновому потоці"""
+        pending = self._pending_save
+        return pending is not None and not pending.done()
+    
     def load_game(self) -> bool:
-        """Завантажити гру"""
-        if not os.path.exists(SAVE_FILE):
+        """Завантажити гру (знімок + журнал змін; формат визначається автоматично)"""
+        self.wait_for_saves()
+        if not self.has_save_file():
             return False
         
         try:
-            with open(SAVE_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            self.farm_name = data["farm_name"]
-            self.farmer = FarmerData(**data["farmer"])
-            self.animals = [AnimalData.from_dict(a) for a in data["animals"]]
-            self.products = {k: ProductData(**v) for k, v in data["products"].items()}
-            self.feeds = {k: FeedData(**v) for k, v in data["feeds"].items()}
-            self.buildings = [BuildingData(**b) for b in data["buildings"]]
-            self.achievements = data["achievements"]
-            self.current_day = data["current_day"]
-            self.current_hour = data["current_hour"]
-            self.current_season = data["current_season"]
-            self.current_weather = data["current_weather"]
-            self.days_in_season = data["days_in_season"]
-            self.reputation = data["reputation"]
-            self._next_animal_id = data["next_animal_id"]
+            if self.save_store is not None:
+                data = self.save_store.load(self.save_slot)
+            elif self.herd is not None and self.save_journal.is_binary():
+                # Велике стадо: тварини з mmap прямо у масиви, без словників
+                data = self.save_journal.load_mapped(self.herd)
+            else:
+                data = self.save_journal.load()
+            self._apply_save_data(data)
+            self.snapshots.clear()
+            self.snapshots.capture(self)
             
             self.add_notification("Завантажено", "Гру успішно завантажено!")
+            if self.offline_progress:
+                self.apply_offline_progress(data.get("saved_at"))
             return True
         except Exception as e:
             self.add_notification("Помилка", f"Не вдалося завантажити: {e}")
             return False
     
+    def get_offline_hours(self, saved_at: Optional[str], now: Optional[datetime] = None) -> int:
+        """Ігрові години, що минули від збереження (з урахуванням швидкості і ліміту)"""
+        if not saved_at:
+            return 0
+        try:
+            elapsed = ((now or datetime.now()) - datetime.fromisoformat(saved_at)).total_seconds()
+        except (TypeError, ValueError):
+            return 0
+        # 1 секунда реального часу = 1 година гри (як у update)
+        hours = int(elapsed * self.game_speed)
+        return max(0, min(hours, self.offline_max_hours))
+    
+    def apply_offline_progress(self, saved_at: Optional[str],
+                               now: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
+        """
+        Наздогнати час, що минув від збереження, масовим advance_hours
+        Підсумок (загиблі тварини, готова продукція, зіпсовані продукти
+        і корми) показується сповіщенням; None, якщо наздоганяти нічого
+        """
+        hours = self.get_offline_hours(saved_at, now)
+        if hours <= 0:
+            return None
+        
+        living_before = self.aggregates.living_count
+        products_before = {k: p.amount for k, p in self.products.items()}
+        feeds_before = {k: f.amount for k, f in self.feeds.items()}
+        
+        self.advance_hours(hours)
+        
+        # Нова продукція не з'являється сама - зникнути могла лише зіпсована
+        spoiled_products = sum(a for k, a in products_before.items() if k not in self.products)
+        spoiled_feeds = sum(a for k, a in feeds_before.items() if k not in self.feeds)
+        summary = {
+            "hours": hours,
+            "died": living_before - self.aggregates.living_count,
+            "ready": self._count_ready_animals(),
+            "spoiled_products": spoiled_products,
+            "spoiled_feeds": spoiled_feeds,
+        }
+        
+        self.add_notification(
+            "Поки вас не було",
+            f"Минуло {hours} год. Загинуло тварин: {summary['died']}. "
+            f"Готові до збору: {summary['ready']}. "
+            f"Зіпсувалось продуктів: {spoiled_products:.0f}, кормів: {spoiled_feeds:.0f}."
+        )
+        return summary
+    
+    def _count_ready_animals(self) -> int:
+        """Живі тварини, у яких можна зібрати продукцію"""
+        if self.herd is not None:
+            return self.herd.count_living_ready()
+        return sum(1 for a in self.animals if a.is_alive and a.production_cooldown == 0)
+    
+    def _build_save_metadata(self) -> Dict[str, Any]:
+        """Короткі відомості про збереження для головного меню"""
+        return {
+            "slot": self.save_slot,
+            "farm_name": self.farm_name,
+            "current_day": self.current_day,
+            "current_season": self.current_season,
+            "money": self.farmer.money,
+            "herd_size": self.aggregates.living_count,
+            "saved_at": datetime.now().isoformat()
+        }
+    
+    def get_save_metadata(self) -> Optional[Dict[str, Any]]:
+        """
+        Відомості про поточний слот збереження без завантаження гри
+        None, якщо збереження немає або воно створене до появи відомостей.
+        Не чекає на фоновий запис: поки він іде, відомості вже відомі
+        """
+        if self._save_in_progress():
+            return dict(self._pending_metadata)
+        if self.save_store is not None:
+            return next((s for s in self.save_store.list_slots() if s["slot"] == self.save_slot), None)
+        
+        meta_path = SAVE_FILE + META_SUFFIX
+        if not os.path.exists(SAVE_FILE) or not os.path.exists(meta_path):
+            return None
+        try:
+            metadata, _ = read_save_file(meta_path)
+            return metadata
+        except (OSError, ValueError):
+            return None
+    
+    def list_save_slots(self) -> List[Dict[str, Any]]:
+        """Відомості про всі слоти (для файлу - єдиний слот)"""
+        self.wait_for_saves()
+        if self.save_store is not None:
+            return self.save_store.list_slots()
+        metadata = self.get_save_metadata()
+        return [metadata] if metadata else []
+    
+    def _build_state_data(self) -> Dict[str, Any]:
+        """Усі дані збереження, крім тварин і журналу дій (невеликі секції)"""
+        return {
+            "farm_name": self.farm_name,
+            "farmer": self.farmer.to_dict(),
+            "products": {k: v.to_dict() for k, v in self.products.items()},
+            "feeds": {k: v.to_dict() for k, v in self.feeds.items()},
+            "buildings": [b.to_dict() for b in self.buildings],
+            "achievements": dict(self.achievements),
+            "current_day": self.current_day,
+            "current_hour": self.current_hour,
+            "current_season": self.current_season,
+            "current_weather": self.current_weather,
+            "days_in_season": self.days_in_season,
+            "reputation": self.reputation,
+            "next_animal_id": self._next_animal_id,
+            "rng": {"seed": self.seed, "state": self.rng.getstate()},
+            "herd_rng": self._herd_rng.bit_generator.state if self._herd_rng is not None else None,
+            "events": list(self.events),
+            "saved_at": datetime.now().isoformat()
+        }
+    
+    def _build_save_data(self) -> Dict[str, Any]:
+        """Повний знімок стану гри"""
+        data = self._build_state_data()
+        if self.herd is not None:
+            data["animals"] = self.herd.to_dicts()
+        else:
+            data["animals"] = [a.to_dict() for a in self.animals]
+        data["action_log"] = self.action_log.to_dict()
+        return data
+    
+    def _build_save_delta(self) -> Dict[str, Any]:
+        """
+        Запис журналу: повні записи лише тварин, змінених діями гравця;
+        плин часу - стовпцями змінених ним полів (animal_columns)
+        """
+        dirty = self._dirty_animal_ids
+        if self.herd is not None:
+            # Словники беруться прямо з масивів стада
+            animals = self.herd.to_dicts(self.herd.slots_of(dirty)) if dirty else []
+        else:
+            animals = [a.to_dict() for a in map(self.get_animal, dirty) if a is not None]
+        
+        delta = {
+            "state": self._build_state_data(),
+            "animals": animals,
+            "removed_animals": list(self._removed_animal_ids),
+            "action_log_entries": self.action_log.entries[self._saved_log_length:]
+        }
+        
+        if self._all_animals_dirty or self._living_animals_dirty:
+            # Новий день змінює вік усіх тварин, година - стан лише живих
+            fields = HOURLY_ANIMAL_FIELDS + (DAILY_ANIMAL_FIELDS if self._all_animals_dirty else ())
+            living_only = not self._all_animals_dirty
+            if self.herd is not None:
+                columns = self.herd.field_columns(fields, living_only, dirty)
+            else:
+                timed = [a for a in self.animals
+                         if (a.is_alive or not living_only) and a.id not in dirty]
+                columns = {"id": [a.id for a in timed]}
+                for name in fields:
+                    columns[name] = [getattr(a, name) for a in timed]
+            delta["animal_columns"] = columns
+        return delta
+    
+    def has_unsaved_changes(self) -> bool:
+        """Чи змінилось щось з останнього збереження"""
+        return (
+            self._needs_full_save
+            or self._all_animals_dirty
+            or self._living_animals_dirty
+            or bool(self._dirty_animal_ids)
+            or bool(self._removed_animal_ids)
+            or len(self.action_log) != self._saved_log_length
+        )
+    
+    def _mark_saved(self):
+        """Скинути відмітки змін після збереження"""
+        self._dirty_animal_ids = set()
+        self._removed_animal_ids = set()
+        self._living_animals_dirty = False
+        self._all_animals_dirty = False
+        self._saved_log_length = len(self.action_log)
+        self._needs_full_save = False
+    
+    def _apply_save_data(self, data: Dict[str, Any]):
+        """Відновити стан гри з даних збереження"""
+        self.farm_name = data["farm_name"]
+        self.farmer = FarmerData(**data["farmer"])
+        if "animals" not in data:
+            # Тварини вже завантажені у сховище стада (load_mapped)
+            self._use_herd_animals()
+        else:
+            self._set_animals([AnimalData.from_dict(a) for a in data["animals"]])
+            if self.herd is not None:
+                self._rebuild_herd()
+        self.products = {k: ProductData(**v) for k, v in data["products"].items()}
+        self.feeds = {k: FeedData(**v) for k, v in data["feeds"].items()}
+        self.buildings = [BuildingData(**b) for b in data["buildings"]]
+        self.achievements = data["achievements"]
+        self.current_day = data["current_day"]
+        self.current_hour = data["current_hour"]
+        self.current_season = data["current_season"]
+        self.current_weather = data["current_weather"]
+        self.days_in_season = data["days_in_season"]
+        self.reputation = data["reputation"]
+        self._next_animal_id = data["next_animal_id"]
+        self._load_rng(data.get("rng"))
+        self._load_herd_rng(data.get("herd_rng"))
+        self.action_log = ActionLog.from_dict(data.get("action_log"))
+        self.events.clear()
+        self.events.extend(data.get("events", []))
+        self.aggregates.rebuild(self.animals, self.feeds, self.buildings)
+        self._invalidate_sickness_table()
+        self.achievement_engine.reset()
+        self.achievement_engine.check_all()
+        self.autosave.reset()
+        self._mark_saved()
+    
+    def _load_rng(self, rng_data: Optional[Dict[str, Any]]):
+        """Відновити генератор зі збереження (старі збереження - нове зерно)"""
+        if not rng_data:
+            self.seed = random.getrandbits(64)
+            self.rng = random.Random(self.seed)
+            return
+        
+        self.seed = rng_data["seed"]
+        version, internal_state, gauss_next = rng_data["state"]
+        self.rng = random.Random()
+        self.rng.setstate((version, tuple(internal_state), gauss_next))
+    
+    def _load_herd_rng(self, state: Optional[Dict[str, Any]]):
+        """Відновити генератор стада (старі збереження - зерно гри, без витрат self.rng)"""
+        if self.herd is None:
+            return
+        self._seed_herd_rng(self.seed)
+        if state is not None:
+            self._herd_rng.bit_generator.state = state
+    
     def has_save_file(self) -> bool:
-        """Перевірити наявність файлу збереження"""
+        """Перевірити наявність збереження (файлу або слота в SQLite) без очікування запису"""
+        if self._save_in_progress():
+            return True
+        if self.save_store is not None:
+            return self.save_store.has_slot(self.save_slot)
         return os.path.exists(SAVE_FILE)
+    
+    def use_sqlite_store(self, path: Optional[str] = SAVE_DB_FILE,
+                         slot: str = DEFAULT_SAVE_SLOT) -> bool:
+        """
+        Зберігати гру в базі SQLite у вказаному слоті
+        path=None повертає збереження у файл. Повертає False,
+        якщо SQLite занадто старий (немає UPSERT)
+        """
+        from . import save_sqlite
+        
+        self.wait_for_saves()
+        if self.save_store is not None and (path is None or path != self.save_store.path):
+            self.save_store.close()
+            self.save_store = None
+        
+        if path is not None:
+            if not save_sqlite.is_available():
+                return False
+            if self.save_store is None:
+                self.save_store = save_sqlite.SqliteSaveStore(path)
+        
+        # Новий слот/сховище ще не містить цієї гри
+        self.save_slot = slot
+        self._needs_full_save = True
+        return True
@@ -0,0 +1,548 @@
+"""
+Векторизоване сховище стада (Struct-of-Arrays)
+Зберігає стан тварин у паралельних масивах NumPy і оновлює
+все стадо за одну операцію над масивами замість циклу по тваринах.
+
+Об'єкти тварин (AnimalView) створюються ліниво - лише для тих
+тварин, до яких звертаються (картки на екрані, дії гравця), тож
+велике стадо можна завантажити прямо в масиви (load_records).
+
+NumPy - опціональна залежність. Якщо її немає, GameState працює
+зі звичайним списком AnimalData.
+"""
+
+from collections.abc import Sequence
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy опціональний
+    np = None
+
+from .constants import ANIMAL_TYPES
+from .game_state import AnimalData, ANIMAL_FIELDS
+
+
+# Порядок типів тварин для індексів у масиві type_idx
+ANIMAL_TYPE_KEYS = list(ANIMAL_TYPES.keys())
+ANIMAL_TYPE_INDEX = {key: i for i, key in enumerate(ANIMAL_TYPE_KEYS)}
+
+# Імена видалених тварин лишаються в _names, доки сміття не перевищить
+# і цей поріг (байти), і розмір живих імен - тоді блок перебудовується
+NAMES_COMPACT_MIN = 1024
+
+
+def is_available() -> bool:
+    """Чи доступний NumPy для векторизованого сховища"""
+    return np is not None
+
+
+class _Column:
+    """
+    Дескриптор поля AnimalView, яке зберігається у масиві сховища
+    """
+
+    def __init__(self, cast):
+        self.cast = cast
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        store = obj._store
+        if store is None:
+            return obj._detached[self.name]
+        return self.cast(getattr(store, self.name)[obj._slot])
+
+    def __set__(self, obj, value):
+        store = obj._store
+        if store is None:
+            obj._detached[self.name] = value
+        else:
+            getattr(store, self.name)[obj._slot] = value
+
+
+class AnimalView(AnimalData):
+    """
+    Легке представлення тварини поверх масивів HerdStore
+    Для UI та збереження поводиться як звичайний AnimalData
+    """
+
+    hunger = _Column(float)
+    happiness = _Column(float)
+    health = _Column(float)
+    production_cooldown = _Column(int)
+    is_alive = _Column(bool)
+    age = _Column(int)
+    days_on_farm = _Column(int)
+    total_fed = _Column(int)
+    total_produced = _Column(int)
+
+    def __init__(self, store: 'HerdStore', slot: int):
+        self._store = store
+        self._slot = slot
+        self._detached = {}
+        # Незмінні поля - звичайні атрибути
+        self.id = int(store.id[slot])
+        self.animal_type = ANIMAL_TYPE_KEYS[store.type_idx[slot]]
+        self.name = store.get_name(slot)
+        self.breed = store.breeds[store.breed_idx[slot]]
+
+    def _detach(self):
+        """Від'єднати від сховища, зберігши поточні значення"""
+        if self._store is None:
+            return
+        values = {name: getattr(self, name) for name in HerdStore.COLUMNS}
+        self._store = None
+        self._detached = values
+
+    def to_animal_data(self) -> AnimalData:
+        """Створити незалежну копію AnimalData"""
+        return AnimalData(**{name: getattr(self, name) for name in ANIMAL_FIELDS})
+
+
+class HerdAnimals(Sequence):
+    """
+    Список тварин сховища для GameState.animals
+    Подання створюються при зверненні до елемента
+    """
+
+    def __init__(self, store: 'HerdStore'):
+        self._store = store
+
+    def __len__(self) -> int:
+        return self._store.size
+
+    def __getitem__(self, index):
+        store = self._store
+        if isinstance(index, slice):
+            return [store.view(i) for i in range(*index.indices(store.size))]
+        if index < 0:
+            index += store.size
+        if not 0 <= index < store.size:
+            raise IndexError("індекс тварини поза межами стада")
+        return store.view(index)
+
+    def __iter__(self):
+        store = self._store
+        for slot in range(store.size):
+            yield store.view(slot)
+
+    # Векторні відповіді на запити, що інакше обійшли б усіх тварин
+
+    def count_living_by_type(self) -> Dict[str, int]:
+        return self._store.count_living_by_type()
+
+    def living_value(self) -> float:
+        return self._store.living_value()
+
+
+class HerdStore:
+    """
+    Сховище стада у вигляді паралельних масивів
+    """
+
+    # Змінні поля AnimalData, що зберігаються у масивах
+    COLUMNS = ("hunger", "happiness", "health", "production_cooldown", "is_alive",
+               "age", "days_on_farm", "total_fed", "total_produced")
+
+    # Незмінні дані тварини: id, тип, порода (індекс у breeds), ім'я (зріз _names)
+    IDENTITY = ("id", "type_idx", "breed_idx", "name_offset", "name_length")
+
+    ARRAYS = COLUMNS + IDENTITY
+
+    def __init__(self, capacity: int = 64):
+        if np is None:
+            raise RuntimeError("Для HerdStore потрібен NumPy")
+
+        self.size = 0
+        self.animals = HerdAnimals(self)
+        # Створені подання за слотом
+        self._views: Dict[int, AnimalView] = {}
+        # Породи (рядки) та імена (UTF-8 одним блоком)
+        self.breeds: List[str] = []
+        self._breed_index: Dict[str, int] = {}
+        self._names = bytearray()
+        # Скільки байтів _names належить тваринам, що є у сховищі
+        self._names_used = 0
+        self._allocate(max(1, capacity))
+
+    def _allocate(self, capacity: int):
+        """Виділити (або розширити) масиви"""
+        old_size = self.size
+        new_arrays = {
+            "hunger": np.zeros(capacity, dtype=np.float64),
+            "happiness": np.zeros(capacity, dtype=np.float64),
+            "health": np.zeros(capacity, dtype=np.float64),
+            "production_cooldown": np.zeros(capacity, dtype=np.int32),
+            "is_alive": np.zeros(capacity, dtype=bool),
+            "age": np.zeros(capacity, dtype=np.int32),
+            "days_on_farm": np.zeros(capacity, dtype=np.int32),
+            "total_fed": np.zeros(capacity, dtype=np.int32),
+            "total_produced": np.zeros(capacity, dtype=np.int32),
+            "id": np.zeros(capacity, dtype=np.int64),
+            "type_idx": np.zeros(capacity, dtype=np.int8),
+            "breed_idx": np.zeros(capacity, dtype=np.int16),
+            "name_offset": np.zeros(capacity, dtype=np.int64),
+            "name_length": np.zeros(capacity, dtype=np.int32),
+        }
+        for name, array in new_arrays.items():
+            if old_size:
+                array[:old_size] = getattr(self, name)[:old_size]
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    def __len__(self) -> int:
+        return self.size
+
+    # ==================== Тварини ====================
+
+    def view(self, slot: int) -> AnimalView:
+        """Подання тварини у слоті (створюється при першому зверненні)"""
+        view = self._views.get(slot)
+        if view is None:
+            view = self._views[slot] = AnimalView(self, slot)
+        return view
+
+    def find(self, animal_id: int) -> Optional[AnimalView]:
+        """Знайти тварину за id (векторний пошук)"""
+        slots = np.flatnonzero(self.id[:self.size] == animal_id)
+        if not slots.size:
+            return None
+        return self.view(int(slots[0]))
+
+    def get_name(self, slot: int) -> str:
+        offset = int(self.name_offset[slot])
+        return self._names[offset:offset + int(self.name_length[slot])].decode("utf-8")
+
+    def _intern_breed(self, breed: str) -> int:
+        index = self._breed_index.get(breed)
+        if index is None:
+            index = self._breed_index[breed] = len(self.breeds)
+            self.breeds.append(breed)
+        return index
+
+    def add(self, animal: AnimalData) -> AnimalView:
+        """Додати тварину до сховища, повертає її представлення"""
+        slot = self._append(animal.to_dict())
+        return self.view(slot)
+
+    def extend(self, animals: Iterable[AnimalData]):
+        """Додати тварин без створення подань"""
+        for animal in animals:
+            self._append(animal.to_dict())
+
+    def _append(self, values: Dict[str, Any]) -> int:
+        """Записати тварину (словник полів AnimalData) у новий слот"""
+        if self.size >= self.capacity:
+            self._allocate(self.capacity * 2)
+
+        slot = self.size
+        self.size += 1
+        for name in self.COLUMNS:
+            getattr(self, name)[slot] = values[name]
+        self.id[slot] = values["id"]
+        self.type_idx[slot] = ANIMAL_TYPE_INDEX.get(values["animal_type"], 0)
+        self.breed_idx[slot] = self._intern_breed(values.get("breed", "default"))
+
+        name = values["name"].encode("utf-8")
+        self.name_offset[slot] = len(self._names)
+        self.name_length[slot] = len(name)
+        self._names += name
+        self._names_used += len(name)
+        return slot
+
+    def remove(self, view: AnimalView):
+        """Видалити тварину (переміщуючи останню на її місце)"""
+        if view._store is not self:
+            return
+        self._remove_slot(view._slot)
+
+    def _remove_slot(self, slot: int):
+        last = self.size - 1
+        view = self._views.pop(slot, None)
+        if view is not None:
+            view._detach()
+        self._names_used -= int(self.name_length[slot])
+
+        if slot != last:
+            for name in self.ARRAYS:
+                array = getattr(self, name)
+                array[slot] = array[last]
+            moved = self._views.pop(last, None)
+            if moved is not None:
+                moved._slot = slot
+                self._views[slot] = moved
+
+        self.size -= 1
+        self._maybe_compact_names()
+
+    def clear(self):
+        """Очистити сховище"""
+        for view in self._views.values():
+            view._detach()
+        self._views = {}
+        self.size = 0
+        self.breeds = []
+        self._breed_index = {}
+        self._names = bytearray()
+        self._names_used = 0
+
+    def _maybe_compact_names(self):
+        """Перебудувати блок імен, якщо в ньому забагато імен видалених тварин"""
+        garbage = len(self._names) - self._names_used
+        if garbage > NAMES_COMPACT_MIN and garbage > self._names_used:
+            self._compact_names()
+
+    def _compact_names(self):
+        """Лишити в _names тільки імена тварин сховища (зсуви перераховуються)"""
+        n = self.size
+        offsets = self.name_offset[:n]
+        lengths = self.name_length[:n]
+        names = self._names
+        self._names = bytearray().join(
+            names[o:o + l] for o, l in zip(offsets.tolist(), lengths.tolist())
+        )
+        offsets[:] = np.cumsum(lengths) - lengths
+        self._names_used = len(self._names)
+
+    # ==================== Масове завантаження ====================
+
+    def load_records(self, records, strings: List[str], names: bytes):
+        """
+        Заповнити сховище записами тварин бінарного збереження
+        records - структурований масив NumPy (save_format.ANIMAL_DTYPE),
+        зазвичай поверх відображеного у пам'ять файлу; дані копіюються
+        стовпцями, без об'єкта на кожну тварину
+        """
+        self.clear()
+        count = len(records)
+        if count > self.capacity:
+            self._allocate(count)
+        self.size = count
+
+        for name in self.COLUMNS:
+            getattr(self, name)[:count] = records[name]
+        self.id[:count] = records["id"]
+        self.name_offset[:count] = records["name_offset"]
+        self.name_length[:count] = records["name_length"]
+        self._names = bytearray(names)
+        self._names_used = int(self.name_length[:count].sum())
+        self._maybe_compact_names()
+
+        # Індекси таблиці рядків файлу -> власні індекси типів і порід
+        type_map = np.array([ANIMAL_TYPE_INDEX.get(s, 0) for s in strings] or [0], dtype=np.int8)
+        self.type_idx[:count] = type_map[records["animal_type"]]
+        breed_map = np.zeros(max(1, len(strings)), dtype=np.int16)
+        for index in np.unique(records["breed"]).tolist():
+            breed_map[index] = self._intern_breed(strings[index])
+        self.breed_idx[:count] = breed_map[records["breed"]]
+
+    def apply_changes(self, animals: List[Dict[str, Any]], removed: Iterable[int]):
+        """Застосувати зміни з журналу збереження: оновлені/нові тварини і видалені id"""
+        removed = np.fromiter(removed, dtype=np.int64)
+        if removed.size:
+            # Ущільнення зі збереженням порядку (як у звичайному завантаженні)
+            keep = np.flatnonzero(~np.isin(self.id[:self.size], removed))
+            if keep.size < self.size:
+                for view in self._views.values():
+                    view._detach()
+                self._views = {}
+                for name in self.ARRAYS:
+                    array = getattr(self, name)
+                    array[:keep.size] = array[keep]
+                self.size = int(keep.size)
+                self._names_used = int(self.name_length[:self.size].sum())
+                self._maybe_compact_names()
+
+        if not animals:
+            return
+
+        found, slots = self._locate(np.array([a["id"] for a in animals], dtype=np.int64))
+        existing = np.flatnonzero(found)
+        if existing.size:
+            for name in self.COLUMNS:
+                getattr(self, name)[slots] = [animals[i][name] for i in existing.tolist()]
+        for i in np.flatnonzero(~found).tolist():
+            self._append(animals[i])
+
+    def update_fields(self, changes: Dict[int, Dict[str, Any]]):
+        """Оновити окремі поля тварин за id (стовпці полів із журналу збереження)"""
+        if not changes:
+            return
+
+        rows = list(changes.values())
+        found, slots = self._locate(np.fromiter(changes.keys(), dtype=np.int64, count=len(changes)))
+        by_field: Dict[str, Any] = {}
+        for slot, i in zip(slots.tolist(), np.flatnonzero(found).tolist()):
+            for name, value in rows[i].items():
+                field_slots, values = by_field.setdefault(name, ([], []))
+                field_slots.append(slot)
+                values.append(value)
+        for name, (field_slots, values) in by_field.items():
+            if name in self.COLUMNS:
+                getattr(self, name)[field_slots] = values
+
+    def _locate(self, ids):
+        """Які з id є у сховищі: (маска знайдених, слоти знайдених по порядку)"""
+        if not self.size:
+            return np.zeros(len(ids), dtype=bool), np.zeros(0, dtype=np.int64)
+        order = np.argsort(self.id[:self.size], kind="stable")
+        sorted_ids = self.id[:self.size][order]
+        positions = np.minimum(np.searchsorted(sorted_ids, ids), self.size - 1)
+        found = sorted_ids[positions] == ids
+        return found, order[positions[found]]
+
+    # ==================== Векторні операції ====================
+
+    def age_one_day(self):
+        """Новий день: вік і дні на фермі всіх тварин (як у GameState._advance_day)"""
+        n = self.size
+        self.age[:n] += 1
+        self.days_on_farm[:n] += 1
+
+    def count_living_by_type(self) -> Dict[str, int]:
+        n = self.size
+        counts = np.bincount(self.type_idx[:n][self.is_alive[:n]], minlength=len(ANIMAL_TYPE_KEYS))
+        return {key: int(counts[i]) for i, key in enumerate(ANIMAL_TYPE_KEYS)}
+
+    def living_value(self) -> float:
+        """Вартість живих тварин (формула GameAggregates._animal_worth)"""
+        n = self.size
+        alive = self.is_alive[:n]
+        prices = np.array([ANIMAL_TYPES[key]["price"] for key in ANIMAL_TYPE_KEYS], dtype=np.float64)
+        return float(np.sum(prices[self.type_idx[:n][alive]] * (self.health[:n][alive] / 100) * 0.7))
+
+    def slots_of(self, animal_ids: Iterable[int]):
+        """Слоти тварин із вказаними id (у порядку сховища)"""
+        n = self.size
+        if not animal_ids:
+            return np.zeros(0, dtype=np.int64)
+        return np.flatnonzero(np.isin(self.id[:n], np.fromiter(animal_ids, dtype=np.int64)))
+
+    def field_columns(self, fields: Iterable[str], living_only: bool,
+                      exclude_ids: Iterable[int] = ()) -> Dict[str, List[Any]]:
+        """
+        Стовпці полів тварин для журналу збереження: ключ "id" і списки значень
+        living_only - лише живі тварини; exclude_ids - тварини, що пишуться повністю
+        """
+        n = self.size
+        mask = self.is_alive[:n].copy() if living_only else np.ones(n, dtype=bool)
+        if exclude_ids:
+            mask &= ~np.isin(self.id[:n], np.fromiter(exclude_ids, dtype=np.int64))
+        columns = {"id": self.id[:n][mask].tolist()}
+        for name in fields:
+            columns[name] = getattr(self, name)[:n][mask].tolist()
+        return columns
+
+    def count_living_ready(self) -> int:
+        """Кількість живих тварин, продукція яких готова до збору"""
+        n = self.size
+        return int(np.count_nonzero(self.is_alive[:n] & (self.production_cooldown[:n] == 0)))
+
+    def all_living_above(self, column: str, threshold: float) -> bool:
+        """Чи всі живі тварини мають значення вище порогу (False, якщо живих немає)"""
+        n = self.size
+        alive = self.is_alive[:n]
+        if not alive.any():
+            return False
+        return bool(np.all(getattr(self, column)[:n][alive] > threshold))
+
+    def advance_hour(self, sickness_by_type, rng) -> List[AnimalView]:
+        """
+        Годинне оновлення всього стада
+        Повторює логіку GameState._update_animal у векторному вигляді.
+        Повертає список тварин, що померли за цю годину
+        """
+        n = self.size
+        if n == 0:
+            return []
+
+        alive = self.is_alive[:n].copy()
+        if not alive.any():
+            return []
+
+        hunger = self.hunger[:n]
+        happiness = self.happiness[:n]
+        health = self.health[:n]
+        cooldown = self.production_cooldown[:n]
+
+        # Голод і щастя зменшуються
+        np.subtract(hunger, 0.5, out=hunger, where=alive)
+        np.maximum(hunger, 0.0, out=hunger, where=alive)
+        np.subtract(happiness, 0.2, out=happiness, where=alive)
+        np.maximum(happiness, 0.0, out=happiness, where=alive)
+
+        # Вплив голоду та щастя на здоров'я
+        np.subtract(health, 1.0, out=health, where=alive & (hunger < 20))
+        np.subtract(health, 0.5, out=health, where=alive & (happiness < 20))
+
+        # Хвороби: одна вибірка випадкових чисел на все стадо
+        chance = np.asarray(sickness_by_type)[self.type_idx[:n]]
+        sick = alive & (rng.random(n) < chance)
+        sick_count = int(sick.sum())
+        if sick_count:
+            loss = rng.uniform(0.5, 2.0, sick_count)
+            health[sick] = np.maximum(0.0, health[sick] - loss)
+
+        # Смерть
+        died = alive & ((health <= 0) | (hunger <= 0))
+        dead_slots = np.flatnonzero(died)
+        if dead_slots.size:
+            self.is_alive[dead_slots] = False
+
+        # Кулдаун виробництва (як і в _update_animal - також для щойно померлих)
+        np.subtract(cooldown, 1, out=cooldown, where=alive & (cooldown > 0))
+
+        return [self.view(int(i)) for i in dead_slots]
+
+    # ==================== Збереження ====================
+
+    def copy_columns(self) -> Dict[str, Any]:
+        """Копія всіх масивів стада (для знімків у пам'яті)"""
+        n = self.size
+        columns: Dict[str, Any] = {name: getattr(self, name)[:n].copy() for name in self.ARRAYS}
+        columns["breeds"] = list(self.breeds)
+        columns["names"] = bytes(self._names)
+        return columns
+
+    def to_dicts(self, slots=None) -> List[Dict[str, Any]]:
+        """Словники тварин для збереження (без створення подань)"""
+        n = self.size
+        columns = {name: getattr(self, name)[:n] for name in self.ARRAYS}
+        if slots is not None:
+            columns = {name: array[slots] for name, array in columns.items()}
+        columns["breeds"] = self.breeds
+        columns["names"] = self._names
+        return columns_to_dicts(columns)
+
+
+def columns_to_dicts(columns: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Перетворити стовпці стада (copy_columns) на словники полів AnimalData"""
+    names = columns["names"]
+    breeds = columns["breeds"]
+    rows = zip(
+        columns["id"].tolist(),
+        [ANIMAL_TYPE_KEYS[i] for i in columns["type_idx"].tolist()],
+        [names[o:o + l].decode("utf-8")
+         for o, l in zip(columns["name_offset"].tolist(), columns["name_length"].tolist())],
+        columns["age"].tolist(),
+        columns["health"].tolist(),
+        columns["hunger"].tolist(),
+        columns["happiness"].tolist(),
+        columns["is_alive"].tolist(),
+        columns["production_cooldown"].tolist(),
+        [breeds[i] for i in columns["breed_idx"].tolist()],
+        columns["total_fed"].tolist(),
+        columns["total_produced"].tolist(),
+        columns["days_on_farm"].tolist(),
+    )
+    # Порядок - як у ANIMAL_FIELDS
+    return [dict(zip(ANIMAL_FIELDS, row)) for row in rows]
+
+
+def make_rng(seed: Optional[int] = None):
+    """Створити генератор випадкових чисел NumPy"""
+    return np.random.default_rng(seed)
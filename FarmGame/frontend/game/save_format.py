@@ -0,0 +1,388 @@
+"""
+Формати файлу збереження: JSON і компактний бінарний
+Бінарний формат (версіонований):
+    заголовок:  MAGIC (4 байти) | версія (u16) | кількість секцій (u16)
+    секція:     тег (4 байти ASCII) | довжина (u32) | дані
+Тварини зберігаються записами фіксованої ширини, типи, породи та інші
+рядки, що повторюються, - індексами в таблиці рядків. Невідомі секції
+пропускаються завдяки довжині, тож новіші версії можуть додавати свої.
+
+Великі бінарні збереження можна читати через відображення файлу в
+пам'ять (load_mapped): записи тварин потрапляють прямо у масиви
+сховища стада, без словника на кожну тварину.
+
+Конвертер між форматами (з каталогу frontend):
+    python -m game.save_format savegame.json savegame.bin
+"""
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy опціональний
+    np = None
+
+
+# Формати
+FORMAT_JSON = "json"
+FORMAT_BINARY = "binary"
+
+MAGIC = b"FRMS"
+VERSION = 1
+
+TEMP_SUFFIX = ".tmp"
+
+_HEADER = struct.Struct("<4sHH")
+_SECTION = struct.Struct("<4sI")
+_COUNT = struct.Struct("<I")
+_STRING_LENGTH = struct.Struct("<H")
+
+# id, тип, порода, зміщення імені, довжина імені, вік, здоров'я, голод, щастя,
+# живий, кулдаун, погодовано, вироблено, днів на фермі
+_ANIMAL = struct.Struct("<IHHIHIdddBiIII")
+
+# Той самий запис тварини як структурований тип NumPy (для load_mapped)
+ANIMAL_DTYPE = np.dtype([
+    ("id", "<u4"), ("animal_type", "<u2"), ("breed", "<u2"),
+    ("name_offset", "<u4"), ("name_length", "<u2"), ("age", "<u4"),
+    ("health", "<f8"), ("hunger", "<f8"), ("happiness", "<f8"), ("is_alive", "u1"),
+    ("production_cooldown", "<i4"), ("total_fed", "<u4"), ("total_produced", "<u4"),
+    ("days_on_farm", "<u4"),
+]) if np is not None else None
+# тип, кількість, якість, днів до псування
+_PRODUCT = struct.Struct("<HdHi")
+# тип, кількість, якість, днів до псування
+_FEED = struct.Struct("<Hddi")
+# тип, назва, рівень, місткість
+_BUILDING = struct.Struct("<HHii")
+# id, розблоковано
+_ACHIEVEMENT = struct.Struct("<HB")
+
+# Секції, що кодуються окремо; решта даних - у META як JSON
+_RECORD_KEYS = ("animals", "products", "feeds", "buildings", "achievements", "action_log")
+
+
+class SaveFormatError(ValueError):
+    """Пошкоджений або непідтримуваний файл збереження"""
+
+
+class _StringTable:
+    """Інтернування рядків у малі цілі числа"""
+
+    def __init__(self):
+        self.strings: List[str] = []
+        self._index: Dict[str, int] = {}
+
+    def intern(self, value: str) -> int:
+        index = self._index.get(value)
+        if index is None:
+            index = self._index[value] = len(self.strings)
+            self.strings.append(value)
+        return index
+
+
+# ==================== Кодування ====================
+
+def encode(data: Dict[str, Any]) -> bytes:
+    """Закодувати дані збереження у бінарний формат"""
+    strings = _StringTable()
+    sections = []
+
+    # Тварини: записи фіксованої ширини, імена - окремим блоком
+    animals = data.get("animals", [])
+    names = bytearray()
+    animal_records = bytearray(_COUNT.pack(len(animals)))
+    for a in animals:
+        name = a["name"].encode("utf-8")
+        animal_records += _ANIMAL.pack(
+            a["id"], strings.intern(a["animal_type"]), strings.intern(a.get("breed", "default")),
+            len(names), len(name), a["age"], a["health"], a["hunger"], a["happiness"],
+            1 if a["is_alive"] else 0, a["production_cooldown"],
+            a["total_fed"], a["total_produced"], a["days_on_farm"]
+        )
+        names += name
+
+    products = data.get("products", {})
+    product_records = bytearray(_COUNT.pack(len(products)))
+    for p in products.values():
+        product_records += _PRODUCT.pack(
+            strings.intern(p["product_type"]), p["amount"],
+            strings.intern(p["quality"]), p["days_remaining"]
+        )
+
+    feeds = data.get("feeds", {})
+    feed_records = bytearray(_COUNT.pack(len(feeds)))
+    for f in feeds.values():
+        feed_records += _FEED.pack(
+            strings.intern(f["feed_type"]), f["amount"], f["quality"], f["days_remaining"]
+        )
+
+    buildings = data.get("buildings", [])
+    building_records = bytearray(_COUNT.pack(len(buildings)))
+    for b in buildings:
+        building_records += _BUILDING.pack(
+            strings.intern(b["building_type"]), strings.intern(b["name"]), b["level"], b["capacity"]
+        )
+
+    achievements = data.get("achievements", {})
+    achievement_records = bytearray(_COUNT.pack(len(achievements)))
+    for achievement_id, unlocked in achievements.items():
+        achievement_records += _ACHIEVEMENT.pack(strings.intern(achievement_id), 1 if unlocked else 0)
+
+    meta = {k: v for k, v in data.items() if k not in _RECORD_KEYS}
+
+    sections.append((b"META", _encode_json(meta)))
+    sections.append((b"STRS", _encode_strings(strings.strings)))
+    sections.append((b"ANIM", bytes(animal_records)))
+    sections.append((b"NAME", bytes(names)))
+    sections.append((b"PROD", bytes(product_records)))
+    sections.append((b"FEED", bytes(feed_records)))
+    sections.append((b"BLDG", bytes(building_records)))
+    sections.append((b"ACHV", bytes(achievement_records)))
+    if "action_log" in data:
+        sections.append((b"ALOG", _encode_json(data["action_log"])))
+
+    out = bytearray(_HEADER.pack(MAGIC, VERSION, len(sections)))
+    for tag, payload in sections:
+        out += _SECTION.pack(tag, len(payload))
+        out += payload
+    return bytes(out)
+
+
+def _encode_json(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _encode_strings(strings: List[str]) -> bytes:
+    out = bytearray(_COUNT.pack(len(strings)))
+    for value in strings:
+        raw = value.encode("utf-8")
+        out += _STRING_LENGTH.pack(len(raw))
+        out += raw
+    return bytes(out)
+
+
+# ==================== Декодування ====================
+
+def decode(raw: bytes) -> Dict[str, Any]:
+    """Розкодувати бінарне збереження у ті ж дані, що й JSON"""
+    sections = _split_sections(memoryview(raw))
+    strings = _decode_strings(sections.get(b"STRS"))
+    data = _decode_state(sections, strings)
+
+    names = bytes(sections.get(b"NAME", b""))
+    data["animals"] = [
+        {
+            "id": r[0], "animal_type": strings[r[1]], "name": names[r[3]:r[3] + r[4]].decode("utf-8"),
+            "age": r[5], "health": r[6], "hunger": r[7], "happiness": r[8], "is_alive": bool(r[9]),
+            "production_cooldown": r[10], "breed": strings[r[2]],
+            "total_fed": r[11], "total_produced": r[12], "days_on_farm": r[13]
+        }
+        for r in _iter_records(sections.get(b"ANIM"), _ANIMAL)
+    ]
+    return data
+
+
+def _split_sections(view: memoryview) -> Dict[bytes, memoryview]:
+    """Перевірити заголовок і розбити файл на секції (без копіювання)"""
+    if len(view) < _HEADER.size:
+        raise SaveFormatError("Файл збереження закороткий")
+
+    magic, version, section_count = _HEADER.unpack_from(view, 0)
+    if magic != MAGIC:
+        raise SaveFormatError("Це не бінарне збереження")
+    if version > VERSION:
+        raise SaveFormatError(f"Непідтримувана версія збереження: {version}")
+
+    sections: Dict[bytes, memoryview] = {}
+    offset = _HEADER.size
+    for _ in range(section_count):
+        if offset + _SECTION.size > len(view):
+            raise SaveFormatError("Обірваний заголовок секції")
+        tag, length = _SECTION.unpack_from(view, offset)
+        offset += _SECTION.size
+        if offset + length > len(view):
+            raise SaveFormatError(f"Обірвана секція {tag!r}")
+        sections[tag] = view[offset:offset + length]
+        offset += length
+    return sections
+
+
+def _decode_state(sections: Dict[bytes, memoryview], strings: List[str]) -> Dict[str, Any]:
+    """Усі секції, крім тварин"""
+    data = json.loads(bytes(sections.get(b"META", b"{}")))
+    data["products"] = {
+        strings[r[0]]: {"product_type": strings[r[0]], "amount": r[1],
+                        "quality": strings[r[2]], "days_remaining": r[3]}
+        for r in _iter_records(sections.get(b"PROD"), _PRODUCT)
+    }
+    data["feeds"] = {
+        strings[r[0]]: {"feed_type": strings[r[0]], "amount": r[1],
+                        "quality": r[2], "days_remaining": r[3]}
+        for r in _iter_records(sections.get(b"FEED"), _FEED)
+    }
+    data["buildings"] = [
+        {"building_type": strings[r[0]], "name": strings[r[1]], "level": r[2], "capacity": r[3]}
+        for r in _iter_records(sections.get(b"BLDG"), _BUILDING)
+    ]
+    data["achievements"] = {
+        strings[r[0]]: bool(r[1]) for r in _iter_records(sections.get(b"ACHV"), _ACHIEVEMENT)
+    }
+    if b"ALOG" in sections:
+        data["action_log"] = json.loads(bytes(sections[b"ALOG"]))
+    return data
+
+
+def _decode_strings(payload: Optional[memoryview]) -> List[str]:
+    if payload is None:
+        return []
+    (count,) = _COUNT.unpack_from(payload, 0)
+    offset = _COUNT.size
+    strings = []
+    for _ in range(count):
+        (length,) = _STRING_LENGTH.unpack_from(payload, offset)
+        offset += _STRING_LENGTH.size
+        strings.append(bytes(payload[offset:offset + length]).decode("utf-8"))
+        offset += length
+    return strings
+
+
+def _iter_records(payload: Optional[memoryview], record: struct.Struct):
+    """Записи фіксованої ширини з секції (лічильник + записи)"""
+    if payload is None:
+        return iter(())
+    return record.iter_unpack(payload[_COUNT.size:_records_end(payload, record.size)])
+
+
+def _records_end(payload: memoryview, record_size: int) -> int:
+    (count,) = _COUNT.unpack_from(payload, 0)
+    end = _COUNT.size + count * record_size
+    if end > len(payload):
+        raise SaveFormatError("Секція коротша за кількість записів")
+    return end
+
+
+# ==================== Відображення в пам'ять ====================
+
+def load_mapped(path: str, herd) -> Dict[str, Any]:
+    """
+    Прочитати бінарне збереження через mmap
+    Записи тварин читаються масивом NumPy прямо з відображення і
+    копіюються стовпцями у herd (HerdStore.load_records). Повертає
+    решту даних збереження - без ключа "animals"
+    """
+    if np is None:
+        raise RuntimeError("Для читання через mmap потрібен NumPy")
+
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            sections = _split_sections(view)
+            try:
+                strings = _decode_strings(sections.get(b"STRS"))
+                data = _decode_state(sections, strings)
+
+                animals = sections.get(b"ANIM")
+                if animals is None:
+                    records = np.zeros(0, dtype=ANIMAL_DTYPE)
+                else:
+                    count = (_records_end(animals, ANIMAL_DTYPE.itemsize) - _COUNT.size) // ANIMAL_DTYPE.itemsize
+                    records = np.frombuffer(animals, dtype=ANIMAL_DTYPE, count=count, offset=_COUNT.size)
+                herd.load_records(records, strings, sections.get(b"NAME", b""))
+                del records
+            finally:
+                # mmap не закриється, поки на нього є посилання
+                for section in sections.values():
+                    section.release()
+                view.release()
+    return data
+
+
+# ==================== Файли ====================
+
+def detect_format(raw: bytes) -> str:
+    """Визначити формат за першими байтами"""
+    return FORMAT_BINARY if raw[:len(MAGIC)] == MAGIC else FORMAT_JSON
+
+
+def detect_file_format(path: str) -> str:
+    """Визначити формат файлу, прочитавши лише заголовок"""
+    with open(path, 'rb') as f:
+        return detect_format(f.read(len(MAGIC)))
+
+
+def read_save_file(path: str) -> Tuple[Dict[str, Any], str]:
+    """Прочитати збереження будь-якого формату, повертає (дані, формат)"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+
+    save_format = detect_format(raw)
+    if save_format == FORMAT_BINARY:
+        return decode(raw), save_format
+    return json.loads(raw.decode("utf-8")), save_format
+
+
+def write_save_file(path: str, data: Dict[str, Any], save_format: str = FORMAT_JSON):
+    """Записати збереження у тимчасовий файл і атомарно замінити ним path"""
+    if save_format == FORMAT_BINARY:
+        raw = encode(data)
+    else:
+        raw = _encode_json(data)
+
+    temp_path = path + TEMP_SUFFIX
+    with open(temp_path, 'wb') as f:
+        f.write(raw)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+# ==================== Конвертер ====================
+
+def convert(src: str, dst: str, save_format: Optional[str] = None) -> str:
+    """
+    Перетворити збереження між форматами
+    Без save_format - у протилежний до формату src. Повертає формат dst
+    Журнал змін src (.journal) зливається в результат, тож dst - повний знімок
+    """
+    # save_journal сам імпортує цей модуль
+    from .save_journal import SaveJournal
+
+    src_format = detect_file_format(src)
+    data = SaveJournal(src).load()
+    if save_format is None:
+        save_format = FORMAT_JSON if src_format == FORMAT_BINARY else FORMAT_BINARY
+    write_save_file(dst, data, save_format)
+    return save_format
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Точка входу конвертера"""
+    parser = argparse.ArgumentParser(
+        prog="python -m game.save_format",
+        description="Перетворення збереження між JSON і бінарним форматом"
+    )
+    parser.add_argument("src", help="вхідний файл збереження")
+    parser.add_argument("dst", help="вихідний файл")
+    parser.add_argument("--to", choices=[FORMAT_JSON, FORMAT_BINARY], default=None,
+                        help="формат результату (за замовчуванням - протилежний до вхідного)")
+    args = parser.parse_args(argv)
+
+    try:
+        save_format = convert(args.src, args.dst, args.to)
+    except (OSError, ValueError, KeyError, struct.error) as e:
+        print(f"Не вдалося перетворити збереження: {e}", file=sys.stderr)
+        return 1
+
+    print(f"{args.src} -> {args.dst} ({save_format}, {os.path.getsize(args.dst)} байт)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,252 @@
+"""
+Журнал змін збереження (append-only)
+Поруч із повним знімком (savegame.json) лежить файл .journal, куди
+кожне збереження дописує лише змінені з минулого разу сутності одним
+рядком JSON. Тварини, змінені діями гравця, пишуться повними записами;
+плин часу змінює лише кілька полів усіх живих тварин, і ці поля
+пишуться стовпцями (animal_columns) без імен, порід та інших незмінних
+даних. Коли записів стає багато, журнал у фоновому потоці
+зливається зі знімком у новий повний знімок.
+
+Завантаження = знімок + усі записи журналу з seq > journal_seq знімка.
+Знімок може бути як JSON, так і бінарним (див. save_format), журнал - завжди JSON.
+"""
+
+import json
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from .save_format import (
+    FORMAT_BINARY, FORMAT_JSON, detect_file_format, load_mapped, read_save_file, write_save_file
+)
+
+
+# Суфікси файлів поруч зі знімком
+JOURNAL_SUFFIX = ".journal"
+COMPACTING_SUFFIX = ".compacting"
+# Короткі відомості про збереження для меню (без читання самого збереження)
+META_SUFFIX = ".meta"
+
+# Після скількох записів журнал зливається у повний знімок
+COMPACT_EVERY = 50
+
+# Поля тварин, які змінює плин часу (щогодини і з новим днем)
+HOURLY_ANIMAL_FIELDS = ("hunger", "happiness", "health", "production_cooldown")
+DAILY_ANIMAL_FIELDS = ("age", "days_on_farm")
+
+
+def apply_deltas(data: Dict[str, Any], deltas: Iterable[Dict[str, Any]],
+                 removed: Optional[Set[int]] = None,
+                 pending: Optional[Dict[int, Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """
+    Застосувати записи журналу до повного знімку
+    Тварини оновлюються/додаються за id, видалені - прибираються
+    (і додаються до removed, якщо його передано). Стовпці полів тварин,
+    яких немає в data["animals"] (вони вже у сховищі стада), збираються
+    в pending: id -> {поле: значення}
+    """
+    animals = {a["id"]: a for a in data.get("animals", [])}
+    log_entries = data.setdefault("action_log", {}).setdefault("entries", [])
+    seq = data.get("journal_seq", 0)
+
+    for delta in deltas:
+        if delta["seq"] <= seq:
+            continue
+        seq = delta["seq"]
+
+        data.update(delta.get("state", {}))
+        for animal in delta.get("animals", []):
+            animals[animal["id"]] = animal
+            if pending is not None:
+                pending.pop(animal["id"], None)
+        for animal_id in delta.get("removed_animals", []):
+            animals.pop(animal_id, None)
+            if removed is not None:
+                removed.add(animal_id)
+            if pending is not None:
+                pending.pop(animal_id, None)
+        if "animal_columns" in delta:
+            _apply_animal_columns(animals, delta["animal_columns"], pending)
+        log_entries.extend(delta.get("action_log_entries", []))
+
+    data["animals"] = list(animals.values())
+    data["journal_seq"] = seq
+    return data
+
+
+def _apply_animal_columns(animals: Dict[int, Dict[str, Any]], columns: Dict[str, List[Any]],
+                          pending: Optional[Dict[int, Dict[str, Any]]]):
+    """Записати стовпці полів (ключ "id" + списки значень) у словники тварин"""
+    fields = [name for name in columns if name != "id"]
+    for i, animal_id in enumerate(columns["id"]):
+        animal = animals.get(animal_id)
+        if animal is None:
+            if pending is None:
+                continue
+            animal = pending.setdefault(animal_id, {})
+        for name in fields:
+            animal[name] = columns[name][i]
+
+
+class SaveJournal:
+    """
+    Знімок + журнал змін для одного файлу збереження
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.journal_path = path + JOURNAL_SUFFIX
+        self.compacting_path = path + COMPACTING_SUFFIX
+
+        # Номер останнього записаного запису і кількість записів у журналі
+        self.seq = 0
+        self.entries = 0
+
+        self._lock = threading.Lock()
+        self._compactor: Optional[threading.Thread] = None
+        self.last_error: Optional[Exception] = None
+
+    # ==================== Запис ====================
+
+    def write_snapshot(self, data: Dict[str, Any], save_format: str = FORMAT_JSON):
+        """Записати повний знімок і відкинути журнал"""
+        self.wait()
+        with self._lock:
+            data["journal_seq"] = self.seq
+            write_save_file(self.path, data, save_format)
+            for path in (self.journal_path, self.compacting_path):
+                if os.path.exists(path):
+                    os.remove(path)
+            self.entries = 0
+
+    def append(self, delta: Dict[str, Any]):
+        """Дописати запис змін у журнал"""
+        with self._lock:
+            self.seq += 1
+            delta["seq"] = self.seq
+            line = json.dumps(delta, ensure_ascii=False, separators=(",", ":"))
+            with open(self.journal_path, 'a', encoding='utf-8') as f:
+                f.write(line + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self.entries += 1
+
+        if self.entries >= COMPACT_EVERY:
+            self.compact_async()
+
+    # ==================== Ущільнення ====================
+
+    def compact_async(self) -> bool:
+        """
+        Злити журнал зі знімком у фоновому потоці
+        Поточний журнал перейменовується, тож нові записи йдуть
+        у свіжий файл і не чекають на ущільнення
+        """
+        with self._lock:
+            if self._compactor is not None and self._compactor.is_alive():
+                return False
+            if not os.path.exists(self.journal_path):
+                return False
+
+            if os.path.exists(self.compacting_path):
+                # Залишок ущільнення, що не завершилось - дописуємо до нього
+                with open(self.journal_path, 'r', encoding='utf-8') as src, \
+                        open(self.compacting_path, 'a', encoding='utf-8') as dst:
+                    dst.write(src.read())
+                os.remove(self.journal_path)
+            else:
+                os.replace(self.journal_path, self.compacting_path)
+            self.entries = 0
+
+            self._compactor = threading.Thread(target=self._compact, name="save-compaction", daemon=True)
+            self._compactor.start()
+        return True
+
+    def _compact(self):
+        """Робота фонового потоку: знімок + журнал -> новий знімок"""
+        try:
+            # Новий знімок - у тому ж форматі, що й старий
+            data, save_format = read_save_file(self.path)
+            apply_deltas(data, self._read_lines(self.compacting_path))
+            write_save_file(self.path, data, save_format)
+            os.remove(self.compacting_path)
+        except Exception as e:
+            # Файли не втрачено: при завантаженні .compacting буде застосовано
+            self.last_error = e
+
+    def wait(self):
+        """Дочекатися завершення фонового ущільнення"""
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join()
+
+    # ==================== Читання ====================
+
+    def load(self) -> Dict[str, Any]:
+        """Прочитати знімок і застосувати до нього журнал"""
+        self.wait()
+        data, _ = read_save_file(self.path)
+
+        deltas = self._read_lines(self.compacting_path) + self._read_lines(self.journal_path)
+        apply_deltas(data, deltas)
+        self._terminate_last_line(self.journal_path)
+
+        self.seq = data["journal_seq"]
+        self.entries = len(deltas)
+        return data
+
+    def is_binary(self) -> bool:
+        """Чи знімок у бінарному форматі (тоді його можна читати через mmap)"""
+        return os.path.exists(self.path) and detect_file_format(self.path) == FORMAT_BINARY
+
+    def load_mapped(self, herd) -> Dict[str, Any]:
+        """
+        Як load, але тварини бінарного знімка читаються через mmap прямо
+        у сховище стада; зміни тварин із журналу застосовуються до нього ж.
+        Повертає дані без ключа "animals"
+        """
+        self.wait()
+        data = load_mapped(self.path, herd)
+        data["animals"] = []
+
+        deltas = self._read_lines(self.compacting_path) + self._read_lines(self.journal_path)
+        removed: Set[int] = set()
+        pending: Dict[int, Dict[str, Any]] = {}
+        apply_deltas(data, deltas, removed, pending)
+        herd.apply_changes(data.pop("animals"), removed)
+        herd.update_fields(pending)
+        self._terminate_last_line(self.journal_path)
+
+        self.seq = data["journal_seq"]
+        self.entries = len(deltas)
+        return data
+
+    @staticmethod
+    def _read_lines(path: str) -> List[Dict[str, Any]]:
+        """Записи журналу з файлу (обірвані рядки ігноруються)"""
+        if not os.path.exists(path):
+            return []
+
+        deltas = []
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    deltas.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # Збій посеред запису - цей рядок втрачено
+                    continue
+        return deltas
+
+    @staticmethod
+    def _terminate_last_line(path: str):
+        """Завершити обірваний рядок, щоб наступний запис не приклеївся до нього"""
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            return
+        with open(path, 'rb+') as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
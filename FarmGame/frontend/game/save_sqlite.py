@@ -0,0 +1,312 @@
+"""
+Сховище збережень на SQLite (опціональне, лише стандартна бібліотека)
+Кожен слот - рядок у таблиці farms і пов'язані рядки в таблицях тварин,
+продукції, кормів, будівель, подій і журналу дій. Збереження після
+першого оновлює лише змінені рядки (UPSERT) в одній транзакції, а
+індекси за типом і станом тварин дозволяють інструментам робити запити
+до великих ферм, не завантажуючи їх у Python.
+"""
+
+import json
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS farms (
+    slot TEXT PRIMARY KEY,
+    farm_name TEXT NOT NULL,
+    current_day INTEGER NOT NULL,
+    current_season TEXT NOT NULL,
+    money REAL NOT NULL,
+    herd_size INTEGER NOT NULL,
+    saved_at TEXT NOT NULL,
+    state TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS animals (
+    slot TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    animal_type TEXT NOT NULL,
+    name TEXT NOT NULL,
+    age INTEGER NOT NULL,
+    health REAL NOT NULL,
+    hunger REAL NOT NULL,
+    happiness REAL NOT NULL,
+    is_alive INTEGER NOT NULL,
+    production_cooldown INTEGER NOT NULL,
+    breed TEXT NOT NULL,
+    total_fed INTEGER NOT NULL,
+    total_produced INTEGER NOT NULL,
+    days_on_farm INTEGER NOT NULL,
+    PRIMARY KEY (slot, id)
+);
+CREATE INDEX IF NOT EXISTS idx_animals_type ON animals (slot, animal_type);
+CREATE INDEX IF NOT EXISTS idx_animals_alive ON animals (slot, is_alive);
+CREATE TABLE IF NOT EXISTS products (
+    slot TEXT NOT NULL,
+    product_type TEXT NOT NULL,
+    amount REAL NOT NULL,
+    quality TEXT NOT NULL,
+    days_remaining INTEGER NOT NULL,
+    PRIMARY KEY (slot, product_type)
+);
+CREATE TABLE IF NOT EXISTS feeds (
+    slot TEXT NOT NULL,
+    feed_type TEXT NOT NULL,
+    amount REAL NOT NULL,
+    quality REAL NOT NULL,
+    days_remaining INTEGER NOT NULL,
+    PRIMARY KEY (slot, feed_type)
+);
+CREATE TABLE IF NOT EXISTS buildings (
+    slot TEXT NOT NULL,
+    building_type TEXT NOT NULL,
+    name TEXT NOT NULL,
+    level INTEGER NOT NULL,
+    capacity INTEGER NOT NULL,
+    PRIMARY KEY (slot, building_type)
+);
+CREATE TABLE IF NOT EXISTS events (
+    slot TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    message TEXT NOT NULL,
+    PRIMARY KEY (slot, position)
+);
+CREATE TABLE IF NOT EXISTS actions (
+    slot TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    entry TEXT NOT NULL,
+    PRIMARY KEY (slot, position)
+);
+"""
+
+ANIMAL_COLUMNS = (
+    "id", "animal_type", "name", "age", "health", "hunger", "happiness", "is_alive",
+    "production_cooldown", "breed", "total_fed", "total_produced", "days_on_farm"
+)
+
+# Дані, що зберігаються окремими таблицями, а не в farms.state
+_TABLE_KEYS = ("animals", "products", "feeds", "buildings", "events", "action_log")
+
+# Таблиці слота (для видалення)
+_SLOT_TABLES = ("animals", "products", "feeds", "buildings", "events", "actions", "farms")
+
+_UPSERT_ANIMAL = (
+    f"INSERT INTO animals (slot, {', '.join(ANIMAL_COLUMNS)}) "
+    f"VALUES (?, {', '.join('?' for _ in ANIMAL_COLUMNS)}) "
+    f"ON CONFLICT (slot, id) DO UPDATE SET "
+    + ", ".join(f"{c} = excluded.{c}" for c in ANIMAL_COLUMNS[1:])
+)
+
+
+def is_available() -> bool:
+    """Чи підтримує SQLite синтаксис UPSERT (потрібна версія 3.24+)"""
+    return sqlite3.sqlite_version_info >= (3, 24, 0)
+
+
+class SqliteSaveStore:
+    """
+    Збереження ферм у базі SQLite зі слотами
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        # Збереження пишуться з фонового потоку, тому з'єднання спільне під блокуванням
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    # ==================== Запис ====================
+
+    def save(self, slot: str, data: Dict[str, Any], incremental: bool = False):
+        """
+        Зберегти дані у слот однією транзакцією
+        data - повний знімок (incremental=False) або запис змін
+        GameState._build_save_delta (incremental=True)
+        """
+        # Невеликі таблиці беруться зі стану: у записі змін він у "state",
+        # у повному знімку - на верхньому рівні
+        state = data["state"] if incremental else data
+
+        with self._lock, self._conn:
+            conn = self._conn
+            if not incremental:
+                for table in _SLOT_TABLES:
+                    conn.execute(f"DELETE FROM {table} WHERE slot = ?", (slot,))
+
+            # Лише змінені тварини (або всі для повного знімку)
+            conn.executemany(_UPSERT_ANIMAL, (
+                (slot, *(a[c] for c in ANIMAL_COLUMNS)) for a in data["animals"]
+            ))
+            if incremental:
+                conn.executemany("DELETE FROM animals WHERE slot = ? AND id = ?",
+                                 ((slot, i) for i in data.get("removed_animals", [])))
+                if "animal_columns" in data:
+                    self._update_animal_columns(slot, data["animal_columns"])
+
+            # Невеликі таблиці перезаписуються повністю
+            self._replace_small_tables(slot, state)
+
+            if incremental:
+                entries = data.get("action_log_entries", [])
+                (start,) = conn.execute("SELECT COUNT(*) FROM actions WHERE slot = ?", (slot,)).fetchone()
+            else:
+                entries = data.get("action_log", {}).get("entries", [])
+                start = 0
+            conn.executemany("INSERT INTO actions (slot, position, entry) VALUES (?, ?, ?)", (
+                (slot, start + i, json.dumps(entry, ensure_ascii=False)) for i, entry in enumerate(entries)
+            ))
+
+            (herd_size,) = conn.execute(
+                "SELECT COUNT(*) FROM animals WHERE slot = ? AND is_alive = 1", (slot,)
+            ).fetchone()
+            farm_state = {k: v for k, v in state.items() if k not in _TABLE_KEYS}
+            if not incremental and "action_log" in data:
+                log = data["action_log"]
+                farm_state["action_log"] = {k: v for k, v in log.items() if k != "entries"}
+            elif incremental:
+                (old_state,) = conn.execute("SELECT state FROM farms WHERE slot = ?", (slot,)).fetchone()
+                farm_state["action_log"] = json.loads(old_state).get("action_log", {})
+
+            conn.execute(
+                "INSERT INTO farms (slot, farm_name, current_day, current_season, money, herd_size, saved_at, state) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (slot) DO UPDATE SET farm_name = excluded.farm_name, "
+                "current_day = excluded.current_day, current_season = excluded.current_season, "
+                "money = excluded.money, herd_size = excluded.herd_size, "
+                "saved_at = excluded.saved_at, state = excluded.state",
+                (slot, state["farm_name"], state["current_day"], state["current_season"],
+                 state["farmer"]["money"], herd_size, state["saved_at"],
+                 json.dumps(farm_state, ensure_ascii=False))
+            )
+
+    def _update_animal_columns(self, slot: str, columns: Dict[str, List[Any]]):
+        """Оновити окремі поля тварин (плин часу) без перезапису цілих рядків"""
+        fields = [name for name in columns if name != "id" and name in ANIMAL_COLUMNS]
+        if not fields:
+            return
+        self._conn.executemany(
+            f"UPDATE animals SET {', '.join(f'{name} = ?' for name in fields)} WHERE slot = ? AND id = ?",
+            ((*(columns[name][i] for name in fields), slot, animal_id)
+             for i, animal_id in enumerate(columns["id"]))
+        )
+
+    def _replace_small_tables(self, slot: str, state: Dict[str, Any]):
+        conn = self._conn
+        for table in ("products", "feeds", "buildings", "events"):
+            conn.execute(f"DELETE FROM {table} WHERE slot = ?", (slot,))
+
+        conn.executemany(
+            "INSERT INTO products (slot, product_type, amount, quality, days_remaining) VALUES (?, ?, ?, ?, ?)",
+            ((slot, p["product_type"], p["amount"], p["quality"], p["days_remaining"])
+             for p in state.get("products", {}).values())
+        )
+        conn.executemany(
+            "INSERT INTO feeds (slot, feed_type, amount, quality, days_remaining) VALUES (?, ?, ?, ?, ?)",
+            ((slot, f["feed_type"], f["amount"], f["quality"], f["days_remaining"])
+             for f in state.get("feeds", {}).values())
+        )
+        conn.executemany(
+            "INSERT INTO buildings (slot, building_type, name, level, capacity) VALUES (?, ?, ?, ?, ?)",
+            ((slot, b["building_type"], b["name"], b["level"], b["capacity"])
+             for b in state.get("buildings", []))
+        )
+        conn.executemany(
+            "INSERT INTO events (slot, position, message) VALUES (?, ?, ?)",
+            ((slot, i, message) for i, message in enumerate(state.get("events", [])))
+        )
+
+    def delete_slot(self, slot: str):
+        """Видалити слот"""
+        with self._lock, self._conn:
+            for table in _SLOT_TABLES:
+                self._conn.execute(f"DELETE FROM {table} WHERE slot = ?", (slot,))
+
+    # ==================== Читання ====================
+
+    def has_slot(self, slot: str) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM farms WHERE slot = ?", (slot,)).fetchone()
+        return row is not None
+
+    def list_slots(self) -> List[Dict[str, Any]]:
+        """Короткі відомості про всі слоти (без завантаження тварин)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT slot, farm_name, current_day, current_season, money, herd_size, saved_at "
+                "FROM farms ORDER BY saved_at DESC"
+            ).fetchall()
+        keys = ("slot", "farm_name", "current_day", "current_season", "money", "herd_size", "saved_at")
+        return [dict(zip(keys, row)) for row in rows]
+
+    def load(self, slot: str) -> Dict[str, Any]:
+        """Прочитати слот у тому ж вигляді, що й JSON-збереження"""
+        with self._lock:
+            conn = self._conn
+            row = conn.execute("SELECT state FROM farms WHERE slot = ?", (slot,)).fetchone()
+            if row is None:
+                raise KeyError(f"Слот не знайдено: {slot}")
+
+            data = json.loads(row[0])
+            data["animals"] = [
+                dict(zip(ANIMAL_COLUMNS, r))
+                for r in conn.execute(
+                    f"SELECT {', '.join(ANIMAL_COLUMNS)} FROM animals WHERE slot = ? ORDER BY id", (slot,)
+                )
+            ]
+            for animal in data["animals"]:
+                animal["is_alive"] = bool(animal["is_alive"])
+
+            data["products"] = {
+                r[0]: {"product_type": r[0], "amount": r[1], "quality": r[2], "days_remaining": r[3]}
+                for r in conn.execute(
+                    "SELECT product_type, amount, quality, days_remaining FROM products WHERE slot = ?", (slot,)
+                )
+            }
+            data["feeds"] = {
+                r[0]: {"feed_type": r[0], "amount": r[1], "quality": r[2], "days_remaining": r[3]}
+                for r in conn.execute(
+                    "SELECT feed_type, amount, quality, days_remaining FROM feeds WHERE slot = ?", (slot,)
+                )
+            }
+            data["buildings"] = [
+                {"building_type": r[0], "name": r[1], "level": r[2], "capacity": r[3]}
+                for r in conn.execute(
+                    "SELECT building_type, name, level, capacity FROM buildings WHERE slot = ? ORDER BY rowid",
+                    (slot,)
+                )
+            ]
+            data["events"] = [
+                r[0] for r in conn.execute(
+                    "SELECT message FROM events WHERE slot = ? ORDER BY position", (slot,)
+                )
+            ]
+            log = data.get("action_log", {})
+            log["entries"] = [
+                json.loads(r[0]) for r in conn.execute(
+                    "SELECT entry FROM actions WHERE slot = ? ORDER BY position", (slot,)
+                )
+            ]
+            data["action_log"] = log
+        return data
+
+    def count_animals(self, slot: str, animal_type: Optional[str] = None,
+                      alive: Optional[bool] = None) -> int:
+        """Кількість тварин у слоті (за індексами, без завантаження)"""
+        query = "SELECT COUNT(*) FROM animals WHERE slot = ?"
+        params: List[Any] = [slot]
+        if animal_type is not None:
+            query += " AND animal_type = ?"
+            params.append(animal_type)
+        if alive is not None:
+            query += " AND is_alive = ?"
+            params.append(1 if alive else 0)
+
+        with self._lock:
+            (count,) = self._conn.execute(query, params).fetchone()
+        return count
@@ -0,0 +1,176 @@
+"""
+Безголова симуляція ферми без pygame
+Прокручує ігровий час настільки швидко, наскільки дозволяє процесор
+
+Запуск (з каталогу frontend):
+    python -m game.simulate --days 3650 --seed 7
+    python -m game.simulate --replay savegame.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from typing import Optional, List
+
+from .action_log import ActionLog, replay
+from .game_state import GameState
+from .save_journal import SaveJournal
+from .constants import ANIMAL_TYPES, SEASONS, WEATHER_TYPES
+
+
+def run_simulation(game_state: GameState, hours: int, bulk: bool = False) -> float:
+    """
+    Просунути симуляцію на вказану кількість годин
+    Використовує той самий _advance_hour, що й інтерактивна гра,
+    або масове просування advance_hours (bulk=True)
+    Повертає витрачений реальний час у секундах
+    """
+    start = time.perf_counter()
+    if bulk:
+        game_state.advance_hours(hours)
+    else:
+        for _ in range(hours):
+            game_state._advance_hour()
+    return time.perf_counter() - start
+
+
+def format_summary(game_state: GameState) -> str:
+    """Сформувати текстовий підсумок стану ферми"""
+    farmer = game_state.farmer
+    season = SEASONS[game_state.current_season]["name"]
+    weather = WEATHER_TYPES[game_state.current_weather]["name"]
+
+    lines = [
+        f"Ферма: {game_state.farm_name}",
+        f"День {game_state.current_day}, {game_state.current_hour:02d}:00. {season}. {weather}",
+        f"Гроші: {farmer.money:.0f} грн",
+        f"Вартість ферми: {game_state.get_net_worth():.0f} грн",
+        f"Тварини: {game_state.get_living_animals_count()}/{game_state.get_total_capacity()}",
+    ]
+
+    # Кількість живих тварин за типами
+    for animal_type, info in ANIMAL_TYPES.items():
+        count = game_state.aggregates.living_by_type.get(animal_type, 0)
+        if count:
+            lines.append(f"  {info['name']}: {count}")
+
+    unlocked = sum(1 for v in game_state.achievements.values() if v)
+    lines.append(f"Досягнення: {unlocked}/{len(game_state.achievements)}")
+
+    return "\n".join(lines)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Розбір аргументів командного рядка"""
+    parser = argparse.ArgumentParser(
+        prog="python -m game.simulate",
+        description="Швидка симуляція ферми без графічного інтерфейсу"
+    )
+    parser.add_argument("--days", type=int, default=365,
+                        help="кількість ігрових днів для симуляції")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="зерно генератора випадкових чисел")
+    parser.add_argument("--load", action="store_true",
+                        help="почати зі збереженої гри замість нової")
+    parser.add_argument("--farm-name", default="Симуляція",
+                        help="назва ферми для нової гри")
+    parser.add_argument("--farmer-name", default="Фермер",
+                        help="ім'я фермера для нової гри")
+    parser.add_argument("--herd-store", action="store_true",
+                        help="використати векторизоване сховище стада (потрібен NumPy)")
+    parser.add_argument("--bulk", action="store_true",
+                        help="масове просування часу пакетами по днях")
+    parser.add_argument("--buy", nargs="*", default=[], metavar="TYPE",
+                        help="тварини, які купуються на старті (наприклад: cow chicken chicken)")
+    parser.add_argument("--replay", metavar="FILE",
+                        help="відтворити журнал дій зі збереження або файлу --record")
+    parser.add_argument("--record", metavar="FILE",
+                        help="записати журнал дій прогону у файл")
+    return parser.parse_args(argv)
+
+
+def load_replay(path: str):
+    """
+    Прочитати журнал дій і кінцеву ігрову годину
+    Підходить і файл збереження, і файл, записаний --record
+    Читається тим самим завантажувачем, що й у грі: формат (JSON/бінарний)
+    визначається автоматично, журнал змін .journal застосовується
+    """
+    data = SaveJournal(path).load()
+
+    if "entries" in data:
+        return ActionLog.from_dict(data), data.get("end_hour")
+
+    end_hour = None
+    if "current_day" in data:
+        end_hour = (data["current_day"] - 1) * 24 + data["current_hour"]
+    return ActionLog.from_dict(data.get("action_log")), end_hour
+
+
+def run_replay(game_state: GameState, path: str) -> int:
+    """Відтворити сесію з файлу та вивести підсумок"""
+    try:
+        log, end_hour = load_replay(path)
+        start = time.perf_counter()
+        replay(game_state, log, until_hour=end_hour)
+        elapsed = time.perf_counter() - start
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Не вдалося відтворити журнал: {e}", file=sys.stderr)
+        return 1
+
+    print(format_summary(game_state))
+    print("-" * 40)
+    print(f"Відтворено {len(log)} дій, {game_state.get_game_hour()} год за {elapsed:.3f} с")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Точка входу CLI"""
+    args = parse_args(argv)
+
+    game_state = GameState()
+    # Симуляція не повинна перезаписувати збереження гравця
+    # і витрачати час на денні знімки для відкату
+    game_state.auto_save = False
+    game_state.snapshots.enabled = False
+
+    if args.herd_store and not game_state.enable_herd_store():
+        print("NumPy недоступний, векторизоване сховище вимкнено", file=sys.stderr)
+        return 1
+
+    if args.replay:
+        return run_replay(game_state, args.replay)
+
+    if args.load:
+        if not game_state.load_game():
+            print("Не вдалося завантажити збереження", file=sys.stderr)
+            return 1
+    else:
+        game_state.new_game(args.farm_name, args.farmer_name, seed=args.seed)
+
+    for i, animal_type in enumerate(args.buy):
+        if animal_type not in ANIMAL_TYPES:
+            print(f"Невідомий тип тварини: {animal_type}", file=sys.stderr)
+            return 1
+        game_state.buy_animal(animal_type, f"{ANIMAL_TYPES[animal_type]['name']} {i + 1}")
+
+    hours = max(0, args.days) * 24
+    elapsed = run_simulation(game_state, hours, bulk=args.bulk)
+
+    print(format_summary(game_state))
+    print("-" * 40)
+    throughput = hours / elapsed if elapsed > 0 else float("inf")
+    print(f"Симульовано {hours} год за {elapsed:.3f} с ({throughput:.0f} год/с)")
+
+    if args.record:
+        data = game_state.action_log.to_dict()
+        data["end_hour"] = game_state.get_game_hour()
+        with open(args.record, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+"""
+Кільце денних знімків стану в пам'яті для миттєвого відкату
+Знімок робиться на початку кожного ігрового дня. Незмінні частини
+спільні між знімками: незмінні дані тварин (id, тип, ім'я, порода,
+статистика) і невеликі секції (будівлі, корми, досягнення...)
+посилаються на об'єкти попереднього знімка, а щоденно змінні поля
+тварин зберігаються компактними масивами. Зі сховищем стада знімок -
+це копія його масивів NumPy.
+"""
+
+import copy
+from array import array
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+
+# Поля тварин, що майже не змінюються (спільні між знімками)
+COLD_FIELDS = ("id", "animal_type", "name", "breed", "total_fed", "total_produced")
+
+# Поля, що змінюються щогодини/щодня: (поле, тип масиву)
+HOT_FIELDS = (
+    ("age", "l"),
+    ("health", "d"),
+    ("hunger", "d"),
+    ("happiness", "d"),
+    ("is_alive", "b"),
+    ("production_cooldown", "l"),
+    ("days_on_farm", "l"),
+)
+
+# Невеликі секції стану, які повторно використовуються, якщо не змінились
+SHARED_KEYS = ("farmer", "products", "feeds", "buildings", "achievements")
+
+
+class DaySnapshot:
+    """Знімок стану гри на початок дня"""
+
+    __slots__ = ("day", "state", "cold", "hot", "log_length", "log_tail")
+
+    def __init__(self, day: int, state: Dict[str, Any], cold: Optional[Tuple[tuple, ...]],
+                 hot: Dict[str, Any], log_length: int, log_tail: Optional[list] = None):
+        self.day = day
+        self.state = state
+        self.cold = cold
+        self.hot = hot
+        self.log_length = log_length
+        # Заміна останнього запису журналу, якщо знімок зроблено посеред advance_hours
+        self.log_tail = log_tail
+
+    def to_save_data(self, action_log: Dict[str, Any]) -> Dict[str, Any]:
+        """Відтворити дані у форматі збереження (для GameState._apply_save_data)"""
+        # Секції спільні з іншими знімками - гра отримує власну копію
+        data = copy.deepcopy(self.state)
+        if self.cold is None:
+            # Знімок масивів сховища стада
+            from .herd_store import columns_to_dicts
+            data["animals"] = columns_to_dicts(self.hot)
+        else:
+            columns = [(name, self.hot[name]) for name, _ in HOT_FIELDS]
+            animals = []
+            for i, cold in enumerate(self.cold):
+                animal = dict(zip(COLD_FIELDS, cold))
+                for name, column in columns:
+                    animal[name] = column[i]
+                animal["is_alive"] = bool(animal["is_alive"])
+                animals.append(animal)
+            data["animals"] = animals
+
+        log = dict(action_log)
+        log["entries"] = log["entries"][:self.log_length]
+        if self.log_tail is not None:
+            log["entries"][-1] = list(self.log_tail)
+        data["action_log"] = log
+        return data
+
+
+class SnapshotRing:
+    """
+    Обмежене кільце денних знімків (найстаріший витісняється)
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.enabled = capacity > 0
+        self._snapshots: Deque[DaySnapshot] = deque(maxlen=max(1, capacity))
+        # Останні незмінні записи тварин за id - для спільного використання
+        self._cold_by_id: Dict[int, tuple] = {}
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    def clear(self):
+        self._snapshots.clear()
+        self._cold_by_id = {}
+
+    def days(self) -> List[int]:
+        """Дні, до яких можна відкотитись (від найновішого)"""
+        return [s.day for s in reversed(self._snapshots)]
+
+    def capture(self, game_state) -> Optional[DaySnapshot]:
+        """Зробити знімок поточного стану"""
+        if not self.enabled:
+            return None
+
+        state = game_state._build_state_data()
+        state.pop("saved_at", None)
+        previous = self._snapshots[-1] if self._snapshots else None
+        if previous is not None:
+            for key in SHARED_KEYS:
+                if state[key] == previous.state[key]:
+                    state[key] = previous.state[key]
+
+        if game_state.herd is not None:
+            # Масиви стада копіюються цілком - без об'єкта на тварину
+            cold_records = None
+            hot = game_state.herd.copy_columns()
+            self._cold_by_id = {}
+        else:
+            animals = game_state.animals
+            old_cold = self._cold_by_id
+            new_cold = {}
+            cold_records = []
+            for animal in animals:
+                record = (animal.id, animal.animal_type, animal.name, animal.breed,
+                          animal.total_fed, animal.total_produced)
+                shared = old_cold.get(animal.id)
+                if shared == record:
+                    record = shared
+                new_cold[animal.id] = record
+                cold_records.append(record)
+            cold_records = tuple(cold_records)
+            self._cold_by_id = new_cold
+
+            hot = {
+                name: array(typecode, [getattr(a, name) for a in animals])
+                for name, typecode in HOT_FIELDS
+            }
+
+        # Посеред advance_hours у журналі вже вся дія - лишаємо тільки виконані години
+        log_tail = None
+        entries = game_state.action_log.entries
+        if game_state.advance_remaining and entries:
+            hour, action, hours = entries[-1]
+            log_tail = [hour, action, hours - game_state.advance_remaining]
+
+        snapshot = DaySnapshot(game_state.current_day, state, cold_records, hot,
+                               len(entries), log_tail)
+        self._snapshots.append(snapshot)
+        return snapshot
+
+    def get(self, days_back: int) -> Optional[DaySnapshot]:
+        """Знімок days_back днів тому (1 - початок поточного дня)"""
+        if days_back < 1 or days_back > len(self._snapshots):
+            return None
+        return self._snapshots[-days_back]
+
+    def drop_newer(self, snapshot: DaySnapshot):
+        """Прибрати знімки, новіші за вказаний (після відкату)"""
+        while self._snapshots and self._snapshots[-1] is not snapshot:
+            self._snapshots.pop()
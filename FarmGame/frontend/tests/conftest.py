@@ -0,0 +1,114 @@
+"""
+Спільні фікстури тестів
+Запуск (з каталогу frontend):
+    python -m pytest tests
+"""
+
+import json
+import os
+import sys
+from typing import Any, Dict
+
+import pytest
+
+# Тести імпортують пакет game так само, як main.py - з каталогу frontend
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game.game_state import GameState
+from game import herd_store
+
+
+def _new_game_state() -> GameState:
+    """Свіжий GameState (Singleton скидається, щоб тести не ділили стан)"""
+    GameState._instance = None
+    game_state = GameState()
+    game_state.auto_save = False
+    game_state.offline_progress = False
+    return game_state
+
+
+@pytest.fixture
+def save_dir(tmp_path, monkeypatch):
+    """Файли збережень (шляхи відносні) - у тимчасовому каталозі"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture(params=["list", "herd"])
+def herd_mode(request):
+    """Режим зберігання тварин: звичайний список або сховище стада (NumPy)"""
+    if request.param == "herd" and not herd_store.is_available():
+        pytest.skip("NumPy недоступний")
+    return request.param == "herd"
+
+
+@pytest.fixture
+def make_game(save_dir):
+    """Фабрика нових ігор із кількома тваринами"""
+    created = []
+
+    def make(herd: bool = False, seed: int = 5, animals: int = 12) -> GameState:
+        game_state = _new_game_state()
+        created.append(game_state)
+        game_state.enable_herd_store(herd, seed=1)
+        game_state.new_game("Ферма", "Фермер", seed=seed)
+        game_state.farmer.money = 1e6
+        for i in range(animals):
+            animal_type = ("cow", "chicken", "pig", "sheep")[i % 4]
+            game_state.buy_animal(animal_type, f"Тварина {i}")
+        return game_state
+
+    yield make
+    for game_state in created:
+        game_state.wait_for_saves()
+        game_state.save_journal.wait()
+    GameState._instance = None
+
+
+
+def _game_snapshot(game_state: GameState) -> Dict[str, Any]:
+    """
+    Повний стан гри у вигляді даних збереження (без часу запису),
+    тварини впорядковані за id - для порівняння до і після збереження
+    """
+    data = json.loads(json.dumps(game_state._build_save_data()))
+    data.pop("saved_at")
+    data["animals"].sort(key=lambda a: a["id"])
+    return data
+
+
+@pytest.fixture
+def snapshot():
+    return _game_snapshot
+
+
+def _play(game_state: GameState, checkpoint=lambda: None):
+    """
+    Сценарій гри: плин часу, смерть від голоду, дії гравця, новий день
+    checkpoint викликається між кроками (наприклад, для збереження)
+    """
+    animals = list(game_state.animals)
+    game_state.advance_hours(5)
+    checkpoint()
+    # Одна тварина лишається без корму і скоро помре
+    animals[1].hunger = 1.0
+    game_state.feed_animal(animals[0].id, "hay")
+    game_state.pet_animal(animals[2].id)
+    game_state._advance_hour()
+    game_state._advance_hour()
+    checkpoint()
+    game_state.sell_animal(animals[3].id)
+    game_state.buy_animal("chicken", "Новенька")
+    game_state.collect_products()
+    game_state.buy_feed("grain", 10)
+    checkpoint()
+    game_state.advance_hours(30)
+    game_state.heal_animal(animals[4].id)
+    game_state.upgrade_building("barn")
+    checkpoint()
+    game_state._advance_hour()
+
+
+@pytest.fixture
+def play():
+    return _play
@@ -0,0 +1,41 @@
+"""Бінарна серіалізація ферми C++ бекенду (Farm.serialize / Farm.deserialize)"""
+
+import pytest
+
+# Модуль копіюється в game/ після збірки CMake; без нього тести пропускаються
+fb = pytest.importorskip("game.farm_backend")
+
+
+@pytest.fixture
+def farm():
+    farm = fb.Farm("Тестова ферма", "Фермер")
+    # По одній тварині кожного виду, щоб перевірити стан усіх порід
+    for animal_type in fb.AnimalType.__members__.values():
+        animal = fb.AnimalFactory.create_animal(animal_type, animal_type.name, 30)
+        assert farm.add_animal(animal)
+    farm.add_feed(fb.FeedType.HAY, 200.0)
+    farm.advance_time(50)
+    return farm
+
+
+def test_serialize_round_trip(farm):
+    data = farm.serialize()
+    restored = fb.Farm.deserialize(data)
+
+    assert restored is not None
+    assert restored.get_name() == farm.get_name()
+    assert restored.get_money() == farm.get_money()
+    assert restored.get_current_day() == farm.get_current_day()
+    assert restored.get_current_hour() == farm.get_current_hour()
+    assert ([a.get_type_name() for a in restored.get_all_animals()]
+            == [a.get_type_name() for a in farm.get_all_animals()])
+    # Повторна серіалізація дає ті самі байти - жодне поле не губиться
+    assert restored.serialize() == data
+
+
+def test_deserialize_rejects_bad_data(farm):
+    data = farm.serialize()
+
+    assert fb.Farm.deserialize(data[:len(data) // 2]) is None
+    assert fb.Farm.deserialize(b"junk") is None
+    assert fb.Farm.deserialize(b"") is None
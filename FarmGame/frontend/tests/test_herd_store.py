@@ -0,0 +1,95 @@
+"""Сховище стада: стовпці масивів <-> записи тварин"""
+
+import pytest
+
+from game import herd_store
+from game.game_state import AnimalData
+from game.save_format import FORMAT_BINARY, load_mapped, write_save_file
+
+pytestmark = pytest.mark.skipif(not herd_store.is_available(), reason="NumPy недоступний")
+
+
+def make_animals(count=10):
+    return [
+        AnimalData(id=i * 3 + 1, animal_type=("cow", "chicken", "pig")[i % 3],
+                   name=f"Тварина {i} ✓", age=i, health=100 - i * 1.25, hunger=50 + i / 3,
+                   happiness=75.5, is_alive=i % 4 != 0, production_cooldown=i % 5,
+                   breed=("default", "rare")[i % 2], total_fed=i * 2, total_produced=i,
+                   days_on_farm=i + 1)
+        for i in range(count)
+    ]
+
+
+def test_columns_round_trip():
+    animals = make_animals()
+    store = herd_store.HerdStore(capacity=4)
+    store.extend(animals)
+
+    expected = [a.to_dict() for a in animals]
+    assert store.to_dicts() == expected
+    assert herd_store.columns_to_dicts(store.copy_columns()) == expected
+    assert [a.to_dict() for a in store.animals] == expected
+
+
+def test_load_mapped_round_trip(save_dir):
+    animals = make_animals()
+    write_save_file("herd.sav", {"animals": [a.to_dict() for a in animals], "farm_name": "Ферма"},
+                    FORMAT_BINARY)
+
+    store = herd_store.HerdStore()
+    data = load_mapped("herd.sav", store)
+    assert "animals" not in data and data["farm_name"] == "Ферма"
+    assert store.to_dicts() == [a.to_dict() for a in animals]
+
+
+def test_apply_changes_keeps_order():
+    animals = make_animals()
+    store = herd_store.HerdStore()
+    store.extend(animals)
+
+    changed = animals[5].to_dict()
+    changed["hunger"] = 1.0
+    added = AnimalData(id=100, animal_type="sheep", name="Нова").to_dict()
+    store.apply_changes([changed, added], removed=[animals[2].id, animals[7].id])
+    store.update_fields({animals[0].id: {"health": 3.5}, 999: {"health": 1.0}})
+
+    expected = [a.to_dict() for a in animals if a.id not in (animals[2].id, animals[7].id)]
+    expected[0]["health"] = 3.5
+    expected[4]["hunger"] = 1.0
+    assert store.to_dicts() == expected + [added]
+
+
+def test_views_follow_store_changes():
+    store = herd_store.HerdStore()
+    store.extend(make_animals(3))
+    view = store.view(2)
+    view.hunger = 12.0
+    assert store.hunger[2] == 12.0
+
+    store.remove(store.view(0))
+    # Остання тварина переїхала у звільнений слот разом зі своїм поданням
+    assert view.hunger == 12.0 and store.find(view.id) is view
+
+
+@pytest.mark.parametrize("by_journal", [False, True])
+def test_removal_compacts_names(by_journal):
+    animals = make_animals(200)
+    store = herd_store.HerdStore()
+    store.extend(animals)
+    full = len(store.copy_columns()["names"])
+
+    kept = animals[::10]
+    removed = [a for a in animals if a not in kept]
+    if by_journal:
+        store.apply_changes([], removed=[a.id for a in removed])
+    else:
+        for animal in removed:
+            store.remove(store.find(animal.id))
+
+    # Імена видалених тварин не накопичуються у збереженні
+    names = store.copy_columns()["names"]
+    used = sum(len(a.name.encode("utf-8")) for a in store.animals)
+    assert len(names) - used <= max(herd_store.NAMES_COMPACT_MIN, used)
+    assert len(names) < full / 2
+    assert sorted(a["id"] for a in store.to_dicts()) == sorted(a.id for a in kept)
+    assert {a["id"]: a["name"] for a in store.to_dicts()} == {a.id: a.name for a in kept}
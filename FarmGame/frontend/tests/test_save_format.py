@@ -0,0 +1,109 @@
+"""Бінарний формат збереження (FRMS) і конвертер форматів"""
+
+import json
+import os
+import threading
+
+import pytest
+
+from game.constants import SAVE_FILE
+from game.save_format import (
+    FORMAT_BINARY, FORMAT_JSON, MAGIC, SaveFormatError,
+    convert, decode, encode, read_save_file, write_save_file
+)
+from game.save_journal import JOURNAL_SUFFIX
+
+
+def test_encode_decode_round_trip(make_game, herd_mode, play):
+    game_state = make_game(herd_mode)
+    play(game_state)
+    # Дані - такі, якими їх побачить JSON (кортежі стають списками)
+    data = json.loads(json.dumps(game_state._build_save_data()))
+
+    raw = encode(data)
+    assert raw.startswith(MAGIC)
+    assert decode(raw) == data
+
+
+@pytest.mark.parametrize("journaled", [False, True])
+def test_binary_save_round_trip(make_game, herd_mode, snapshot, play, journaled):
+    # У режимі стада бінарний знімок читається через mmap (load_mapped)
+    game_state = make_game(herd_mode)
+    game_state.save_format = FORMAT_BINARY
+    game_state.journaled_saves = journaled
+    play(game_state, game_state.save_game)
+    game_state.save_game()
+    expected = snapshot(game_state)
+
+    assert read_save_file(SAVE_FILE)[1] == FORMAT_BINARY
+    assert game_state.load_game()
+    assert snapshot(game_state) == expected
+
+
+@pytest.mark.parametrize("src_format", [FORMAT_JSON, FORMAT_BINARY])
+def test_convert_merges_pending_journal(make_game, snapshot, play, src_format):
+    game_state = make_game()
+    game_state.save_format = src_format
+    game_state.journaled_saves = True
+    play(game_state, game_state.save_game)
+    game_state.save_game()
+    game_state.wait_for_saves()
+    expected = snapshot(game_state)
+
+    dst_format = convert(SAVE_FILE, "converted.sav")
+    assert dst_format != src_format
+    data, save_format = read_save_file("converted.sav")
+    assert save_format == dst_format
+    data.pop("saved_at")
+    data.pop("journal_seq")
+    data["animals"].sort(key=lambda a: a["id"])
+    assert data == expected
+
+
+def test_convert_in_place_keeps_journal_consistent(make_game, snapshot, play):
+    game_state = make_game()
+    game_state.journaled_saves = True
+    play(game_state, game_state.save_game)
+    game_state.save_game()
+    game_state.wait_for_saves()
+    expected = snapshot(game_state)
+
+    convert(SAVE_FILE, SAVE_FILE, FORMAT_BINARY)
+    # Журнал лишився поруч, але його записи вже злиті й пропускаються за journal_seq
+    with open(SAVE_FILE + JOURNAL_SUFFIX, encoding="utf-8") as f:
+        assert f.read().strip()
+    assert game_state.load_game()
+    assert snapshot(game_state) == expected
+
+
+def test_truncated_file_is_rejected(make_game, save_dir):
+    game_state = make_game()
+    write_save_file("full.sav", game_state._build_save_data(), FORMAT_BINARY)
+    raw = (save_dir / "full.sav").read_bytes()
+
+    with pytest.raises(SaveFormatError):
+        decode(raw[:len(raw) // 2])
+
+
+def test_menu_queries_do_not_wait_for_save(make_game, monkeypatch):
+    game_state = make_game()
+    release = threading.Event()
+    write_save = game_state._write_save
+
+    def slow_write(*args):
+        release.wait(5)
+        write_save(*args)
+
+    monkeypatch.setattr(game_state, "_write_save", slow_write)
+    future = game_state.save_game_async()
+    try:
+        # Файлу ще немає, але меню вже бачить збереження та його відомості
+        assert not os.path.exists(SAVE_FILE)
+        assert game_state.has_save_file()
+        assert game_state.get_save_metadata()["current_day"] == game_state.current_day
+        assert not future.done()
+    finally:
+        release.set()
+
+    future.result()
+    assert game_state.get_save_metadata()["farm_name"] == game_state.farm_name
@@ -0,0 +1,120 @@
+"""Журнал змін збереження: що пишеться в запис і як він застосовується"""
+
+import json
+import os
+
+from game import save_journal
+from game.save_journal import HOURLY_ANIMAL_FIELDS, JOURNAL_SUFFIX
+from game.constants import SAVE_FILE
+
+
+def read_journal():
+    with open(SAVE_FILE + JOURNAL_SUFFIX, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def animal_rows(game_state):
+    return sorted(tuple(sorted(a.to_dict().items())) for a in game_state.animals)
+
+
+def test_hour_without_actions_does_not_rewrite_herd(make_game, herd_mode):
+    game_state = make_game(herd_mode, animals=20)
+    game_state.journaled_saves = True
+    game_state.save_game()
+
+    game_state._advance_hour()
+    game_state.save_game()
+
+    (delta,) = read_journal()
+    # Жодного повного запису тварини - лише стовпці полів, які змінює час
+    assert delta["animals"] == []
+    columns = delta["animal_columns"]
+    assert set(columns) == {"id", *HOURLY_ANIMAL_FIELDS}
+    assert sorted(columns["id"]) == sorted(a.id for a in game_state.animals)
+
+    game_state.load_game()
+    assert all(a.hunger == 99.5 for a in game_state.animals)
+
+
+def test_player_action_writes_only_that_animal(make_game, herd_mode):
+    game_state = make_game(herd_mode)
+    game_state.journaled_saves = True
+    game_state.save_game()
+
+    animal_id = game_state.animals[3].id
+    game_state.sell_animal(animal_id)
+    game_state.heal_animal(game_state.animals[0].id)
+    game_state.save_game()
+
+    (delta,) = read_journal()
+    assert [a["id"] for a in delta["animals"]] == [game_state.animals[0].id]
+    assert delta["removed_animals"] == [animal_id]
+    assert "animal_columns" not in delta
+
+
+def test_new_day_writes_age_columns_and_loads_back(make_game, herd_mode):
+    game_state = make_game(herd_mode)
+    game_state.journaled_saves = True
+    game_state.save_game()
+
+    game_state.advance_hours(30)
+    game_state.save_game()
+    expected = animal_rows(game_state)
+
+    (delta,) = read_journal()
+    assert "age" in delta["animal_columns"]
+    game_state.load_game()
+    assert animal_rows(game_state) == expected
+
+
+def test_journaled_session_round_trip(make_game, herd_mode, snapshot, play):
+    game_state = make_game(herd_mode)
+    game_state.journaled_saves = True
+    play(game_state, game_state.save_game)
+    game_state.save_game()
+    expected = snapshot(game_state)
+
+    assert len(read_journal()) == 4
+    assert game_state.load_game()
+    assert snapshot(game_state) == expected
+
+
+def test_compaction_merges_journal_into_snapshot(make_game, herd_mode, snapshot, play, monkeypatch):
+    monkeypatch.setattr(save_journal, "COMPACT_EVERY", 3)
+    game_state = make_game(herd_mode)
+    game_state.journaled_saves = True
+    play(game_state, game_state.save_game)
+    game_state.save_game()
+    game_state.wait_for_saves()
+    game_state.save_journal.wait()
+    expected = snapshot(game_state)
+
+    assert game_state.save_journal.last_error is None
+    assert not os.path.exists(SAVE_FILE + save_journal.COMPACTING_SUFFIX)
+    # Перше збереження - повний знімок; записи 1-3 злиті з ним, 4-й - у новому журналі
+    assert [d["seq"] for d in read_journal()] == [4]
+    assert game_state.load_game()
+    assert snapshot(game_state) == expected
+
+
+def test_torn_last_line_is_ignored(make_game, snapshot):
+    game_state = make_game()
+    game_state.journaled_saves = True
+    game_state.save_game()
+    game_state.advance_hours(3)
+    game_state.save_game()
+    expected = snapshot(game_state)
+
+    # Збій посеред запису наступного збереження
+    with open(SAVE_FILE + JOURNAL_SUFFIX, "a", encoding="utf-8") as f:
+        f.write('{"seq": 2, "state": {"current_hour"')
+
+    assert game_state.load_game()
+    assert snapshot(game_state) == expected
+
+    # Наступний запис не приклеюється до обірваного рядка
+    game_state.advance_hours(2)
+    game_state.save_game()
+    expected = snapshot(game_state)
+    assert game_state.load_game()
+    assert snapshot(game_state) == expected
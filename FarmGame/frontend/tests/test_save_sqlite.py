@@ -0,0 +1,73 @@
+"""Сховище збережень SQLite: слоти і оновлення лише змінених рядків"""
+
+import pytest
+
+from game import save_sqlite
+from game.save_sqlite import SqliteSaveStore
+
+pytestmark = pytest.mark.skipif(not save_sqlite.is_available(), reason="SQLite без UPSERT")
+
+
+def test_slot_round_trip(make_game, herd_mode, snapshot, play):
+    game_state = make_game(herd_mode)
+    assert game_state.use_sqlite_store("farm.db", "main")
+    play(game_state, game_state.save_game)
+    game_state.save_game()
+    expected = snapshot(game_state)
+
+    assert game_state.load_game()
+    assert snapshot(game_state) == expected
+    game_state.use_sqlite_store(None)
+
+
+def test_incremental_save_updates_rows_in_place(make_game, herd_mode):
+    game_state = make_game(herd_mode)
+    game_state.use_sqlite_store("farm.db", "main")
+    game_state.save_game()
+    store = game_state.save_store
+    total = store.count_animals("main")
+
+    game_state.advance_hours(3)
+    game_state.sell_animal(game_state.animals[0].id)
+    game_state.save_game()
+    game_state.wait_for_saves()
+
+    assert store.count_animals("main") == total - 1
+    assert store.count_animals("main", alive=True) == total - 1
+    hungers = {a["id"]: a["hunger"] for a in store.load("main")["animals"]}
+    assert hungers == {a.id: a.hunger for a in game_state.animals}
+    game_state.use_sqlite_store(None)
+
+
+def test_slots_are_independent(make_game, snapshot, save_dir):
+    store_path = str(save_dir / "farm.db")
+    first = make_game(seed=1)
+    first.use_sqlite_store(store_path, "first")
+    first.save_game()
+    expected = snapshot(first)
+    first.use_sqlite_store(None)
+
+    second = make_game(seed=2, animals=3)
+    second.use_sqlite_store(store_path, "second")
+    second.save_game()
+    second.use_sqlite_store(None)
+
+    store = SqliteSaveStore(store_path)
+    try:
+        slots = {s["slot"]: s for s in store.list_slots()}
+        assert set(slots) == {"first", "second"}
+        assert slots["second"]["herd_size"] == 3
+        assert store.count_animals("first", animal_type="cow") == 3
+
+        store.delete_slot("second")
+        assert not store.has_slot("second")
+        with pytest.raises(KeyError):
+            store.load("second")
+    finally:
+        store.close()
+
+    game_state = make_game()
+    game_state.use_sqlite_store(store_path, "first")
+    assert game_state.load_game()
+    assert snapshot(game_state) == expected
+    game_state.use_sqlite_store(None)
@@ -0,0 +1,126 @@
+"""Масове просування часу і відтворення сесії з журналу дій"""
+
+import pytest
+
+from game.action_log import ActionLog, replay
+from game.constants import ANIMAL_TYPES
+from game.game_state import GameState
+
+
+@pytest.fixture
+def no_sickness(monkeypatch):
+    """Без хвороб обидва шляхи не залежать від того, як витрачаються випадкові числа"""
+    monkeypatch.setattr(GameState, "_get_sickness_table",
+                        lambda self: {animal_type: 0.0 for animal_type in ANIMAL_TYPES})
+
+
+def prepare(game_state):
+    """Стадо з тваринами в різному стані, зокрема такими, що помруть"""
+    for i, animal in enumerate(game_state.animals):
+        animal.hunger = 5.0 + i * 8.5
+        animal.happiness = 15.0 + i * 6.3
+        animal.health = 12.0 + i * 7.7
+        animal.production_cooldown = i
+    return game_state
+
+
+def animal_state(game_state):
+    return {a.id: (a.is_alive, a.hunger, a.happiness, a.health, a.production_cooldown, a.age)
+            for a in game_state.animals}
+
+
+@pytest.mark.parametrize("hours", [1, 7, 17, 40, 75])
+def test_batched_advance_matches_hourly(make_game, herd_mode, no_sickness, hours):
+    hourly = prepare(make_game(herd_mode))
+    for _ in range(hours):
+        hourly._advance_hour()
+    expected = animal_state(hourly)
+
+    batched = prepare(make_game(herd_mode))
+    batched.advance_hours(hours)
+    actual = animal_state(batched)
+
+    assert batched.get_game_hour() == hourly.get_game_hour()
+    assert actual.keys() == expected.keys()
+    for animal_id, (alive, *values) in expected.items():
+        assert actual[animal_id][0] == alive
+        assert actual[animal_id][1:] == pytest.approx(values, abs=1e-9)
+    assert batched.aggregates.living_count == hourly.aggregates.living_count
+
+
+@pytest.mark.parametrize("batched", [False, True])
+def test_batched_sickness_rate_matches_hourly(make_game, monkeypatch, batched):
+    # Зі хворобами пакет витрачає випадкові числа інакше, тож збігається
+    # лише середня втрата здоров'я: 20 тварин * 480 год * 5% * 1.25 = 600
+    monkeypatch.setattr(GameState, "_get_sickness_table",
+                        lambda self: {animal_type: 0.05 for animal_type in ANIMAL_TYPES})
+    game_state = make_game(animals=20)
+    loss = 0.0
+    for _ in range(40):
+        for animal in game_state.animals:
+            animal.health, animal.hunger, animal.happiness = 100.0, 100.0, 100.0
+        if batched:
+            game_state.advance_hours(12)
+        else:
+            for _ in range(12):
+                game_state._advance_hour()
+        loss += sum(100.0 - a.health for a in game_state.animals)
+    assert loss == pytest.approx(600, rel=0.15)
+
+
+def play_logged(game_state):
+    """Сесія лише з дій, що пишуться в журнал: покупки, догляд, продаж, плин часу"""
+    def hours(count):
+        for _ in range(count):
+            game_state._advance_hour()
+
+    for i in range(8):
+        game_state.buy_animal(("chicken", "pig", "sheep")[i % 3], f"Тварина {i}")
+    hours(30)
+    game_state.collect_products()
+    for product_type, product in list(game_state.products.items()):
+        game_state.sell_product(product_type, product.amount)
+    game_state.feed_animals()
+    game_state.pet_animal(game_state.animals[1].id)
+    game_state.advance_hours(50)
+    game_state.sell_animal(game_state.animals[0].id)
+    game_state.buy_feed("grain", 20)
+    hours(5)
+    game_state.heal_animal(game_state.animals[2].id)
+    game_state.feed_animal(game_state.animals[3].id, "grain")
+    # Без корму решта стада помирає з голоду
+    game_state.advance_hours(150)
+    hours(3)
+
+
+def test_replay_reproduces_session(make_game, herd_mode, snapshot):
+    game_state = make_game(herd_mode, animals=0)
+    game_state.new_game("Ферма", "Фермер", seed=7)
+    play_logged(game_state)
+    end_hour = game_state.get_game_hour()
+    expected = snapshot(game_state)
+    assert 0 < game_state.aggregates.living_count < len(game_state.animals)
+
+    log = ActionLog.from_dict(game_state.action_log.to_dict())
+    fresh = make_game(herd_mode, seed=99, animals=0)
+    replay(fresh, log, until_hour=end_hour)
+    assert snapshot(fresh) == expected
+
+
+def test_load_does_not_pay_unlogged_rewards(make_game, herd_mode, snapshot, save_dir):
+    game_state = make_game(herd_mode, animals=0)
+    game_state.new_game("Ферма", "Фермер", seed=7)
+    play_logged(game_state)
+    # Прапорець загубився (як у старому збереженні), хоча умова виконана
+    game_state.achievements["first_animal"] = False
+    money = game_state.farmer.money
+    game_state.save_game()
+
+    assert game_state.load_game()
+    assert game_state.achievements["first_animal"]
+    assert game_state.farmer.money == money
+
+    log = ActionLog.from_dict(game_state.action_log.to_dict())
+    fresh = make_game(herd_mode, seed=99, animals=0)
+    replay(fresh, log, until_hour=game_state.get_game_hour())
+    assert snapshot(fresh) == snapshot(game_state)
@@ -10,6 +10,8 @@ from .input_field import InputField
 from .animal_card import AnimalCard
 from .notification import NotificationPopup, NotificationManager
 from .tooltip import Tooltip
+from .text_cache import TextCache, TEXT_CACHE, render_text
+from .dirty_regions import DirtyRegions
 
 __all__ = [
     'Button', 'ImageButton', 'IconButton',
@@ -19,5 +21,7 @@ __all__ = [
     'InputField',
     'AnimalCard',
     'NotificationPopup', 'NotificationManager',
-    'Tooltip'
+    'Tooltip',
+    'TextCache', 'TEXT_CACHE', 'render_text',
+    'DirtyRegions'
 ]
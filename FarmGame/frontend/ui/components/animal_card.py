@@ -10,6 +10,11 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from game.constants import COLORS, FONT_SIZES, ANIMAL_TYPES, get_font, get_emoji_font
 from game.game_state import AnimalData
+from .text_cache import render_text
+
+
+# Колір прозорих кутів готової поверхні картки (не трапляється в самій картці)
+CARD_COLORKEY = (255, 0, 255)
 
 
 class AnimalCard:
@@ -49,6 +54,10 @@ class AnimalCard:
         self.emoji_font = get_emoji_font(32)  # Для emoji тварини
         self.icon_font = get_emoji_font(20)   # Для іконок статус барів
         
+        # Готова поверхня картки і ключ показаних значень, з якими її відмальовано
+        self._surface: Optional[pygame.Surface] = None
+        self._surface_key: Optional[tuple] = None
+        
         # Кнопки
         self._create_buttons()
     
@@ -113,60 +122,93 @@ class AnimalCard:
         # Анімація масштабу
         scale_diff = self.target_scale - self.scale
         self.scale += scale_diff * dt * 10
-        
-        # Оновлення позицій кнопок
-        self._create_buttons()
+    
+    def _display_key(self) -> tuple:
+        """
+        Показані значення з точністю відображення (ширина заповнення
+        барів у пікселях, їх колір) та стан наведення і вибору
+        """
+        animal = self.animal
+        bar_width = self.rect.width - 40 - 30
+        return (
+            self.rect.size, self.hovered, self.selected,
+            animal.animal_type, animal.name, animal.age, animal.is_alive,
+            int((animal.health / 100) * bar_width), self._get_health_color(),
+            int((animal.hunger / 100) * bar_width), self._get_hunger_color(),
+            int((animal.happiness / 100) * bar_width), self._get_happiness_color(),
+            animal.production_cooldown == 0
+        )
+    
+    def render_key(self) -> tuple:
+        """Усе, від чого залежить вигляд картки (для брудних прямокутників)"""
+        if not self.animal:
+            return (tuple(self.rect),)
+        return (tuple(self.rect),) + self._display_key()
     
     def draw(self, surface: pygame.Surface):
-        """Відмальовка картки"""
+        """Відмальовка картки (готова поверхня перемальовується лише при змінах)"""
         if not self.animal:
             return
         
+        key = self._display_key()
+        if self._surface is None or key != self._surface_key:
+            self._surface = self._render()
+            self._surface_key = key
+        surface.blit(self._surface, self.rect.topleft)
+    
+    def _render(self) -> pygame.Surface:
+        """Відмалювати картку в окрему поверхню (з місцем під тінь)"""
+        # Непрозора поверхня з колірним ключем для заокруглених кутів
+        # блітиться значно швидше за поверхню з альфа-каналом
+        surface = pygame.Surface((self.rect.width + 3, self.rect.height + 3))
+        surface.fill(CARD_COLORKEY)
+        rect = pygame.Rect(0, 0, self.rect.width, self.rect.height)
+        
         # Фон
         bg_color = COLORS["panel"] if not self.selected else COLORS["primary_light"]
         if self.hovered:
             bg_color = tuple(min(255, c + 20) for c in bg_color)
         
         # Тінь
-        shadow_rect = self.rect.copy()
+        shadow_rect = rect.copy()
         shadow_rect.x += 3
         shadow_rect.y += 3
         pygame.draw.rect(surface, (0, 0, 0, 80), shadow_rect, border_radius=10)
         
         # Основний прямокутник
-        pygame.draw.rect(surface, bg_color, self.rect, border_radius=10)
+        pygame.draw.rect(surface, bg_color, rect, border_radius=10)
         
         # Рамка
         border_color = COLORS["primary"] if self.selected else COLORS["border"]
-        pygame.draw.rect(surface, border_color, self.rect, width=2, border_radius=10)
+        pygame.draw.rect(surface, border_color, rect, width=2, border_radius=10)
         
         # Індикатор живий/мертвий
         status_color = COLORS["success"] if self.animal.is_alive else COLORS["danger"]
-        status_rect = pygame.Rect(self.rect.right - 15, self.rect.y + 5, 10, 10)
+        status_rect = pygame.Rect(rect.right - 15, rect.y + 5, 10, 10)
         pygame.draw.circle(surface, status_color, status_rect.center, 5)
         
         # Emoji тварини
         animal_info = ANIMAL_TYPES.get(self.animal.animal_type, {})
         emoji = animal_info.get("emoji", "🐾")
         
-        emoji_surface = self.emoji_font.render(emoji, True, COLORS["text"])
-        emoji_x = self.rect.x + 20
-        emoji_y = self.rect.y + 20
+        emoji_surface = render_text(self.emoji_font, emoji, True, COLORS["text"])
+        emoji_x = rect.x + 20
+        emoji_y = rect.y + 20
         surface.blit(emoji_surface, (emoji_x, emoji_y))
         
         # Ім'я
-        name_surface = self.title_font.render(self.animal.name, True, COLORS["text"])
+        name_surface = render_text(self.title_font, self.animal.name, True, COLORS["text"])
         surface.blit(name_surface, (emoji_x + 45, emoji_y + 5))
         
         # Вік
         age_text = f"Вік: {self.animal.age} дн."
-        age_surface = self.font.render(age_text, True, COLORS["text_secondary"])
+        age_surface = render_text(self.font, age_text, True, COLORS["text_secondary"])
         surface.blit(age_surface, (emoji_x + 45, emoji_y + 30))
         
         # Статус бари
-        bar_x = self.rect.x + 20
+        bar_x = rect.x + 20
         bar_y = emoji_y + 65
-        bar_width = self.rect.width - 40
+        bar_width = rect.width - 40
         bar_height = 14
         
         # Здоров'я
@@ -183,7 +225,13 @@ class AnimalCard:
         
         # Кнопки дій (тільки якщо тварина жива)
         if self.animal.is_alive:
-            self._draw_action_buttons(surface)
+            offset = (-self.rect.x, -self.rect.y)
+            self._draw_action_buttons(surface, self.feed_button_rect.move(offset),
+                                      self.collect_button_rect.move(offset))
+        
+        # Ключ - лише після малювання (інакше змінюється змішування тексту)
+        surface.set_colorkey(CARD_COLORKEY, pygame.RLEACCEL)
+        return surface
     
     def _draw_status_bar(
         self,
@@ -198,7 +246,7 @@ class AnimalCard:
     ):
         """Відмальовка статус бару"""
         # Іконка
-        icon_surface = self.icon_font.render(icon, True, COLORS["text"])
+        icon_surface = render_text(self.icon_font, icon, True, COLORS["text"])
         surface.blit(icon_surface, (x, y - 3))
         
         # Фон бару
@@ -213,26 +261,27 @@ class AnimalCard:
             fill_rect = pygame.Rect(bar_x, y, fill_width, height)
             pygame.draw.rect(surface, color, fill_rect, border_radius=height//2)
     
-    def _draw_action_buttons(self, surface: pygame.Surface):
-        """Відмальовка кнопок дій"""
+    def _draw_action_buttons(self, surface: pygame.Surface, feed_rect: pygame.Rect,
+                             collect_rect: pygame.Rect):
+        """Відмальовка кнопок дій (прямокутники - у координатах surface)"""
         # Кнопка годування
-        pygame.draw.rect(surface, COLORS["warning"], self.feed_button_rect, border_radius=5)
-        feed_icon = self.icon_font.render("🍽️", True, COLORS["white"])
-        icon_x = self.feed_button_rect.x + (self.feed_button_rect.width - feed_icon.get_width()) // 2
-        icon_y = self.feed_button_rect.y + (self.feed_button_rect.height - feed_icon.get_height()) // 2
+        pygame.draw.rect(surface, COLORS["warning"], feed_rect, border_radius=5)
+        feed_icon = render_text(self.icon_font, "🍽️", True, COLORS["white"])
+        icon_x = feed_rect.x + (feed_rect.width - feed_icon.get_width()) // 2
+        icon_y = feed_rect.y + (feed_rect.height - feed_icon.get_height()) // 2
         surface.blit(feed_icon, (icon_x, icon_y))
         
         # Кнопка збору (якщо кулдаун = 0)
         if self.animal.production_cooldown == 0:
-            pygame.draw.rect(surface, COLORS["success"], self.collect_button_rect, border_radius=5)
+            pygame.draw.rect(surface, COLORS["success"], collect_rect, border_radius=5)
         else:
-            pygame.draw.rect(surface, COLORS["gray"], self.collect_button_rect, border_radius=5)
+            pygame.draw.rect(surface, COLORS["gray"], collect_rect, border_radius=5)
         
         animal_info = ANIMAL_TYPES.get(self.animal.animal_type, {})
         product_emoji = animal_info.get("product_emoji", "📦")
-        collect_icon = self.icon_font.render(product_emoji, True, COLORS["white"])
-        icon_x = self.collect_button_rect.x + (self.collect_button_rect.width - collect_icon.get_width()) // 2
-        icon_y = self.collect_button_rect.y + (self.collect_button_rect.height - collect_icon.get_height()) // 2
+        collect_icon = render_text(self.icon_font, product_emoji, True, COLORS["white"])
+        icon_x = collect_rect.x + (collect_rect.width - collect_icon.get_width()) // 2
+        icon_y = collect_rect.y + (collect_rect.height - collect_icon.get_height()) // 2
         surface.blit(collect_icon, (icon_x, icon_y))
     
     def _get_health_color(self) -> Tuple[int, int, int]:
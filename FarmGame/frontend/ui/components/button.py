@@ -10,6 +10,7 @@ import os
 # Додаємо шлях до game модуля
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from game.constants import COLORS, FONT_SIZES, get_font
+from .text_cache import render_text
 
 
 class Button:
@@ -105,6 +106,15 @@ class Button:
         scale_diff = self.target_scale - self.scale
         self.scale += scale_diff * dt * 10
     
+    def render_key(self) -> tuple:
+        """Усе, від чого залежить вигляд кнопки (для брудних прямокутників)"""
+        return (
+            tuple(self.rect), self.text, self.icon, self.enabled, self.pressed, self.hovered,
+            self.color, self.hover_color, self.text_color, self.border_width, self.border_color,
+            int(self.rect.width * self.scale), int(self.rect.height * self.scale),
+            self.animation_offset
+        )
+    
     def draw(self, surface: pygame.Surface):
         """Відмальовка кнопки"""
         # Визначаємо колір
@@ -152,10 +162,10 @@ class Button:
             surface.blit(s, highlight_rect)
         
         # Іконка та текст
-        text_surface = self.font.render(self.text, True, self.text_color)
+        text_surface = render_text(self.font, self.text, True, self.text_color)
         
         if self.icon:
-            icon_surface = self.font.render(self.icon + " ", True, self.text_color)
+            icon_surface = render_text(self.font, self.icon + " ", True, self.text_color)
             total_width = icon_surface.get_width() + text_surface.get_width()
             icon_x = scaled_rect.centerx - total_width // 2
             text_x = icon_x + icon_surface.get_width()
@@ -283,7 +293,7 @@ class IconButton(Button):
         pygame.draw.circle(surface, current_color, center, radius)
         
         # Іконка
-        icon_surface = self.font.render(self.text, True, self.text_color)
+        icon_surface = render_text(self.font, self.text, True, self.text_color)
         icon_rect = icon_surface.get_rect(center=center)
         surface.blit(icon_surface, icon_rect)
         
@@ -294,7 +304,7 @@ class IconButton(Button):
     def _draw_tooltip(self, surface: pygame.Surface):
         """Відмальовка підказки"""
         font = get_font(FONT_SIZES["small"])
-        text_surface = font.render(self.tooltip, True, COLORS["white"])
+        text_surface = render_text(font, self.tooltip, True, COLORS["white"])
         
         padding = 8
         tooltip_rect = pygame.Rect(
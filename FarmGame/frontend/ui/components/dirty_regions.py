@@ -0,0 +1,39 @@
+"""
+Відстеження змінених областей екрана між кадрами
+Екран описує свої області як (назва, прямокутник, ключ відмальовки) -
+ключ містить усе, від чого залежать пікселі області. Область брудна,
+якщо її ключ змінився з минулого кадру; GameEngine у режимі брудних
+прямокутників перемальовує й показує лише такі області.
+"""
+
+import pygame
+from typing import Any, Dict, Hashable, Iterable, List, Tuple
+
+
+class DirtyRegions:
+    """
+    Ключі відмальовки областей з попереднього кадру
+    """
+    
+    def __init__(self):
+        self._keys: Dict[str, Hashable] = {}
+        self._rects: Dict[str, pygame.Rect] = {}
+    
+    def collect(self, regions: Iterable[Tuple[str, pygame.Rect, Any]]) -> List[pygame.Rect]:
+        """Прямокутники областей, ключ яких змінився (і їхнє попереднє положення)"""
+        dirty = []
+        for name, rect, key in regions:
+            if name in self._keys and self._keys[name] == key:
+                continue
+            self._keys[name] = key
+            old_rect = self._rects.get(name)
+            if old_rect is not None and old_rect != rect:
+                dirty.append(old_rect)
+            self._rects[name] = rect
+            dirty.append(rect)
+        return dirty
+    
+    def reset(self):
+        """Забути попередній кадр - наступний collect позначить усе брудним"""
+        self._keys = {}
+        self._rects = {}
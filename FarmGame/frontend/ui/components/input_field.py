@@ -9,6 +9,7 @@ import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from game.constants import COLORS, FONT_SIZES, get_font
+from .text_cache import render_text
 
 
 class InputField:
@@ -177,9 +178,9 @@ class InputField:
         # Текст або placeholder
         if self.text:
             display_text = self._get_display_text()
-            text_surface = self.font.render(display_text, True, self.color)
+            text_surface = render_text(self.font, display_text, True, self.color)
         else:
-            text_surface = self.font.render(self.placeholder, True, self.placeholder_color)
+            text_surface = render_text(self.font, self.placeholder, True, self.placeholder_color)
         
         text_x = self.rect.x + 10 - self.scroll_offset
         text_y = self.rect.centery - text_surface.get_height() // 2
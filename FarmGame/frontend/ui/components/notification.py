@@ -10,6 +10,7 @@ import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from game.constants import COLORS, FONT_SIZES, get_font
+from .text_cache import render_text, with_alpha
 
 
 @dataclass
@@ -69,6 +70,15 @@ class NotificationPopup:
         
         return self.notification.time_remaining > 0
     
+    def render_key(self) -> tuple:
+        """Усе, від чого залежить вигляд сповіщення (для брудних прямокутників)"""
+        progress = self.notification.time_remaining / self.notification.duration
+        return (
+            tuple(self.rect), int(self.rect.x + self.offset_x), int(self.alpha),
+            int((self.width - 20) * progress), self.notification.notification_type,
+            self.notification.title, self.notification.message
+        )
+    
     def draw(self, surface: pygame.Surface):
         """Відмальовка"""
         if self.alpha <= 0:
@@ -111,18 +121,18 @@ class NotificationPopup:
             "error": ""
         }
         icon = icons.get(self.notification.notification_type, "")
-        icon_surface = self.title_font.render(icon, True, color)
-        icon_surface.set_alpha(int(self.alpha))
+        icon_surface = render_text(self.title_font, icon, True, color)
+        icon_surface = with_alpha(icon_surface, self.alpha)
         popup_surface.blit(icon_surface, (15, 15))
         
         # Заголовок
-        title_surface = self.title_font.render(self.notification.title, True, COLORS["text"])
-        title_surface.set_alpha(int(self.alpha))
+        title_surface = render_text(self.title_font, self.notification.title, True, COLORS["text"])
+        title_surface = with_alpha(title_surface, self.alpha)
         popup_surface.blit(title_surface, (45, 12))
         
         # Повідомлення
-        message_surface = self.message_font.render(self.notification.message, True, COLORS["text_secondary"])
-        message_surface.set_alpha(int(self.alpha))
+        message_surface = render_text(self.message_font, self.notification.message, True, COLORS["text_secondary"])
+        message_surface = with_alpha(message_surface, self.alpha)
         popup_surface.blit(message_surface, (45, 38))
         
         # Прогрес бар
@@ -217,6 +227,15 @@ class NotificationManager:
                 self.notifications.remove(popup)
                 self._reposition_notifications()
     
+    def get_area(self) -> pygame.Rect:
+        """Область екрана, де можуть з'являтися сповіщення"""
+        x = self.screen_width - self.notification_width - self.margin_right
+        height = self.max_notifications * (self.notification_height + self.padding)
+        return pygame.Rect(x, self.margin_top, self.screen_width - x, height)
+    
+    def render_key(self) -> tuple:
+        return tuple(popup.render_key() for popup in self.notifications)
+    
     def draw(self, surface: pygame.Surface):
         """Відмальовка"""
         for popup in self.notifications:
@@ -9,6 +9,7 @@ import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from game.constants import COLORS, get_font
+from .text_cache import render_text
 
 
 class Panel:
@@ -99,7 +100,7 @@ class Panel:
                            border_top_right_radius=self.border_radius)
             
             font = get_font(18, bold=True)
-            text = font.render(self.header, True, COLORS["white"])
+            text = render_text(font, self.header, True, COLORS["white"])
             text_rect = text.get_rect(center=(self.rect.width // 2, self.header_height // 2))
             self._surface.blit(text, text_rect)
         
@@ -9,6 +9,7 @@ import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from game.constants import COLORS, get_font
+from .text_cache import render_text
 
 
 class ProgressBar:
@@ -64,6 +65,12 @@ class ProgressBar:
         else:
             self.display_value = self.value
     
+    def render_key(self) -> tuple:
+        """Усе, від чого залежить вигляд бару (для брудних прямокутників)"""
+        fill_width = int((self.display_value / self.max_value) * (self.rect.width - 4))
+        percent = int((self.display_value / self.max_value) * 100)
+        return (tuple(self.rect), fill_width, percent, self.color, self.bg_color, self.show_text)
+    
     def draw(self, surface: pygame.Surface):
         """Відмальовка"""
         # Фон
@@ -101,7 +108,7 @@ class ProgressBar:
         # Текст
         if self.show_text:
             percent = int((self.display_value / self.max_value) * 100)
-            text = self.font.render(f"{percent}%", True, self.text_color)
+            text = render_text(self.font, f"{percent}%", True, self.text_color)
             text_rect = text.get_rect(center=self.rect.center)
             surface.blit(text, text_rect)
     
@@ -10,6 +10,7 @@ import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from game.constants import COLORS, FONT_SIZES, get_font
+from .text_cache import render_text, with_alpha
 
 
 class Text:
@@ -113,7 +114,7 @@ class Text:
         line_height = self.font.get_linesize()
         
         for line in self._lines:
-            text_surface = self.font.render(line, True, self.color)
+            text_surface = render_text(self.font, line, True, self.color)
             
             # Вирівнювання
             if self.align == 'center':
@@ -125,7 +126,7 @@ class Text:
             
             # Тінь
             if self.shadow:
-                shadow_surface = self.font.render(line, True, self.shadow_color)
+                shadow_surface = render_text(self.font, line, True, self.shadow_color)
                 surface.blit(shadow_surface, (x + 2, y + 2))
             
             surface.blit(text_surface, (x, y))
@@ -215,7 +216,7 @@ class AnimatedText(Text):
         line_height = self.font.get_linesize()
         
         for line in self._lines:
-            text_surface = self.font.render(line, True, self.color)
+            text_surface = render_text(self.font, line, True, self.color)
             
             # Масштабування
             if self.scale != 1.0:
@@ -223,9 +224,8 @@ class AnimatedText(Text):
                 new_height = int(text_surface.get_height() * self.scale)
                 text_surface = pygame.transform.scale(text_surface, (new_width, new_height))
             
-            # Прозорість
-            if self.alpha < 255:
-                text_surface.set_alpha(int(self.alpha))
+            # Прозорість (поверхня з кешу спільна - with_alpha робить копію)
+            text_surface = with_alpha(text_surface, self.alpha)
             
             # Вирівнювання
             if self.align == 'center':
@@ -237,8 +237,8 @@ class AnimatedText(Text):
             
             # Тінь
             if self.shadow and self.alpha > 0:
-                shadow_surface = self.font.render(line, True, self.shadow_color)
-                shadow_surface.set_alpha(int(self.alpha * 0.5))
+                shadow_surface = render_text(self.font, line, True, self.shadow_color)
+                shadow_surface = with_alpha(shadow_surface, self.alpha * 0.5)
                 surface.blit(shadow_surface, (x + 2, y + 2))
             
             surface.blit(text_surface, (x, y))
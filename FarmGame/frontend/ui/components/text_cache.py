@@ -0,0 +1,82 @@
+"""
+Кеш відрендерених текстових поверхонь
+Більшість тексту інтерфейсу однакова від кадру до кадру (заголовки,
+підписи кнопок, гроші і день у верхній панелі), тому font.render
+викликається лише для нових комбінацій (текст, шрифт, колір, згладжування).
+Кеш обмежений і витісняє найдавніше використані поверхні (LRU).
+Поверхні з кешу спільні - змінювати їх не можна (див. with_alpha).
+"""
+
+import pygame
+from collections import OrderedDict
+from typing import Tuple
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+from game.constants import TEXT_CACHE_SIZE
+
+
+class TextCache:
+    """
+    Обмежений LRU-кеш текстових поверхонь
+    """
+    
+    def __init__(self, max_size: int = TEXT_CACHE_SIZE):
+        self.max_size = max_size
+        self._surfaces: OrderedDict = OrderedDict()
+        
+        # Статистика
+        self.hits = 0
+        self.misses = 0
+    
+    def __len__(self) -> int:
+        return len(self._surfaces)
+    
+    @property
+    def hit_rate(self) -> float:
+        """Частка запитів, обслужених з кешу"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+    
+    def render(self, font: pygame.font.Font, text: str, antialias: bool,
+               color: Tuple[int, int, int]) -> pygame.Surface:
+        """Те саме, що font.render(text, antialias, color), але з кешу"""
+        key = (text, font, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+        
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+        return surface
+    
+    def clear(self):
+        """Очистити кеш (статистика зберігається)"""
+        self._surfaces.clear()
+
+
+TEXT_CACHE = TextCache()
+
+
+def render_text(font: pygame.font.Font, text: str, antialias: bool,
+                color: Tuple[int, int, int]) -> pygame.Surface:
+    """Відрендерити текст через спільний кеш"""
+    return TEXT_CACHE.render(font, text, antialias, color)
+
+
+def with_alpha(surface: pygame.Surface, alpha: float) -> pygame.Surface:
+    """
+    Поверхня з прозорістю alpha
+    Спільну поверхню з кешу не змінюємо - для alpha < 255 робиться копія
+    """
+    if alpha >= 255:
+        return surface
+    surface = surface.copy()
+    surface.set_alpha(int(alpha))
+    return surface
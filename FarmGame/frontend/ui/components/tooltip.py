@@ -9,6 +9,7 @@ import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from game.constants import COLORS, FONT_SIZES, get_font
+from .text_cache import render_text, with_alpha
 
 
 class Tooltip:
@@ -79,7 +80,7 @@ class Tooltip:
         
         # Рендер тексту
         lines = self.text.split('\n')
-        text_surfaces = [self.font.render(line, True, self.color) for line in lines]
+        text_surfaces = [render_text(self.font, line, True, self.color) for line in lines]
         
         # Розміри
         max_width = max(surf.get_width() for surf in text_surfaces)
@@ -114,7 +115,7 @@ class Tooltip:
         # Текст
         text_y = self.padding
         for text_surf in text_surfaces:
-            text_surf.set_alpha(int(self.alpha))
+            text_surf = with_alpha(text_surf, self.alpha)
             text_x = (width - text_surf.get_width()) // 2
             tooltip_surface.blit(text_surf, (text_x, text_y))
             text_y += text_surf.get_height()
@@ -18,6 +18,7 @@ from ..components.panel import Panel
 from ..components.progress_bar import HealthBar, HungerBar, HappinessBar
 from ..components.text import Text
 from ..components.notification import NotificationManager
+from ..components.text_cache import render_text
 
 
 class AnimalDetailsScreen:
@@ -45,7 +46,7 @@ class AnimalDetailsScreen:
         """Отримати поточну тварину"""
         if self.animal_id is None:
             return None
-        return next((a for a in self.game_state.animals if a.id == self.animal_id), None)
+        return self.game_state.get_animal(self.animal_id)
     
     def _create_ui(self):
         """Створення UI"""
@@ -219,8 +220,7 @@ class AnimalDetailsScreen:
         self.notification_manager.update(dt)
         
         # Синхронізація сповіщень
-        while self.game_state.notifications:
-            notif = self.game_state.notifications.pop(0)
+        for notif in self.game_state.drain_notifications():
             self.notification_manager.add_info(notif['title'], notif['message'])
     
     def draw(self, surface: pygame.Surface):
@@ -238,7 +238,7 @@ class AnimalDetailsScreen:
         
         if not self.animal:
             font = get_font(FONT_SIZES["large"])
-            text = font.render("Тварину не знайдено", True, COLORS["text_secondary"])
+            text = render_text(font, "Тварину не знайдено", True, COLORS["text_secondary"])
             text_rect = text.get_rect(center=(content_rect.centerx, content_rect.centery))
             surface.blit(text, text_rect)
             return
@@ -249,23 +249,23 @@ class AnimalDetailsScreen:
         # Emoji тварини (великий)
         emoji_font = get_emoji_font(72)
         emoji = animal_info.get('emoji', '🐾')
-        emoji_surface = emoji_font.render(emoji, True, COLORS["text"])
+        emoji_surface = render_text(emoji_font, emoji, True, COLORS["text"])
         surface.blit(emoji_surface, (content_rect.x + 30, content_rect.y + 60))
         
         # Ім'я та тип
         title_font = get_font(FONT_SIZES["huge"], bold=True)
-        name_surface = title_font.render(animal.name, True, COLORS["text"])
+        name_surface = render_text(title_font, animal.name, True, COLORS["text"])
         surface.blit(name_surface, (content_rect.x + 150, content_rect.y + 60))
         
         type_font = get_font(FONT_SIZES["large"])
-        type_surface = type_font.render(animal_info.get('name', animal.animal_type), True, COLORS["text_secondary"])
+        type_surface = render_text(type_font, animal_info.get('name', animal.animal_type), True, COLORS["text_secondary"])
         surface.blit(type_surface, (content_rect.x + 150, content_rect.y + 110))
         
         # Статус
         status_text = "🟢 Живий" if animal.is_alive else "🔴 Мертвий"
         status_color = COLORS["success"] if animal.is_alive else COLORS["danger"]
         status_font = get_font(FONT_SIZES["normal"], bold=True)
-        status_surface = status_font.render(status_text, True, status_color)
+        status_surface = render_text(status_font, status_text, True, status_color)
         surface.blit(status_surface, (content_rect.x + 150, content_rect.y + 145))
         
         # Прогрес бари
@@ -275,18 +275,18 @@ class AnimalDetailsScreen:
         label_font = get_font(FONT_SIZES["normal"])
         
         # Здоров'я
-        health_label = label_font.render("❤️ Здоров'я:", True, COLORS["text"])
+        health_label = render_text(label_font, "❤️ Здоров'я:", True, COLORS["text"])
         surface.blit(health_label, (content_rect.x + 30, bar_y))
         self.health_bar.draw(surface)
         
         # Голод
         emoji_font_normal = get_font(FONT_SIZES["normal"])
-        hunger_label = emoji_font_normal.render("🍽️ Ситість:", True, COLORS["text"])
+        hunger_label = render_text(emoji_font_normal, "🍽️ Ситість:", True, COLORS["text"])
         surface.blit(hunger_label, (content_rect.x + 30, bar_y + 40))
         self.hunger_bar.draw(surface)
         
         # Щастя
-        happiness_label = label_font.render("😊 Щастя:", True, COLORS["text"])
+        happiness_label = render_text(label_font, "😊 Щастя:", True, COLORS["text"])
         surface.blit(happiness_label, (content_rect.x + 30, bar_y + 80))
         self.happiness_bar.draw(surface)
         
@@ -304,7 +304,7 @@ class AnimalDetailsScreen:
         ]
         
         for i, stat in enumerate(stats):
-            stat_surface = emoji_font_small.render(stat, True, COLORS["text"])
+            stat_surface = render_text(emoji_font_small, stat, True, COLORS["text"])
             x = content_rect.x + 30 + (i % 2) * 300
             y = stats_y + (i // 2) * 25
             surface.blit(stat_surface, (x, y))
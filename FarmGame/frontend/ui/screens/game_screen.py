@@ -4,6 +4,7 @@
 
 import pygame
 import math
+from concurrent.futures import Future
 from typing import List, Optional
 import sys
 import os
@@ -20,6 +21,8 @@ from ..components.progress_bar import ProgressBar, EnergyBar
 from ..components.text import Text
 from ..components.animal_card import AnimalCard
 from ..components.notification import NotificationManager
+from ..components.text_cache import render_text
+from ..components.dirty_regions import DirtyRegions
 
 
 class GameScreen:
@@ -44,6 +47,16 @@ class GameScreen:
         # Анімаційний час
         self.time = 0.0
         
+        # Попередньо відрендерений фон (перебудовується лише зі зміною сезону)
+        self._background: Optional[pygame.Surface] = None
+        self._background_season: Optional[str] = None
+        
+        # Ключі відмальовки областей для режиму брудних прямокутників
+        self.dirty_regions = DirtyRegions()
+        
+        # Збереження, що пишеться у фоновому потоці
+        self._save_future: Optional[Future] = None
+        
         self._create_ui()
     
     def _create_ui(self):
@@ -163,33 +176,47 @@ class GameScreen:
     
     def _refresh_animal_cards(self):
         """Оновити список карток тварин"""
+        # Картки на тих самих місцях зберігаються разом з готовими поверхнями
+        old_cards = {(card.animal.id, card.rect.y): card for card in self.animal_cards}
         self.animal_cards.clear()
         
         content_rect = self.animals_panel.get_content_rect()
         card_width = content_rect.width - 20
         card_height = 180  # Збільшено з 150 для кращого відображення
         card_spacing = 10
+        row_height = card_height + card_spacing
         
-        for i, animal in enumerate(self.game_state.animals):
+        # Картки лише для видимих рядків - у великому стаді решта тварин
+        # не торкається (у сховищі стада їх об'єкти навіть не створюються)
+        animals = self.game_state.animals
+        first = max(0, int(self.animal_scroll_offset) // row_height)
+        last = min(len(animals), (int(self.animal_scroll_offset) + content_rect.height) // row_height + 1)
+        
+        for i in range(first, last):
+            animal = animals[i]
             if not animal.is_alive:
                 continue
             
-            y = content_rect.y + i * (card_height + card_spacing) - self.animal_scroll_offset
+            y = content_rect.y + i * row_height - self.animal_scroll_offset
             
-            card = AnimalCard(
-                content_rect.x + 5,
-                y,
-                card_width,
-                card_height,
-                animal,
-                on_click=self._on_animal_click,
-                on_feed=self._on_feed_animal,
-                on_collect=self._on_collect_animal
-            )
+            card = old_cards.get((animal.id, y))
+            if card is not None:
+                card.set_animal(animal)
+            else:
+                card = AnimalCard(
+                    content_rect.x + 5,
+                    y,
+                    card_width,
+                    card_height,
+                    animal,
+                    on_click=self._on_animal_click,
+                    on_feed=self._on_feed_animal,
+                    on_collect=self._on_collect_animal
+                )
             self.animal_cards.append(card)
         
-        # Обчислюємо максимальний скрол
-        total_height = len(self.animal_cards) * (card_height + card_spacing)
+        # Обчислюємо максимальний скрол (рядки розставлені за індексом у списку тварин)
+        total_height = len(animals) * row_height
         self.max_scroll = max(0, total_height - content_rect.height + 50)
     
     # ===== Обробники подій =====
@@ -204,14 +231,32 @@ class GameScreen:
         self.game_engine.change_screen("settings")
     
     def _on_save(self):
-        if self.game_state.save_game():
+        if self._save_future is not None and not self._save_future.done():
+            self.notification_manager.add_info("Збереження", "Гра вже зберігається...")
+            return
+        self._save_future = self.game_state.save_game_async()
+    
+    def _check_save_future(self):
+        """Показати результат фонового збереження, коли воно завершиться"""
+        if self._save_future is None or not self._save_future.done():
+            return
+        
+        error = self._save_future.exception()
+        self._save_future = None
+        if error is None:
             self.notification_manager.add_success("Збережено", "Гру успішно збережено!")
         else:
-            self.notification_manager.add_error("Помилка", "Не вдалося зберегти гру")
+            self.notification_manager.add_error("Помилка", f"Не вдалося зберегти гру: {error}")
     
     def _on_menu(self):
-        # Автозбереження
-        self.game_state.save_game()
+        # Автозбереження перед виходом: у меню немає сповіщень, тож чекаємо
+        # на запис тут і при помилці лишаємось у грі, щоб її показати
+        self._save_future = self.game_state.save_game_async()
+        error = self._save_future.exception()
+        self._save_future = None
+        if error is not None:
+            self.notification_manager.add_error("Помилка", f"Не вдалося зберегти гру: {error}")
+            return
         self.game_engine.change_screen("main_menu")
     
     def _on_feed_all(self):
@@ -236,15 +281,7 @@ class GameScreen:
             self.notification_manager.add_info("Продаж", "Немає продукції для продажу")
     
     def _on_heal_all(self):
-        healed = 0
-        total_cost = 0
-        
-        for animal in self.game_state.animals:
-            if animal.is_alive and animal.health < 50:
-                cost = self.game_state.heal_animal(animal.id)
-                if cost > 0:
-                    healed += 1
-                    total_cost += cost
+        healed, total_cost = self.game_state.heal_animals(predicate=lambda a: a.health < 50)
         
         if healed > 0:
             self.notification_manager.add_success("Лікування", f"Вилікувано {healed} тварин за {total_cost:.0f} грн")
@@ -260,7 +297,7 @@ class GameScreen:
         # Автовибір корму
         for feed_type in self.game_state.feeds.keys():
             if self.game_state.feed_animal(animal_id, feed_type):
-                animal = next((a for a in self.game_state.animals if a.id == animal_id), None)
+                animal = self.game_state.get_animal(animal_id)
                 if animal:
                     self.notification_manager.add_success("Годування", f"{animal.name} погодовано!")
                 return
@@ -270,7 +307,7 @@ class GameScreen:
     def _on_collect_animal(self, animal_id: int):
         product = self.game_state.collect_product(animal_id)
         if product:
-            animal = next((a for a in self.game_state.animals if a.id == animal_id), None)
+            animal = self.game_state.get_animal(animal_id)
             if animal:
                 self.notification_manager.add_success("Збір", f"Зібрано продукцію від {animal.name}!")
         else:
@@ -319,9 +356,9 @@ class GameScreen:
         self.notification_manager.update(dt)
         
         # Синхронізуємо сповіщення з game_state
-        while self.game_state.notifications:
-            notif = self.game_state.notifications.pop(0)
+        for notif in self.game_state.drain_notifications():
             self.notification_manager.add_info(notif['title'], notif['message'])
+        self._check_save_future()
         
         # Оновлення енергії
         self.energy_bar.set_value(self.game_state.farmer.energy)
@@ -342,7 +379,7 @@ class GameScreen:
         # Оновлення карток
         for card in self.animal_cards:
             # Синхронізуємо дані
-            animal = next((a for a in self.game_state.animals if a.id == card.animal.id), None)
+            animal = self.game_state.get_animal(card.animal.id)
             if animal:
                 card.set_animal(animal)
             card.update(dt)
@@ -390,23 +427,75 @@ class GameScreen:
         # Сповіщення
         self.notification_manager.draw(surface)
     
+    def get_dirty_rects(self) -> List[pygame.Rect]:
+        """
+        Області, що змінились з минулого кадру (для GameEngine)
+        На незмінній фермі більшість кадрів не має жодної
+        """
+        game_state = self.game_state
+        farmer = game_state.farmer
+        nav_buttons = (self.btn_shop, self.btn_inventory, self.btn_settings, self.btn_save, self.btn_menu)
+        action_buttons = (self.btn_feed_all, self.btn_collect_all, self.btn_sell_products, self.btn_heal_all)
+        
+        top_key = (
+            f"{farmer.money:.0f}", game_state.current_day, game_state.current_hour,
+            game_state.current_weather, game_state.get_living_animals_count(),
+            game_state.get_total_capacity(), farmer.name, farmer.level,
+            tuple(b.render_key() for b in nav_buttons)
+        )
+        actions_key = (
+            tuple(b.render_key() for b in action_buttons), self.energy_bar.render_key()
+        )
+        animals_key = (
+            self.animal_scroll_offset, self.max_scroll,
+            tuple(card.render_key() for card in self.animal_cards)
+        )
+        
+        animal = self.selected_animal
+        info_key = None
+        if animal:
+            info_key = (
+                animal.id, animal.name, animal.animal_type, animal.age,
+                f"{animal.health:.0f}", f"{animal.hunger:.0f}", f"{animal.happiness:.0f}",
+                animal.days_on_farm, animal.total_fed, animal.total_produced
+            )
+        
+        return self.dirty_regions.collect((
+            # Зміна сезону перемальовує весь фон
+            ("background", pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT), game_state.current_season),
+            ("top", self.top_panel.rect, top_key),
+            ("actions", self.actions_panel.rect, actions_key),
+            ("animals", self.animals_panel.rect, animals_key),
+            ("info", self.info_panel.rect, info_key),
+            ("notifications", self.notification_manager.get_area(), self.notification_manager.render_key()),
+        ))
+    
     def _draw_background(self, surface: pygame.Surface):
         """Відмальовка фону"""
+        season = self.game_state.current_season
+        if self._background is None or self._background_season != season:
+            self._background = self._render_background(season)
+            self._background_season = season
+        surface.blit(self._background, (0, 0))
+    
+    def _render_background(self, season: str) -> pygame.Surface:
+        """Фон із сезонним градієнтом (рендериться один раз на сезон)"""
+        background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        
         # Основний колір
-        surface.fill(COLORS["background"])
+        background.fill(COLORS["background"])
         
         # Декоративні елементи
-        season = self.game_state.current_season
         season_color = SEASONS[season]["color"]
         
         # Градієнт знизу
         gradient_rect = pygame.Rect(0, SCREEN_HEIGHT - 200, SCREEN_WIDTH, 200)
+        line_surface = pygame.Surface((SCREEN_WIDTH, 1), pygame.SRCALPHA)
         for y in range(gradient_rect.height):
             alpha = int(50 * (y / gradient_rect.height))
-            color = (*season_color, alpha)
-            line_surface = pygame.Surface((SCREEN_WIDTH, 1), pygame.SRCALPHA)
-            line_surface.fill(color)
-            surface.blit(line_surface, (0, SCREEN_HEIGHT - 200 + y))
+            line_surface.fill((*season_color, alpha))
+            background.blit(line_surface, (0, SCREEN_HEIGHT - 200 + y))
+        return background
     
     def _draw_top_bar(self, surface: pygame.Surface):
         """Відмальовка верхньої панелі"""
@@ -417,39 +506,39 @@ class GameScreen:
         y = 15
         
         # Гроші
-        money_text = font.render(f"{self.game_state.farmer.money:.0f} грн", True, COLORS["success"])
+        money_text = render_text(font, f"{self.game_state.farmer.money:.0f} грн", True, COLORS["success"])
         surface.blit(money_text, (x, y))
         
         # День
         x += 150
-        day_text = font.render(f"День {self.game_state.current_day}", True, COLORS["text"])
+        day_text = render_text(font, f"День {self.game_state.current_day}", True, COLORS["text"])
         surface.blit(day_text, (x, y))
         
         # Час
         x += 100
         hour = self.game_state.current_hour
-        time_text = font.render(f"{hour:02d}:00", True, COLORS["text"])
+        time_text = render_text(font, f"{hour:02d}:00", True, COLORS["text"])
         surface.blit(time_text, (x, y))
         
         # Сезон
         x += 80
         season = self.game_state.current_season
         season_info = SEASONS[season]
-        season_text = font.render(f"{season_info['name']}", True, season_info["color"])
+        season_text = render_text(font, f"{season_info['name']}", True, season_info["color"])
         surface.blit(season_text, (x, y))
         
         # Погода
         x += 100
         weather = self.game_state.current_weather
         weather_info = WEATHER_TYPES[weather]
-        weather_text = font.render(f"{weather_info['name']}", True, COLORS["text"])
+        weather_text = render_text(font, f"{weather_info['name']}", True, COLORS["text"])
         surface.blit(weather_text, (x, y))
         
         # Кількість тварин
         x += 100
         living = self.game_state.get_living_animals_count()
         capacity = self.game_state.get_total_capacity()
-        animals_text = font.render(f"{living}/{capacity}", True, COLORS["text"])
+        animals_text = render_text(font, f"{living}/{capacity}", True, COLORS["text"])
         surface.blit(animals_text, (x, y))
         
         # Друга лінія
@@ -457,22 +546,22 @@ class GameScreen:
         y += 30
         
         # Ім'я фермера
-        farmer_text = small_font.render(f"{self.game_state.farmer.name}", True, COLORS["text_secondary"])
+        farmer_text = render_text(small_font, f"{self.game_state.farmer.name}", True, COLORS["text_secondary"])
         surface.blit(farmer_text, (x, y))
         
         # Рівень
         x += 150
-        level_text = small_font.render(f"Рівень {self.game_state.farmer.level}", True, COLORS["text_secondary"])
+        level_text = render_text(small_font, f"Рівень {self.game_state.farmer.level}", True, COLORS["text_secondary"])
         surface.blit(level_text, (x, y))
     
     def _draw_animal_cards(self, surface: pygame.Surface):
         """Відмальовка карток тварин з відсіканням"""
         content_rect = self.animals_panel.get_content_rect()
         
-        # Створюємо область відсікання
+        # Створюємо область відсікання (в межах уже встановленої - брудні прямокутники)
         clip_rect = pygame.Rect(content_rect.x, content_rect.y, content_rect.width, content_rect.height)
         old_clip = surface.get_clip()
-        surface.set_clip(clip_rect)
+        surface.set_clip(clip_rect.clip(old_clip))
         
         for card in self.animal_cards:
             # Малюємо тільки видимі картки
@@ -496,7 +585,7 @@ class GameScreen:
         font = get_font(FONT_SIZES["small"])
         
         if not self.selected_animal:
-            text = font.render("Виберіть тварину", True, COLORS["text_secondary"])
+            text = render_text(font, "Виберіть тварину", True, COLORS["text_secondary"])
             text_rect = text.get_rect(center=(content_rect.centerx, content_rect.centery))
             surface.blit(text, text_rect)
             return
@@ -510,11 +599,11 @@ class GameScreen:
         
         # Emoji та ім'я
         emoji_font = get_emoji_font(32)
-        emoji_surface = emoji_font.render(animal_info.get('emoji', '🐾'), True, COLORS["text"])
+        emoji_surface = render_text(emoji_font, animal_info.get('emoji', '🐾'), True, COLORS["text"])
         surface.blit(emoji_surface, (x, y))
         
         name_font = get_font(FONT_SIZES["normal"], bold=True)
-        name_surface = name_font.render(animal.name, True, COLORS["text"])
+        name_surface = render_text(name_font, animal.name, True, COLORS["text"])
         surface.blit(name_surface, (x + 45, y + 5))
         
         y += 50
@@ -532,6 +621,6 @@ class GameScreen:
         ]
         
         for line in info_lines:
-            text = font.render(line, True, COLORS["text"])
+            text = render_text(font, line, True, COLORS["text"])
             surface.blit(text, (x, y))
             y += line_height
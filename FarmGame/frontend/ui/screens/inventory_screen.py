@@ -18,6 +18,7 @@ from ..components.panel import Panel
 from ..components.text import Text
 from ..components.progress_bar import ProgressBar
 from ..components.notification import NotificationManager
+from ..components.text_cache import render_text
 
 
 class InventoryScreen:
@@ -175,8 +176,7 @@ class InventoryScreen:
         self.notification_manager.update(dt)
         
         # Синхронізація сповіщень
-        while self.game_state.notifications:
-            notif = self.game_state.notifications.pop(0)
+        for notif in self.game_state.drain_notifications():
             self.notification_manager.add_info(notif['title'], notif['message'])
     
     def draw(self, surface: pygame.Surface):
@@ -191,7 +191,7 @@ class InventoryScreen:
         # Заголовок
         title_font = get_font(FONT_SIZES["huge"], bold=True)
         emoji_font_huge = get_font(FONT_SIZES["huge"])
-        title = emoji_font_huge.render("Інвентар", True, COLORS["text"])
+        title = render_text(emoji_font_huge, "Інвентар", True, COLORS["text"])
         surface.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 15))
         
         # Вкладки
@@ -220,7 +220,7 @@ class InventoryScreen:
         emoji_font = get_emoji_font(28)
         
         if not self.game_state.feeds:
-            hint = font.render("Немає кормів. Купіть у магазині!", True, COLORS["text_secondary"])
+            hint = render_text(font, "Немає кормів. Купіть у магазині!", True, COLORS["text_secondary"])
             hint_rect = hint.get_rect(center=(content_rect.centerx, content_rect.centery))
             surface.blit(hint, hint_rect)
             return
@@ -251,20 +251,21 @@ class InventoryScreen:
             
             # Emoji
             emoji = feed_info.get('emoji', '📦')
-            emoji_surface = emoji_font.render(emoji, True, COLORS["text"])
+            emoji_surface = render_text(emoji_font, emoji, True, COLORS["text"])
             surface.blit(emoji_surface, (card_rect.x + 15, card_rect.y + 15))
             
             # Назва
             name = feed_info.get('name', feed_type)
-            name_surface = font.render(name, True, COLORS["text"])
+            name_surface = render_text(font, name, True, COLORS["text"])
             surface.blit(name_surface, (card_rect.x + 60, card_rect.y + 15))
             
             # Кількість
-            amount_surface = font.render(f"{feed_data.amount:.1f} кг", True, COLORS["success"])
+            amount_surface = render_text(font, f"{feed_data.amount:.1f} кг", True, COLORS["success"])
             surface.blit(amount_surface, (card_rect.x + 60, card_rect.y + 45))
             
             # Якість та термін
-            quality_surface = small_font.render(
+            quality_surface = render_text(
+                small_font,
                 f"Якість: {feed_data.quality:.0f}% | Термін: {feed_data.days_remaining} дн.",
                 True, COLORS["text_secondary"]
             )
@@ -287,7 +288,7 @@ class InventoryScreen:
         small_font = get_font(FONT_SIZES["small"])
         
         if not self.game_state.products:
-            hint = font.render("Немає продукції. Зберіть від тварин!", True, COLORS["text_secondary"])
+            hint = render_text(font, "Немає продукції. Зберіть від тварин!", True, COLORS["text_secondary"])
             hint_rect = hint.get_rect(center=(content_rect.centerx, content_rect.centery))
             surface.blit(hint, hint_rect)
             return
@@ -313,11 +314,11 @@ class InventoryScreen:
             # Назва продукту
             name = product_type.replace('_product', '').title()
             emoji_font_normal = get_font(FONT_SIZES["normal"])
-            name_surface = emoji_font_normal.render(f"📦 {name}", True, COLORS["text"])
+            name_surface = render_text(emoji_font_normal, f"📦 {name}", True, COLORS["text"])
             surface.blit(name_surface, (card_rect.x + 15, card_rect.y + 15))
             
             # Кількість
-            amount_surface = font.render(f"{product_data.amount:.1f} од.", True, COLORS["success"])
+            amount_surface = render_text(font, f"{product_data.amount:.1f} од.", True, COLORS["success"])
             surface.blit(amount_surface, (card_rect.x + 200, card_rect.y + 15))
             
             # Якість
@@ -336,11 +337,11 @@ class InventoryScreen:
             quality_color = quality_colors.get(product_data.quality, COLORS["text"])
             quality_name = quality_names.get(product_data.quality, product_data.quality)
             
-            quality_surface = small_font.render(f"Якість: {quality_name}", True, quality_color)
+            quality_surface = render_text(small_font, f"Якість: {quality_name}", True, quality_color)
             surface.blit(quality_surface, (card_rect.x + 15, card_rect.y + 50))
             
             # Термін придатності
-            days_surface = small_font.render(f"Термін: {product_data.days_remaining} дн.", True, COLORS["text_secondary"])
+            days_surface = render_text(small_font, f"Термін: {product_data.days_remaining} дн.", True, COLORS["text_secondary"])
             surface.blit(days_surface, (card_rect.x + 200, card_rect.y + 50))
         
         surface.set_clip(old_clip)
@@ -354,7 +355,7 @@ class InventoryScreen:
         )
         pygame.draw.rect(surface, COLORS["success"], sell_btn_rect, border_radius=10)
         emoji_font_normal = get_font(FONT_SIZES["normal"])
-        sell_text = emoji_font_normal.render("💰 Продати все", True, COLORS["white"])
+        sell_text = render_text(emoji_font_normal, "💰 Продати все", True, COLORS["white"])
         sell_text_rect = sell_text.get_rect(center=sell_btn_rect.center)
         surface.blit(sell_text, sell_text_rect)
     
@@ -388,25 +389,25 @@ class InventoryScreen:
             
             # Emoji
             emoji = building_info.get('emoji', '🏠')
-            emoji_surface = emoji_font.render(emoji, True, COLORS["text"])
+            emoji_surface = render_text(emoji_font, emoji, True, COLORS["text"])
             surface.blit(emoji_surface, (card_rect.x + 15, card_rect.y + 15))
             
             # Назва
-            name_surface = font.render(building.name, True, COLORS["text"])
+            name_surface = render_text(font, building.name, True, COLORS["text"])
             surface.blit(name_surface, (card_rect.x + 65, card_rect.y + 15))
             
             # Рівень
             emoji_font_small = get_font(FONT_SIZES["small"])
-            level_surface = emoji_font_small.render(f"⭐ Рівень {building.level}", True, COLORS["warning"])
+            level_surface = render_text(emoji_font_small, f"⭐ Рівень {building.level}", True, COLORS["warning"])
             surface.blit(level_surface, (card_rect.x + 65, card_rect.y + 45))
             
             # Місткість
-            capacity_surface = small_font.render(f"📊 Місткість: {building.capacity}", True, COLORS["text_secondary"])
+            capacity_surface = render_text(small_font, f"📊 Місткість: {building.capacity}", True, COLORS["text_secondary"])
             surface.blit(capacity_surface, (card_rect.x + 65, card_rect.y + 70))
             
             # Опис
             description = building_info.get('description', '')
-            desc_surface = small_font.render(description, True, COLORS["text_secondary"])
+            desc_surface = render_text(small_font, description, True, COLORS["text_secondary"])
             surface.blit(desc_surface, (card_rect.x + 200, card_rect.y + 70))
             
             # Кнопка апгрейду
@@ -421,7 +422,7 @@ class InventoryScreen:
             
             pygame.draw.rect(surface, btn_color, upgrade_rect, border_radius=8)
             
-            upgrade_text = small_font.render(f"⬆️ {upgrade_cost} грн", True, COLORS["white"])
+            upgrade_text = render_text(small_font, f"⬆️ {upgrade_cost} грн", True, COLORS["white"])
             upgrade_text_rect = upgrade_text.get_rect(center=upgrade_rect.center)
             surface.blit(upgrade_text, upgrade_text_rect)
         
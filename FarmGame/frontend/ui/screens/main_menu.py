@@ -11,13 +11,14 @@ import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from game.constants import (
-    SCREEN_WIDTH, SCREEN_HEIGHT, COLORS, FONT_SIZES, 
+    SCREEN_WIDTH, SCREEN_HEIGHT, COLORS, FONT_SIZES, SEASONS,
     GAME_TITLE, GAME_SUBTITLE, VERSION, get_font, get_emoji_font
 )
 from game.game_state import GameState
 from ..components.button import Button
 from ..components.text import Text, AnimatedText
 from ..components.panel import Panel
+from ..components.text_cache import render_text
 
 
 class MainMenu:
@@ -46,6 +47,9 @@ class MainMenu:
         self.decorative_animals = []
         self._init_decorative_animals()
         
+        # Градієнт неба не змінюється - рендериться один раз
+        self._background: Optional[pygame.Surface] = None
+        
         # UI елементи
         self._create_ui()
     
@@ -113,6 +117,7 @@ class MainMenu:
         self.buttons.append(self.btn_new_game)
         
         # Продовжити (якщо є збереження)
+        self.save_summary_text = None
         if self.game_state.has_save_file():
             self.btn_continue = Button(
                 center_x - button_width // 2,
@@ -126,6 +131,20 @@ class MainMenu:
             )
             self.buttons.append(self.btn_continue)
             offset = button_spacing
+            
+            # Короткі відомості про збереження (без завантаження всієї гри)
+            metadata = self.game_state.get_save_metadata()
+            if metadata:
+                self.save_summary_text = Text(
+                    center_x,
+                    start_y + button_spacing + button_height + 4,
+                    self._format_save_summary(metadata),
+                    color=COLORS["text"],
+                    font_size=FONT_SIZES["small"],
+                    shadow=True,
+                    align='center'
+                )
+                offset += 24
         else:
             self.btn_continue = None
             offset = 0
@@ -182,6 +201,28 @@ class MainMenu:
         )
         self.subtitle_text.fade_in(2.0)
     
+    @staticmethod
+    def _format_save_summary(metadata: dict) -> str:
+        """Рядок з відомостями про збереження для кнопки Продовжити"""
+        season = SEASONS.get(metadata["current_season"], {}).get("name", metadata["current_season"])
+        return (f"{metadata['farm_name']} • День {metadata['current_day']} • {season} • "
+                f"{metadata['money']:.0f} грн • Тварин: {metadata['herd_size']}")
+    
+    def on_enter(self):
+        """Повернення в меню - оновити відомості про збереження"""
+        has_save = self.game_state.has_save_file()
+        metadata = self.game_state.get_save_metadata() if has_save else None
+        
+        # Кнопка Продовжити чи рядок відомостей з'явились/зникли - змінюється розкладка
+        layout_changed = (has_save != (self.btn_continue is not None)
+                          or (metadata is None) != (self.save_summary_text is None))
+        if layout_changed:
+            self._create_ui()
+            return
+        
+        if metadata:
+            self.save_summary_text.set_text(self._format_save_summary(metadata))
+    
     def _on_new_game(self):
         """Обробник кнопки Нова гра"""
         self.game_engine.change_screen("new_game")
@@ -262,17 +303,27 @@ class MainMenu:
         # Кнопки
         for button in self.buttons:
             button.draw(surface)
+        if self.save_summary_text:
+            self.save_summary_text.draw(surface)
         
         # Версія
-        version_text = self.version_font.render(f"v{VERSION}", True, COLORS["text_secondary"])
+        version_text = render_text(self.version_font, f"v{VERSION}", True, COLORS["text_secondary"])
         surface.blit(version_text, (SCREEN_WIDTH - version_text.get_width() - 10, SCREEN_HEIGHT - 25))
         
         # Копірайт
-        copyright_text = self.version_font.render("© 2026 Курсова робота ООП", True, COLORS["text_secondary"])
+        copyright_text = render_text(self.version_font, "© 2026 Курсова робота ООП", True, COLORS["text_secondary"])
         surface.blit(copyright_text, (10, SCREEN_HEIGHT - 25))
     
     def _draw_gradient_background(self, surface: pygame.Surface):
         """Градієнтний фон"""
+        if self._background is None:
+            self._background = self._render_gradient_background()
+        surface.blit(self._background, (0, 0))
+    
+    def _render_gradient_background(self) -> pygame.Surface:
+        """Відрендерити градієнт неба в окрему поверхню"""
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        
         # Колір неба згори донизу
         top_color = (135, 206, 235)  # Блакитний
         mid_color = (200, 230, 255)  # Світло-блакитний
@@ -291,6 +342,7 @@ class MainMenu:
             mid_color,
             (0, SCREEN_HEIGHT // 2, SCREEN_WIDTH, SCREEN_HEIGHT // 2)
         )
+        return surface
     
     def _draw_clouds(self, surface: pygame.Surface):
         """Відмальовка хмар"""
@@ -355,7 +407,7 @@ class MainMenu:
             # Анімація підстрибування
             offset_y = math.sin(self.time * animal['speed'] + animal['offset']) * 5
             
-            emoji_surface = font.render(animal['emoji'], True, COLORS["text"])
+            emoji_surface = render_text(font, animal['emoji'], True, COLORS["text"])
             x = animal['x']
             y = animal['y'] + offset_y
             
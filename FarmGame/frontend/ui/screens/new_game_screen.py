@@ -3,6 +3,7 @@
 """
 
 import pygame
+from typing import Optional
 import sys
 import os
 
@@ -24,6 +25,9 @@ class NewGameScreen:
         self.game_engine = game_engine
         self.game_state = GameState()
         
+        # Фон із візерунком рендериться один раз
+        self._background: Optional[pygame.Surface] = None
+        
         self._create_ui()
     
     def _create_ui(self):
@@ -217,11 +221,10 @@ class NewGameScreen:
     
     def draw(self, surface: pygame.Surface):
         """Відмальовка"""
-        # Фон
-        surface.fill(COLORS["background"])
-        
-        # Декоративний візерунок
-        self._draw_background_pattern(surface)
+        # Фон з декоративним візерунком
+        if self._background is None:
+            self._background = self._render_background()
+        surface.blit(self._background, (0, 0))
         
         # Панель
         self.main_panel.draw(surface)
@@ -240,6 +243,13 @@ class NewGameScreen:
         self.btn_start.draw(surface)
         self.btn_back.draw(surface)
     
+    def _render_background(self) -> pygame.Surface:
+        """Фон з візерунком в окремій поверхні"""
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        surface.fill(COLORS["background"])
+        self._draw_background_pattern(surface)
+        return surface
+    
     def _draw_background_pattern(self, surface: pygame.Surface):
         """Декоративний візерунок на фоні"""
         # Повторюваний патерн
@@ -3,11 +3,12 @@
 """
 
 import pygame
+from typing import Optional
 import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-from game.constants import SCREEN_WIDTH, SCREEN_HEIGHT, COLORS, FONT_SIZES
+from game.constants import SCREEN_WIDTH, SCREEN_HEIGHT, COLORS, FONT_SIZES, OFFLINE_HOURS_OPTIONS
 from game.game_state import GameState
 from ..components.button import Button
 from ..components.panel import Panel
@@ -28,7 +29,12 @@ class SettingsScreen:
         self.game_speed = self.game_state.game_speed  # Читаємо з game_state
         self.fullscreen = False
         self.show_tutorials = True
-        self.auto_save = True
+        self.auto_save = self.game_state.auto_save
+        # Ліміт прогресу за час відсутності (0 - вимкнено)
+        self.offline_hours = self.game_state.offline_max_hours if self.game_state.offline_progress else 0
+        
+        # Фон із візерунком рендериться один раз
+        self._background: Optional[pygame.Surface] = None
         
         self._create_ui()
     
@@ -120,6 +126,16 @@ class SettingsScreen:
             color=COLORS["info"] if self.show_tutorials else COLORS["gray"]
         )
         
+        # Прогрес за час відсутності
+        y += 50
+        self.btn_offline = Button(
+            content_rect.x + 40, y,
+            panel_width - 100, 40,
+            self._offline_text(),
+            self._cycle_offline,
+            color=COLORS["success"] if self.offline_hours else COLORS["gray"]
+        )
+        
         # ===== Кнопки внизу =====
         y = content_rect.y + panel_height - 150
         
@@ -166,9 +182,28 @@ class SettingsScreen:
     
     def _toggle_autosave(self):
         self.auto_save = not self.auto_save
+        self.game_state.auto_save = self.auto_save
         self.btn_autosave.text = f"Автозбереження: {'Увімкнено' if self.auto_save else 'Вимкнено'}"
         self.btn_autosave.color = COLORS["success"] if self.auto_save else COLORS["gray"]
     
+    def _offline_text(self) -> str:
+        if self.offline_hours:
+            return f"Прогрес офлайн: до {self.offline_hours} год"
+        return "Прогрес офлайн: Вимкнено"
+    
+    def _set_offline_hours(self, hours: int):
+        self.offline_hours = hours
+        self.game_state.offline_progress = hours > 0
+        if hours:
+            self.game_state.offline_max_hours = hours
+        self.btn_offline.text = self._offline_text()
+        self.btn_offline.color = COLORS["success"] if hours else COLORS["gray"]
+    
+    def _cycle_offline(self):
+        options = list(OFFLINE_HOURS_OPTIONS)
+        index = options.index(self.offline_hours) if self.offline_hours in options else 0
+        self._set_offline_hours(options[(index + 1) % len(options)])
+    
     def _toggle_tutorials(self):
         self.show_tutorials = not self.show_tutorials
         self.btn_tutorials.text = f"Підказки: {'Увімкнено' if self.show_tutorials else 'Вимкнено'}"
@@ -191,6 +226,7 @@ class SettingsScreen:
         self._toggle_autosave()
         self._toggle_tutorials()
         self._toggle_tutorials()
+        self._set_offline_hours(0)
     
     def handle_event(self, event: pygame.event.Event):
         """Обробка подій"""
@@ -201,6 +237,7 @@ class SettingsScreen:
         # Перемикачі
         self.btn_autosave.handle_event(event)
         self.btn_tutorials.handle_event(event)
+        self.btn_offline.handle_event(event)
         
         # Кнопки дій
         self.btn_back.handle_event(event)
@@ -218,6 +255,7 @@ class SettingsScreen:
         
         self.btn_autosave.update(dt)
         self.btn_tutorials.update(dt)
+        self.btn_offline.update(dt)
         self.btn_back.update(dt)
         self.btn_reset.update(dt)
         
@@ -225,11 +263,10 @@ class SettingsScreen:
     
     def draw(self, surface: pygame.Surface):
         """Відмальовка"""
-        # Фон
-        surface.fill(COLORS["background"])
-        
-        # Декоративний візерунок
-        self._draw_background_pattern(surface)
+        # Фон з декоративним візерунком
+        if self._background is None:
+            self._background = self._render_background()
+        surface.blit(self._background, (0, 0))
         
         # Панель
         self.main_panel.draw(surface)
@@ -243,10 +280,18 @@ class SettingsScreen:
         self.options_label.draw(surface)
         self.btn_autosave.draw(surface)
         self.btn_tutorials.draw(surface)
+        self.btn_offline.draw(surface)
         
         self.btn_back.draw(surface)
         self.btn_reset.draw(surface)
     
+    def _render_background(self) -> pygame.Surface:
+        """Фон з візерунком в окремій поверхні"""
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        surface.fill(COLORS["background"])
+        self._draw_background_pattern(surface)
+        return surface
+    
     def _draw_background_pattern(self, surface: pygame.Surface):
         """Декоративний візерунок"""
         pattern_color = tuple(max(0, c - 10) for c in COLORS["background"])
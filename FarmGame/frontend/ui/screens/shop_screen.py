@@ -18,6 +18,7 @@ from ..components.panel import Panel
 from ..components.text import Text
 from ..components.input_field import InputField
 from ..components.notification import NotificationManager
+from ..components.text_cache import render_text
 
 
 class ShopScreen:
@@ -266,8 +267,7 @@ class ShopScreen:
         self.notification_manager.update(dt)
         
         # Синхронізація сповіщень
-        while self.game_state.notifications:
-            notif = self.game_state.notifications.pop(0)
+        for notif in self.game_state.drain_notifications():
             self.notification_manager.add_info(notif['title'], notif['message'])
     
     def draw(self, surface: pygame.Surface):
@@ -282,12 +282,13 @@ class ShopScreen:
         
         # Заголовок
         title_font = get_font(FONT_SIZES["huge"], bold=True)
-        title = title_font.render("Магазин", True, COLORS["text"])
+        title = render_text(title_font, "Магазин", True, COLORS["text"])
         surface.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 15))
         
         # Гроші
         money_font = get_font(FONT_SIZES["large"], bold=True)
-        money_text = money_font.render(
+        money_text = render_text(
+            money_font,
             f"{self.game_state.farmer.money:.0f} грн",
             True, COLORS["success"]
         )
@@ -354,28 +355,28 @@ class ShopScreen:
             
             # Emoji
             emoji = item_info.get('emoji', '📦')
-            emoji_surface = emoji_font.render(emoji, True, COLORS["text"])
+            emoji_surface = render_text(emoji_font, emoji, True, COLORS["text"])
             surface.blit(emoji_surface, (x + 10, y + 10))
             
             # Назва
             name = item_info.get('name', item_id)
-            name_surface = font.render(name, True, COLORS["text"])
+            name_surface = render_text(font, name, True, COLORS["text"])
             surface.blit(name_surface, (x + 50, y + 10))
             
             # Ціна
             price = item_info.get('price', 0)
             price_color = COLORS["success"] if self.game_state.farmer.money >= price else COLORS["danger"]
-            price_surface = small_font.render(f"{price} грн", True, price_color)
+            price_surface = render_text(small_font, f"{price} грн", True, price_color)
             surface.blit(price_surface, (x + 10, y + 40))
             
             # Додаткова інформація
             if self.current_tab == "animals":
                 product = item_info.get('product', '')
-                product_surface = small_font.render(f"{product}", True, COLORS["text_secondary"])
+                product_surface = render_text(small_font, f"{product}", True, COLORS["text_secondary"])
                 surface.blit(product_surface, (x + 10, y + 60))
             else:
                 nutrition = item_info.get('nutrition', 0)
-                nutrition_surface = small_font.render(f"+{nutrition}", True, COLORS["text_secondary"])
+                nutrition_surface = render_text(small_font, f"+{nutrition}", True, COLORS["text_secondary"])
                 surface.blit(nutrition_surface, (x + 10, y + 60))
             
             # Індикатор вибору
@@ -393,7 +394,7 @@ class ShopScreen:
         
         if not self.selected_item:
             # Підказка
-            hint = font.render("Виберіть товар", True, COLORS["text_secondary"])
+            hint = render_text(font, "Виберіть товар", True, COLORS["text_secondary"])
             hint_rect = hint.get_rect(center=(content_rect.centerx, content_rect.centery))
             surface.blit(hint, hint_rect)
             return
@@ -405,7 +406,7 @@ class ShopScreen:
         
         # Emoji
         emoji = item_info.get('emoji')
-        emoji_surface = emoji_font.render(emoji, True, COLORS["text"])
+        emoji_surface = render_text(emoji_font, emoji, True, COLORS["text"])
         emoji_rect = emoji_surface.get_rect(centerx=content_rect.centerx)
         surface.blit(emoji_surface, (emoji_rect.x, y))
         
@@ -414,7 +415,7 @@ class ShopScreen:
         # Назва
         name = item_info.get('name', self.selected_item)
         name_font = get_font(FONT_SIZES["large"], bold=True)
-        name_surface = name_font.render(name, True, COLORS["text"])
+        name_surface = render_text(name_font, name, True, COLORS["text"])
         name_rect = name_surface.get_rect(centerx=content_rect.centerx)
         surface.blit(name_surface, (name_rect.x, y))
         
@@ -424,7 +425,7 @@ class ShopScreen:
         price = item_info.get('price', 0)
         price_color = COLORS["success"] if self.game_state.farmer.money >= price else COLORS["danger"]
         emoji_font_normal = get_font(FONT_SIZES["normal"])
-        price_surface = emoji_font_normal.render(f"Ціна: {price} грн", True, price_color)
+        price_surface = render_text(emoji_font_normal, f"Ціна: {price} грн", True, price_color)
         price_rect = price_surface.get_rect(centerx=content_rect.centerx)
         surface.blit(price_surface, (price_rect.x, y))
         
@@ -435,10 +436,10 @@ class ShopScreen:
         if self.current_tab == "animals":
             product = item_info.get('product', '')
             product_emoji = item_info.get('product_emoji')
-            detail_surface = emoji_font_small.render(f"Продукція: {product}", True, COLORS["text_secondary"])
+            detail_surface = render_text(emoji_font_small, f"Продукція: {product}", True, COLORS["text_secondary"])
         else:
             nutrition = item_info.get('nutrition', 0)
-            detail_surface = emoji_font_small.render(f"Поживність: +{nutrition}", True, COLORS["text_secondary"])
+            detail_surface = render_text(emoji_font_small, f"Поживність: +{nutrition}", True, COLORS["text_secondary"])
         
         detail_rect = detail_surface.get_rect(centerx=content_rect.centerx)
         surface.blit(detail_surface, (detail_rect.x, y))